@@ -0,0 +1,331 @@
+"""A module containing the response compression middleware."""
+
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Compressing these would only waste CPU.
+INCOMPRESSIBLE_TYPES = ("image/", "video/", "audio/", "text/event-stream")
+
+
+class _BrotliCompressor:
+    """A class adapting the brotli compressor to `compress`/`flush`."""
+
+    def __init__(self, level: int) -> None:
+        """The initializer of the `brotli compressor`.
+
+        Args:
+            level (int): The brotli quality.
+        """
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        """The method compressing the next part of the body.
+
+        Args:
+            data (bytes): The part of the body.
+
+        Returns:
+            bytes: The compressed output produced so far.
+        """
+
+        return self._compressor.process(data)
+
+    def flush(self, mode: int = zlib.Z_FINISH) -> bytes:
+        """The method flushing or finishing the compressed stream.
+
+        Args:
+            mode (int): `zlib.Z_FINISH` to finish the stream, any other
+                mode only flushes the pending output.
+
+        Returns:
+            bytes: The pending compressed output.
+        """
+
+        if mode == zlib.Z_FINISH:
+            return self._compressor.finish()
+
+        return self._compressor.flush()
+
+
+@dataclass(frozen=True)
+class Codec:
+    """A class describing a supported content encoding."""
+    name: str
+    max_level: int
+    create: Callable[[int], Any]
+    # The flush mode emitting everything compressed so far mid-stream.
+    sync_flush: int
+
+
+def available_codecs() -> list[Codec]:
+    """Function listing the codecs in the order of server preference.
+
+    Brotli and zstd are offered only if their optional packages are
+    installed, gzip is always available.
+
+    Returns:
+        list[Codec]: The supported codecs, the preferred first.
+    """
+
+    codecs = []
+    if zstandard is not None:
+        codecs.append(Codec(
+            "zstd",
+            22,
+            lambda level: zstandard.ZstdCompressor(level=level).compressobj(),
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK,
+        ))
+    if brotli is not None:
+        codecs.append(Codec("br", 11, _BrotliCompressor, zlib.Z_SYNC_FLUSH))
+    codecs.append(Codec(
+        "gzip",
+        9,
+        lambda level: zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16),
+        zlib.Z_SYNC_FLUSH,
+    ))
+
+    return codecs
+
+
+def choose_codec(accept_encoding: str, codecs: Sequence[Codec]) -> Codec | None:
+    """Function picking the codec accepted by the client.
+
+    Args:
+        accept_encoding (str): The value of the `Accept-Encoding` header.
+        codecs (Sequence[Codec]): The supported codecs, the preferred first.
+
+    Returns:
+        Codec | None: The codec with the highest client weight, ties broken
+            by server preference, or None if none is acceptable.
+    """
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for codec in codecs:
+        weight = weights.get(codec.name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = codec, weight
+
+    return best
+
+
+class CompressionMiddleware:
+    """A class compressing response bodies with a negotiated encoding.
+
+    Bodies sent at once are compressed if they reach `minimum_size`,
+    streamed bodies are compressed chunk by chunk. Chunks of at least
+    `offload_size` bytes are compressed in the thread pool, so large
+    responses do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        level: int = 6,
+        offload_size: int = 65536,
+    ) -> None:
+        """The initializer of the `compression middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            minimum_size (int): The smallest body worth compressing.
+            level (int): The compression level, capped per encoding.
+            offload_size (int): The smallest chunk compressed in a thread.
+        """
+
+        self._app = app
+        self._minimum_size = minimum_size
+        self._level = level
+        self._offload_size = offload_size
+        self._codecs = available_codecs()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel of incoming messages.
+            send (Send): The channel of outgoing messages.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        codec = choose_codec(accept_encoding, self._codecs)
+        if codec is None:
+            await self._app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send,
+            codec,
+            min(self._level, codec.max_level),
+            self._minimum_size,
+            self._offload_size,
+        )
+        await self._app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """A class compressing the messages of one response."""
+
+    def __init__(
+        self,
+        send: Send,
+        codec: Codec,
+        level: int,
+        minimum_size: int,
+        offload_size: int,
+    ) -> None:
+        """The initializer of the `compression responder`.
+
+        Args:
+            send (Send): The channel of outgoing messages.
+            codec (Codec): The negotiated codec.
+            level (int): The compression level.
+            minimum_size (int): The smallest body worth compressing.
+            offload_size (int): The smallest chunk compressed in a thread.
+        """
+
+        self._send = send
+        self._codec = codec
+        self._level = level
+        self._minimum_size = minimum_size
+        self._offload_size = offload_size
+        self._start: Message | None = None
+        self._compressor: Any = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        """The method compressing and forwarding a response message.
+
+        Args:
+            message (Message): The outgoing ASGI message.
+        """
+
+        if message["type"] == "http.response.start":
+            self._start = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self._passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or content_type.startswith(INCOMPRESSIBLE_TYPES)
+            )
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            if not more_body and len(body) < self._minimum_size:
+                self._passthrough = True
+                await self._flush_start()
+                await self._send(message)
+                return
+
+            self._compressor = self._codec.create(self._level)
+            headers = MutableHeaders(raw=self._start["headers"])
+            headers["Content-Encoding"] = self._codec.name
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            if not more_body:
+                compressed = await self._compress(body, finish=True)
+                headers["Content-Length"] = str(len(compressed))
+                await self._flush_start()
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            await self._flush_start()
+
+        compressed = await self._compress(body, finish=not more_body)
+        await self._send({
+            "type": "http.response.body",
+            "body": compressed,
+            "more_body": more_body,
+        })
+
+    async def _flush_start(self) -> None:
+        """The method sending the buffered response start."""
+
+        if self._start is not None:
+            await self._send(self._start)
+            self._start = None
+
+    async def _compress(self, data: bytes, finish: bool) -> bytes:
+        """The method compressing the chunk, in a thread if it is large.
+
+        Args:
+            data (bytes): The chunk of the body.
+            finish (bool): Whether it is the last chunk.
+
+        Returns:
+            bytes: The compressed output.
+        """
+
+        if len(data) >= self._offload_size:
+            return await run_in_threadpool(self._compress_sync, data, finish)
+
+        return self._compress_sync(data, finish)
+
+    def _compress_sync(self, data: bytes, finish: bool) -> bytes:
+        """The method compressing the chunk on the calling thread.
+
+        Chunks before the last one are flushed, so the client can decode
+        every streamed chunk as soon as it arrives.
+
+        Args:
+            data (bytes): The chunk of the body.
+            finish (bool): Whether it is the last chunk.
+
+        Returns:
+            bytes: The compressed output.
+        """
+
+        output = self._compressor.compress(data)
+        if finish:
+            output += self._compressor.flush()
+        elif data:
+            output += self._compressor.flush(self._codec.sync_flush)
+
+        return output
@@ -0,0 +1,76 @@
+"""A module containing the request metrics middleware."""
+
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from animalshelterapi.api.utils.routing import route_template
+from animalshelterapi.utils.metrics import request_latency, request_queries
+from animalshelterapi.utils.timing import request_timings
+
+# The route label of the requests not matching any route.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """A class observing the latency and the statements of every request.
+
+    The requests are labelled with the route template rather than the
+    path, so the number of series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the `metrics middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel of incoming messages.
+            send (Send): The channel of outgoing messages.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_observed(message: Message) -> None:
+            """The function noting the status of the response.
+
+            Args:
+                message (Message): The outgoing ASGI message.
+            """
+
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        start = perf_counter()
+        with request_timings() as timings:
+            queries = timings.queries
+            try:
+                await self._app(scope, receive, send_observed)
+            finally:
+                route = (
+                    route_template(scope) if scope.get("route") is not None
+                    else UNMATCHED_ROUTE
+                )
+                request_latency.observe(
+                    (scope["method"], route, str(status)),
+                    perf_counter() - start,
+                )
+                request_queries.observe(
+                    (scope["method"], route),
+                    timings.queries - queries,
+                )
@@ -0,0 +1,85 @@
+"""A module containing the request timing middleware."""
+
+import json
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from animalshelterapi.api.utils.routing import route_template
+from animalshelterapi.utils.timing import RequestTimings, request_timings
+
+logger = logging.getLogger("animalshelterapi.timing")
+
+
+class ServerTimingMiddleware:
+    """A class reporting where the time of every request went.
+
+    The phases measured until the response starts are sent in the
+    `Server-Timing` header. Once the body is sent, a JSON log line with
+    the route, the status, the total time and all phases is written.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the `server timing middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling the ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel of incoming messages.
+            send (Send): The channel of outgoing messages.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_timed(message: Message) -> None:
+            """The function adding the timings to the response.
+
+            Args:
+                message (Message): The outgoing ASGI message.
+            """
+
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append("Server-Timing", timings.header())
+
+            await send(message)
+
+        with request_timings() as timings:
+            try:
+                await self._app(scope, receive, send_timed)
+            finally:
+                if logger.isEnabledFor(logging.INFO):
+                    _log(scope, status, timings)
+
+
+def _log(scope: Scope, status: int, timings: RequestTimings) -> None:
+    """Function writing the log line of the finished request.
+
+    Args:
+        scope (Scope): The connection scope.
+        status (int): The status of the response.
+        timings (RequestTimings): The timings of the request.
+    """
+
+    logger.info(json.dumps({
+        "method": scope["method"],
+        "route": route_template(scope),
+        "status": status,
+        "total_ms": round(timings.elapsed() * 1000, 3),
+        "phases_ms": timings.milliseconds(),
+    }))
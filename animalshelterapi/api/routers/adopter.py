@@ -1,26 +1,45 @@
 """A module containing adopter endpoints."""
 
-from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from animalshelterapi.api.utils.batch import Batch, build_batch, get_batch_ids
+from animalshelterapi.api.utils.bulk import BulkResult, build_bulk_result, parse_bulk
+from animalshelterapi.api.utils.conditional import conditional_get
+from animalshelterapi.api.utils.export import (
+    ExportFormat,
+    get_export_format,
+    stream_export,
+)
+from animalshelterapi.api.utils.pagination import (
+    Page,
+    PageQuery,
+    build_page,
+    get_page_query,
+)
+from animalshelterapi.api.utils.responses import Responder, get_responder
+from animalshelterapi.api.utils.routing import TimedRoute
 from animalshelterapi.container import Container
 from animalshelterapi.core.domain.adoption import Adopter, AdopterIn
 from animalshelterapi.infrastructure.services.iadopter import IAdopterService
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+not_modified = conditional_get("adopters")
 
 
 @router.post("/create", response_model=Adopter, status_code=201)
 @inject
 async def create_adopter(
     adopter: AdopterIn,
+    respond: Responder = Depends(get_responder),
     service: IAdopterService = Depends(Provide[Container.adopter_service]),
 ) -> dict:
     """An endpoint for adding new adopter.
 
     Args:
         adopter (AdopterIn): The adopter data.
+        respond (Responder): The injected result builder.
         service (IAdopterService): The injected service dependency.
 
     Returns:
@@ -29,79 +48,201 @@ async def create_adopter(
 
     new_adopter = await service.add_adopter(adopter)
 
-    return new_adopter.model_dump() if new_adopter else {}
+    return respond(new_adopter or {}, status_code=201)
 
 
-@router.get("/all", response_model=Iterable[Adopter], status_code=200)
+@router.post("/bulk", response_model=BulkResult, status_code=201)
+@inject
+async def create_adopters(
+    request: Request,
+    service: IAdopterService = Depends(Provide[Container.adopter_service]),
+) -> dict:
+    """An endpoint for adding many adopters at once.
+
+    The body is either a JSON array or an NDJSON stream of adopter data.
+    Invalid rows are reported and the valid ones are created together.
+
+    Args:
+        request (Request): The request with the adopter data rows.
+        service (IAdopterService): The injected service dependency.
+
+    Returns:
+        dict: The ids of the new adopters and the errors of rejected rows.
+    """
+
+    valid, errors = await parse_bulk(request, AdopterIn)
+    ids = await service.add_adopters([obj for _, obj in valid])
+
+    return build_bulk_result(valid, ids, errors)
+
+
+@router.get(
+    "/all",
+    response_model=Page[Adopter],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_all_adopters(
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAdopterService = Depends(Provide[Container.adopter_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting all adopters.
 
     Args:
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAdopterService): The injected service dependency.
 
     Returns:
-        Iterable: The adopter attributes collection.
+        dict: The page of the adopter attributes collection.
     """
 
-    adopters = await service.get_all_adopters()
+    adopters = await service.get_all_adopters(
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return adopters
+    return respond(build_page(adopters, page.limit))
 
 
-@router.get("/last_name/{last_name}", response_model=Iterable[Adopter], status_code=200)
+@router.get(
+    "/last_name/{last_name}",
+    response_model=Page[Adopter],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_adopter_by_last_name(
     last_name: str,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAdopterService = Depends(Provide[Container.adopter_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting adopters by last name.
 
     Args:
         last_name (int): The last name of the adopter.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAdopterService): The injected service dependency.
 
     Returns:
-        Iterable: The adopter attributes' collection
+        dict: The page of the adopter attributes' collection
     """
 
-    adopters = await service.get_adopter_by_last_name(last_name)
+    adopters = await service.get_adopter_by_last_name(
+        last_name,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return adopters
+    return respond(build_page(adopters, page.limit))
 
-@router.get("/phone_number/{phone_number}", response_model=Iterable[Adopter], status_code=200)
+@router.get(
+    "/phone_number/{phone_number}",
+    response_model=Page[Adopter],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_adopter_by_phone_number(
     phone_number: str,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAdopterService = Depends(Provide[Container.adopter_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting adopters by phone number.
 
     Args:
         phone_number (str): The phone number of the adopter.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
+        service (IAdopterService): The injected service dependency.
+
+    Returns:
+        dict: The page of the adopter attributes' collection
+    """
+
+    adopters = await service.get_adopter_by_phone_number(
+        phone_number,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
+
+    return respond(build_page(adopters, page.limit))
+
+
+@router.get(
+    "/batch",
+    response_model=Batch[Adopter],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
+@inject
+async def get_adopters_batch(
+    ids: list[int] = Depends(get_batch_ids),
+    respond: Responder = Depends(get_responder),
+    service: IAdopterService = Depends(Provide[Container.adopter_service]),
+) -> dict:
+    """An endpoint for getting many adopters by their ids at once.
+
+    Args:
+        ids (list[int]): The ids of the adopters.
+        respond (Responder): The injected result builder.
         service (IAdopterService): The injected service dependency.
 
     Returns:
-        Iterable: The adopter attributes' collection
+        dict: The adopters keyed by id and the ids not found.
     """
 
-    adopters = await service.get_adopter_by_phone_number(phone_number)
+    adopters = await service.get_adopters_by_ids(ids)
+
+    return respond(build_batch(adopters, ids))
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_adopters(
+    export_format: ExportFormat = Depends(get_export_format),
+    service: IAdopterService = Depends(Provide[Container.adopter_service]),
+) -> StreamingResponse:
+    """An endpoint for streaming all adopters as NDJSON, CSV, MessagePack or Arrow.
+
+    Args:
+        export_format (ExportFormat): The format of the file.
+        service (IAdopterService): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The adopter rows streamed as a file.
+    """
 
-    return adopters
+    return stream_export(
+        service.export_adopters(),
+        export_format,
+        "adopters",
+        Adopter,
+    )
 
 
-@router.get("/{adopter_id}", response_model=Adopter, status_code=200)
+@router.get(
+    "/{adopter_id}",
+    response_model=Adopter,
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_adopter_by_id(
     adopter_id: int,
+    respond: Responder = Depends(get_responder),
     service: IAdopterService = Depends(Provide[Container.adopter_service]),
 ) -> dict:
     """An endpoint for getting adopter details by id.
 
     Args:
         adopter_id (int): The id of the adopter.
+        respond (Responder): The injected result builder.
         service (IAdopterService): The injected service dependency.
 
     Raises:
@@ -112,7 +253,7 @@ async def get_adopter_by_id(
     """
 
     if adopter := await service.get_adopter_by_id(adopter_id):
-        return adopter.model_dump()
+        return respond(adopter)
 
     raise HTTPException(status_code=404, detail="Adopter not found")
 
@@ -122,6 +263,7 @@ async def get_adopter_by_id(
 async def update_adopter(
     adopter_id: int,
     updated_adopter: AdopterIn,
+    respond: Responder = Depends(get_responder),
     service: IAdopterService = Depends(Provide[Container.adopter_service]),
 ) -> dict:
     """An endpoint for updating adopter data.
@@ -129,6 +271,7 @@ async def update_adopter(
     Args:
         adopter_id (int): The id of the adopter.
         updated_adopter (AdopterIn): The updated adopter details.
+        respond (Responder): The injected result builder.
         service (IAdopterService): The injected service dependency.
 
     Raises:
@@ -138,13 +281,11 @@ async def update_adopter(
         dict: The updated adopter details.
     """
 
-    if await service.get_adopter_by_id(adopter_id=adopter_id):
-        new_updated_adopter = await service.update_adopter(
-            adopter_id=adopter_id,
-            data=updated_adopter,
-        )
-        return new_updated_adopter.model_dump() if new_updated_adopter \
-            else {}
+    if new_updated_adopter := await service.update_adopter(
+        adopter_id=adopter_id,
+        data=updated_adopter,
+    ):
+        return respond(new_updated_adopter, status_code=201)
 
     raise HTTPException(status_code=404, detail="Adopter not found")
 
@@ -168,8 +309,7 @@ async def delete_adopter(
         dict: Empty if operation finished.
     """
 
-    if await service.get_adopter_by_id(adopter_id=adopter_id):
-        await service.delete_adopter(adopter_id)
+    if await service.delete_adopter(adopter_id):
         return
 
     raise HTTPException(status_code=404, detail="Adopter not found")
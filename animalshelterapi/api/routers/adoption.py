@@ -1,28 +1,46 @@
 
 """A module containing continent endpoints."""
 
-from typing import Iterable
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
-
+from fastapi.responses import StreamingResponse
+
+from animalshelterapi.api.utils.batch import Batch, build_batch, get_batch_ids
+from animalshelterapi.api.utils.conditional import conditional_get
+from animalshelterapi.api.utils.export import (
+    ExportFormat,
+    get_export_format,
+    stream_export,
+)
+from animalshelterapi.api.utils.pagination import (
+    Page,
+    PageQuery,
+    build_page,
+    get_page_query,
+)
+from animalshelterapi.api.utils.responses import Responder, get_responder
+from animalshelterapi.api.utils.routing import TimedRoute
 from animalshelterapi.container import Container
 from animalshelterapi.core.domain.adoption import Adoption, AdoptionIn
 from animalshelterapi.infrastructure.dto.adoptiondto import AdoptionDTO
 from animalshelterapi.infrastructure.services.iadoption import IAdoptionService
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+not_modified = conditional_get("adoptions", "animals", "adopters")
 
 
 @router.post("/create", response_model=Adoption, status_code=201)
 @inject
 async def create_adoption(
     adoption: AdoptionIn,
+    respond: Responder = Depends(get_responder),
     service: IAdoptionService = Depends(Provide[Container.adoption_service]),
 ) -> dict:
     """An endpoint for adding new adoption.
 
     Args:
         adoption (AdoptionIn): The adoption data.
+        respond (Responder): The injected result builder.
         service (IAdoptionService): The injected service dependency.
 
     Returns:
@@ -31,92 +49,177 @@ async def create_adoption(
 
     new_adoption = await service.add_adoption(adoption)
 
-    return new_adoption.model_dump() if new_adoption else {}
+    return respond(new_adoption or {}, status_code=201)
 
 
-@router.get("/all", response_model=Iterable[AdoptionDTO], status_code=200)
+@router.get(
+    "/all",
+    response_model=Page[AdoptionDTO],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_all_adoptions(
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAdoptionService = Depends(Provide[Container.adoption_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting all adoptions.
 
     Args:
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAdoptionService): The injected service dependency.
 
     Returns:
-        Iterable: The adoption attributes collection.
+        dict: The page of the adoption attributes collection.
     """
 
-    adoptions = await service.get_all()
+    adoptions = await service.get_all(
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return adoptions
+    return respond(build_page(adoptions, page.limit))
 
 
 @router.get(
         "/animal/{animal_id}",
-        response_model=Iterable[Adoption],
+        response_model=Page[Adoption],
         status_code=200,
+        dependencies=[Depends(not_modified)],
 )
 @inject
 async def get_adoption_by_animal_id(
     animal_id: int,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAdoptionService = Depends(Provide[Container.adoption_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting adoption by animal id.
 
     Args:
         animal_id (int): The id of the animal.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAdoptionService): The injected service dependency.
 
     Returns:
-        Iterable: The adoption details.
+        dict: The page of the adoption details.
     """
 
-    adoptions = await service.get_by_animal_id(animal_id)
+    adoptions = await service.get_by_animal_id(
+        animal_id,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return adoptions
+    return respond(build_page(adoptions, page.limit))
 
 
 @router.get(
         "/adopter/{adopter_id}",
-        response_model=Iterable[Adoption],
+        response_model=Page[Adoption],
         status_code=200,
+        dependencies=[Depends(not_modified)],
 )
 @inject
 async def get_adoption_by_adopter_id(
     adopter_id: int,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAdoptionService = Depends(Provide[Container.adoption_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting adoptions by adopter id.
 
     Args:
         adopter_id (int): The id of the adopter.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAdoptionService): The injected service dependency.
 
     Returns:
-        Iterable: The adoption details collection.
+        dict: The page of the adoption details collection.
     """
 
-    adoptions = await service.get_by_adopter_id(adopter_id)
+    adoptions = await service.get_by_adopter_id(
+        adopter_id,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return adoptions
+    return respond(build_page(adoptions, page.limit))
+
+
+@router.get(
+    "/batch",
+    response_model=Batch[AdoptionDTO],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
+@inject
+async def get_adoptions_batch(
+    ids: list[int] = Depends(get_batch_ids),
+    respond: Responder = Depends(get_responder),
+    service: IAdoptionService = Depends(Provide[Container.adoption_service]),
+) -> dict:
+    """An endpoint for getting many adoptions by their ids at once.
+
+    Args:
+        ids (list[int]): The ids of the adoptions.
+        respond (Responder): The injected result builder.
+        service (IAdoptionService): The injected service dependency.
+
+    Returns:
+        dict: The adoptions keyed by id and the ids not found.
+    """
+
+    adoptions = await service.get_by_ids(ids)
+
+    return respond(build_batch(adoptions, ids))
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_adoptions(
+    export_format: ExportFormat = Depends(get_export_format),
+    service: IAdoptionService = Depends(Provide[Container.adoption_service]),
+) -> StreamingResponse:
+    """An endpoint for streaming all adoptions with the animal and adopter data as NDJSON, CSV, MessagePack or Arrow.
+
+    Args:
+        export_format (ExportFormat): The format of the file.
+        service (IAdoptionService): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The adoption rows streamed as a file.
+    """
+
+    return stream_export(
+        service.export_adoptions(),
+        export_format,
+        "adoptions",
+        AdoptionDTO,
+    )
 
 
 @router.get(
         "/{adoption_id}",
         response_model=AdoptionDTO,
         status_code=200,
+        dependencies=[Depends(not_modified)],
 )
 @inject
 async def get_adoption_by_id(
     adoption_id: int,
+    respond: Responder = Depends(get_responder),
     service: IAdoptionService = Depends(Provide[Container.adoption_service]),
 ) -> dict | None:
     """An endpoint for getting adoption by id.
 
     Args:
         adoption_id (int): The id of the adoption.
+        respond (Responder): The injected result builder.
         service (IAdoptionService): The injected service dependency.
 
     Returns:
@@ -124,7 +227,7 @@ async def get_adoption_by_id(
     """
 
     if adoption := await service.get_by_id(adoption_id):
-        return adoption.model_dump()
+        return respond(adoption)
 
     raise HTTPException(status_code=404, detail="Adoption not found")
 
@@ -134,6 +237,7 @@ async def get_adoption_by_id(
 async def update_adoption(
     adoption_id: int,
     updated_adoption: AdoptionIn,
+    respond: Responder = Depends(get_responder),
     service: IAdoptionService = Depends(Provide[Container.adoption_service]),
 ) -> dict:
     """An endpoint for updating adoption data.
@@ -141,6 +245,7 @@ async def update_adoption(
     Args:
         adoption_id (int): The id of the adoption.
         updated_adoption (AdoptionIn): The updated adoption details.
+        respond (Responder): The injected result builder.
         service (IAdoptionService): The injected service dependency.
 
     Raises:
@@ -150,12 +255,11 @@ async def update_adoption(
         dict: The updated adoption details.
     """
 
-    if await service.get_by_id(adoption_id=adoption_id):
-        await service.update_adoption(
-            adoption_id=adoption_id,
-            data=updated_adoption,
-        )
-        return {**updated_adoption.model_dump(), "id": adoption_id}
+    if new_updated_adoption := await service.update_adoption(
+        adoption_id=adoption_id,
+        data=updated_adoption,
+    ):
+        return respond(new_updated_adoption, status_code=201)
 
     raise HTTPException(status_code=404, detail="Adoption not found")
 
@@ -176,9 +280,7 @@ async def delete_adoption(
         HTTPException: 404 if adoption does not exist.
     """
 
-    if await service.get_by_id(adoption_id=adoption_id):
-        await service.delete_adoption(adoption_id)
-
+    if await service.delete_adoption(adoption_id):
         return
 
     raise HTTPException(status_code=404, detail="Adoption not found")
@@ -1,26 +1,50 @@
 """A module containing continent endpoints."""
 
-from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from animalshelterapi.api.utils.batch import Batch, build_batch, get_batch_ids
+from animalshelterapi.api.utils.bulk import BulkResult, build_bulk_result, parse_bulk
+from animalshelterapi.api.utils.conditional import conditional_get
+from animalshelterapi.api.utils.export import (
+    ExportFormat,
+    get_export_format,
+    stream_export,
+)
+from animalshelterapi.api.utils.pagination import (
+    Page,
+    PageQuery,
+    build_page,
+    get_page_query,
+)
+from animalshelterapi.api.utils.responses import Responder, get_responder
+from animalshelterapi.api.utils.routing import TimedRoute
 from animalshelterapi.container import Container
-from animalshelterapi.core.domain.animal import Animal, AnimalIn
+from animalshelterapi.core.domain.animal import (
+    Animal,
+    AnimalIn,
+    AnimalSearch,
+    AnimalSortField,
+)
 from animalshelterapi.infrastructure.services.ianimal import IAnimalService
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+not_modified = conditional_get("animals")
 
 
 @router.post("/create", response_model=Animal, status_code=201)
 @inject
 async def create_animal(
     animal: AnimalIn,
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
 ) -> dict:
     """An endpoint for adding new animal.
 
     Args:
         animal (AnimalIn): The animal data.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Returns:
@@ -29,137 +53,337 @@ async def create_animal(
 
     new_animal = await service.add_animal(animal)
 
-    return new_animal.model_dump() if new_animal else {}
+    return respond(new_animal or {}, status_code=201)
+
+
+@router.post("/bulk", response_model=BulkResult, status_code=201)
+@inject
+async def create_animals(
+    request: Request,
+    service: IAnimalService = Depends(Provide[Container.animal_service]),
+) -> dict:
+    """An endpoint for adding many animals at once.
+
+    The body is either a JSON array or an NDJSON stream of animal data.
+    Invalid rows are reported and the valid ones are created together.
+
+    Args:
+        request (Request): The request with the animal data rows.
+        service (IAnimalService): The injected service dependency.
+
+    Returns:
+        dict: The ids of the new animals and the errors of rejected rows.
+    """
+
+    valid, errors = await parse_bulk(request, AnimalIn)
+    ids = await service.add_animals([obj for _, obj in valid])
 
+    return build_bulk_result(valid, ids, errors)
 
-@router.get("/all", response_model=Iterable[Animal], status_code=200)
+
+@router.get(
+    "/all",
+    response_model=Page[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_all_animals(
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting all animals.
 
     Args:
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Returns:
-        Iterable: The animal attributes' collection.
+        dict: The page of the animal attributes' collection.
     """
 
-    animals = await service.get_all_animals()
+    animals = await service.get_all_animals(
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
+
+    return respond(build_page(animals, page.limit))
+
+@router.get(
+    "/search",
+    response_model=Page[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
+@inject
+async def search_animals(
+    criteria: AnimalSearch = Depends(),
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
+    service: IAnimalService = Depends(Provide[Container.animal_service]),
+) -> dict:
+    """An endpoint for searching animals by any combination of attributes.
+
+    Args:
+        criteria (AnimalSearch): The filters and the sort order.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
+        service (IAnimalService): The injected service dependency.
 
-    return animals
+    Returns:
+        dict: The page of the matching animal attributes.
+    """
 
-@router.get("/name/{name}", response_model=Iterable[Animal], status_code=200)
+    sort_key = criteria.sort_by.value
+    after_value = None
+    if criteria.sort_by is not AnimalSortField.ID:
+        after_value = page.after_value(Animal.model_fields[sort_key].annotation)
+
+    animals = await service.search_animals(
+        criteria,
+        after_value=after_value,
+        after_id=page.after["id"] if page.after else None,
+        limit=page.limit + 1,
+    )
+
+    return respond(build_page(animals, page.limit, sort_key=sort_key))
+
+@router.get(
+    "/name/{name}",
+    response_model=Page[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_animal_by_name(
     name: str,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting animals with given name.
 
     Args:
         name(str): The animal name.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Returns:
-        Iterable: The animal attributes' collection.
+        dict: The page of the animal attributes' collection.
     """
 
-    animals = await service.get_animal_by_name(name)
+    animals = await service.get_animal_by_name(
+        name,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return animals
+    return respond(build_page(animals, page.limit))
 
-@router.get("/species/{species}", response_model=Iterable[Animal], status_code=200)
+@router.get(
+    "/species/{species}",
+    response_model=Page[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_animal_by_species(
     species: str,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting animals with given species.
 
     Args:
         species(str): The animal species.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Returns:
-        Iterable: The animal attributes' collection.
+        dict: The page of the animal attributes' collection.
     """
 
-    animals = await service.get_animal_by_species(species)
+    animals = await service.get_animal_by_species(
+        species,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return animals
+    return respond(build_page(animals, page.limit))
 
-@router.get("/breed/{breed}", response_model=Iterable[Animal], status_code=200)
+@router.get(
+    "/breed/{breed}",
+    response_model=Page[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_animal_by_breed(
     breed: str,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting animals with given breed.
 
     Args:
         breed(str): The animal breed.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Returns:
-        Iterable: The animal attributes' collection.
+        dict: The page of the animal attributes' collection.
     """
 
-    animals = await service.get_animal_by_breed(breed)
+    animals = await service.get_animal_by_breed(
+        breed,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return animals
+    return respond(build_page(animals, page.limit))
 
-@router.get("/gender/{gender}", response_model=Iterable[Animal], status_code=200)
+@router.get(
+    "/gender/{gender}",
+    response_model=Page[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_animal_by_gender(
     gender: str,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting animals with given gender.
 
     Args:
         gender(str): The animal gender.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Returns:
-        Iterable: The animal attributes' collection.
+        dict: The page of the animal attributes' collection.
     """
 
-    animals = await service.get_animal_by_gender(gender)
+    animals = await service.get_animal_by_gender(
+        gender,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return animals
+    return respond(build_page(animals, page.limit))
 
-@router.get("/adoption_status/{adoption_status}", response_model=Iterable[Animal], status_code=200)
+@router.get(
+    "/adoption_status/{adoption_status}",
+    response_model=Page[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_animal_by_adoption_status(
     adoption_status: str,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting animals with given adoption status.
 
     Args:
         adoption_status(str): The animal's adoption status.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
+        service (IAnimalService): The injected service dependency.
+
+    Returns:
+        dict: The page of the animal attributes' collection.
+    """
+
+    animals = await service.get_animal_by_adoption_status(
+        adoption_status,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
+
+    return respond(build_page(animals, page.limit))
+
+@router.get(
+    "/batch",
+    response_model=Batch[Animal],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
+@inject
+async def get_animals_batch(
+    ids: list[int] = Depends(get_batch_ids),
+    respond: Responder = Depends(get_responder),
+    service: IAnimalService = Depends(Provide[Container.animal_service]),
+) -> dict:
+    """An endpoint for getting many animals by their ids at once.
+
+    Args:
+        ids (list[int]): The ids of the animals.
+        respond (Responder): The injected result builder.
+        service (IAnimalService): The injected service dependency.
+
+    Returns:
+        dict: The animals keyed by id and the ids not found.
+    """
+
+    animals = await service.get_animals_by_ids(ids)
+
+    return respond(build_batch(animals, ids))
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_animals(
+    export_format: ExportFormat = Depends(get_export_format),
+    service: IAnimalService = Depends(Provide[Container.animal_service]),
+) -> StreamingResponse:
+    """An endpoint for streaming all animals as NDJSON, CSV, MessagePack or Arrow.
+
+    Args:
+        export_format (ExportFormat): The format of the file.
         service (IAnimalService): The injected service dependency.
 
     Returns:
-        Iterable: The animal attributes' collection.
+        StreamingResponse: The animal rows streamed as a file.
     """
 
-    animals = await service.get_animal_by_adoption_status(adoption_status)
+    return stream_export(
+        service.export_animals(),
+        export_format,
+        "animals",
+        Animal,
+    )
 
-    return animals
 
-@router.get("/{animal_id}", response_model=Animal, status_code=200)
+@router.get(
+    "/{animal_id}",
+    response_model=Animal,
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_animal_by_id(
     animal_id: int,
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
 ) -> dict:
     """An endpoint for getting animal details by id.
 
     Args:
         animal_id (int): The id of the animal.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Raises:
@@ -170,7 +394,7 @@ async def get_animal_by_id(
     """
 
     if animal := await service.get_animal_by_id(animal_id):
-        return animal.model_dump()
+        return respond(animal)
 
     raise HTTPException(status_code=404, detail="Animal not found")
 
@@ -180,6 +404,7 @@ async def get_animal_by_id(
 async def update_animal(
     animal_id: int,
     updated_animal: AnimalIn,
+    respond: Responder = Depends(get_responder),
     service: IAnimalService = Depends(Provide[Container.animal_service]),
 ) -> dict:
     """An endpoint for updating animal data.
@@ -187,6 +412,7 @@ async def update_animal(
     Args:
         animal_id (int): The id of the animal.
         updated_animal (AnimalIn): The updated animal details.
+        respond (Responder): The injected result builder.
         service (IAnimalService): The injected service dependency.
 
     Raises:
@@ -196,13 +422,11 @@ async def update_animal(
         dict: The updated animal details.
     """
 
-    if await service.get_animal_by_id(animal_id=animal_id):
-        new_updated_animal = await service.update_animal(
-            animal_id=animal_id,
-            data=updated_animal,
-        )
-        return new_updated_animal.model_dump() if new_updated_animal \
-            else {}
+    if new_updated_animal := await service.update_animal(
+        animal_id=animal_id,
+        data=updated_animal,
+    ):
+        return respond(new_updated_animal, status_code=201)
 
     raise HTTPException(status_code=404, detail="Animal not found")
 
@@ -226,8 +450,7 @@ async def delete_animal(
         dict: Empty if operation finished.
     """
 
-    if await service.get_animal_by_id(animal_id=animal_id):
-        await service.delete_animal(animal_id)
+    if await service.delete_animal(animal_id):
         return
 
     raise HTTPException(status_code=404, detail="Animal not found")
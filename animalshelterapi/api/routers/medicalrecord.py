@@ -1,27 +1,46 @@
 """A module containing medical record endpoints."""
 
-from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from animalshelterapi.api.utils.batch import Batch, build_batch, get_batch_ids
+from animalshelterapi.api.utils.bulk import BulkResult, build_bulk_result, parse_bulk
+from animalshelterapi.api.utils.conditional import conditional_get
+from animalshelterapi.api.utils.export import (
+    ExportFormat,
+    get_export_format,
+    stream_export,
+)
+from animalshelterapi.api.utils.pagination import (
+    Page,
+    PageQuery,
+    build_page,
+    get_page_query,
+)
+from animalshelterapi.api.utils.responses import Responder, get_responder
+from animalshelterapi.api.utils.routing import TimedRoute
 from animalshelterapi.container import Container
 from animalshelterapi.core.domain.medicalrecord import MedicalRecord, MedicalRecordIn
 from animalshelterapi.infrastructure.dto.medicalrecorddto import MedicalRecordDTO
 from animalshelterapi.infrastructure.services.imedicalrecord import IMedicalRecordService
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+not_modified = conditional_get("medical_records", "animals")
 
 
 @router.post("/create", response_model=MedicalRecord, status_code=201)
 @inject
 async def create_medical_record(
     medical_record: MedicalRecordIn,
+    respond: Responder = Depends(get_responder),
     service: IMedicalRecordService = Depends(Provide[Container.medical_record_service])
 ) -> dict:
     """An endpoint for adding new medical records.
 
     Args:
         medical_record (MedicalRecordIn): The medical record data.
+        respond (Responder): The injected result builder.
         service (IMedicalRecordService): The injected service dependency.
 
     Returns:
@@ -30,38 +49,134 @@ async def create_medical_record(
 
     new_medical_record = await service.add_medical_record(medical_record)
 
-    return new_medical_record.model_dump() if new_medical_record else {}
+    return respond(new_medical_record or {}, status_code=201)
 
 
-@router.get("/all", response_model=Iterable[MedicalRecordDTO], status_code=200)
+@router.post("/bulk", response_model=BulkResult, status_code=201)
+@inject
+async def create_medical_records(
+    request: Request,
+    service: IMedicalRecordService = Depends(Provide[Container.medical_record_service]),
+) -> dict:
+    """An endpoint for adding many medical records at once.
+
+    The body is either a JSON array or an NDJSON stream of medical record data.
+    Invalid rows are reported and the valid ones are created together.
+
+    Args:
+        request (Request): The request with the medical record data rows.
+        service (IMedicalRecordService): The injected service dependency.
+
+    Returns:
+        dict: The ids of the new medical records and the errors of rejected rows.
+    """
+
+    valid, errors = await parse_bulk(request, MedicalRecordIn)
+    ids = await service.add_medical_records([obj for _, obj in valid])
+
+    return build_bulk_result(valid, ids, errors, "Animal not found")
+
+
+@router.get(
+    "/all",
+    response_model=Page[MedicalRecordDTO],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_all_medical_records(
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IMedicalRecordService = Depends(Provide[Container.medical_record_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting all medical records.
 
     Args:
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
+        service (IMedicalRecordService): The injected service dependency.
+
+    Returns:
+        dict: The page of the medical record attributes collection.
+    """
+
+    medical_records = await service.get_all_medical_records(
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
+
+    return respond(build_page(medical_records, page.limit))
+
+
+@router.get(
+    "/batch",
+    response_model=Batch[MedicalRecordDTO],
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
+@inject
+async def get_medical_records_batch(
+    ids: list[int] = Depends(get_batch_ids),
+    respond: Responder = Depends(get_responder),
+    service: IMedicalRecordService = Depends(Provide[Container.medical_record_service]),
+) -> dict:
+    """An endpoint for getting many medical records by their ids at once.
+
+    Args:
+        ids (list[int]): The ids of the medical records.
+        respond (Responder): The injected result builder.
         service (IMedicalRecordService): The injected service dependency.
 
     Returns:
-        Iterable: The medical record attributes collection.
+        dict: The medical records keyed by id and the ids not found.
     """
 
-    medical_records = await service.get_all_medical_records()
+    medical_records = await service.get_medical_records_by_ids(ids)
 
-    return medical_records
+    return respond(build_batch(medical_records, ids))
 
 
-@router.get("/{medical_record_id}", response_model=MedicalRecordDTO, status_code=200)
+@router.get("/export", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_medical_records(
+    export_format: ExportFormat = Depends(get_export_format),
+    service: IMedicalRecordService = Depends(Provide[Container.medical_record_service]),
+) -> StreamingResponse:
+    """An endpoint for streaming all medical records as NDJSON, CSV, MessagePack or Arrow.
+
+    Args:
+        export_format (ExportFormat): The format of the file.
+        service (IMedicalRecordService): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The medical record rows streamed as a file.
+    """
+
+    return stream_export(
+        service.export_medical_records(),
+        export_format,
+        "medical_records",
+        MedicalRecord,
+    )
+
+
+@router.get(
+    "/{medical_record_id}",
+    response_model=MedicalRecordDTO,
+    status_code=200,
+    dependencies=[Depends(not_modified)],
+)
 @inject
 async def get_medical_record_by_id(
     medical_record_id: int,
+    respond: Responder = Depends(get_responder),
     service: IMedicalRecordService = Depends(Provide[Container.medical_record_service]),
 ) -> dict:
     """An endpoint for getting medical record details by id.
 
     Args:
         medical_record_id (int): The id of the medical record.
+        respond (Responder): The injected result builder.
         service (IMedicalRecordService): The injected service dependency.
 
     Raises:
@@ -72,34 +187,43 @@ async def get_medical_record_by_id(
     """
 
     if medical_record := await service.get_medical_record_by_id(medical_record_id=medical_record_id):
-        return medical_record.model_dump()
+        return respond(medical_record)
 
     raise HTTPException(status_code=404, detail="Medical record not found")
 
 
 @router.get(
         "/animal/{animal_id}",
-        response_model=Iterable[MedicalRecordDTO],
+        response_model=Page[MedicalRecordDTO],
         status_code=200,
+        dependencies=[Depends(not_modified)],
 )
 @inject
 async def get_medical_record_by_animal_id(
     animal_id: int,
+    page: PageQuery = Depends(get_page_query),
+    respond: Responder = Depends(get_responder),
     service: IMedicalRecordService = Depends(Provide[Container.medical_record_service]),
-) -> Iterable:
+) -> dict:
     """An endpoint for getting medical records by animal id.
 
     Args:
         animal_id (int): The id of the animal.
+        page (PageQuery): The requested page.
+        respond (Responder): The injected result builder.
         service (IMedicalRecordService): The injected service dependency.
 
     Returns:
-        dict: The requested medical records.
+        dict: The page of the requested medical records.
     """
 
-    medical_records = await service.get_medical_record_by_animal_id(animal_id)
+    medical_records = await service.get_medical_record_by_animal_id(
+        animal_id,
+        after_id=page.after_id,
+        limit=page.limit + 1,
+    )
 
-    return medical_records
+    return respond(build_page(medical_records, page.limit))
 
 
 @router.put("/{medical_record_id}", response_model=MedicalRecord, status_code=201)
@@ -107,6 +231,7 @@ async def get_medical_record_by_animal_id(
 async def update_medical_record(
     medical_record_id: int,
     updated_medical_record: MedicalRecordIn,
+    respond: Responder = Depends(get_responder),
     service: IMedicalRecordService = Depends(Provide[Container.medical_record_service]),
 ) -> dict:
     """An endpoint for updating medical record data.
@@ -114,6 +239,7 @@ async def update_medical_record(
     Args:
         medical_record_id (int): The id of the medical record.
         updated_medical_record (CountryIn): The updated medical record details.
+        respond (Responder): The injected result builder.
         service (IMedicalRecordService): The injected service dependency.
 
     Raises:
@@ -123,12 +249,11 @@ async def update_medical_record(
         dict: The updated medical record data.
     """
 
-    if await service.get_medical_record_by_id(medical_record_id=medical_record_id):
-        new_updated_medical_record = await service.update_medical_record(
-            medical_record_id=medical_record_id,
-            data=updated_medical_record,
-        )
-        return new_updated_medical_record.model_dump() if new_updated_medical_record else {}
+    if new_updated_medical_record := await service.update_medical_record(
+        medical_record_id=medical_record_id,
+        data=updated_medical_record,
+    ):
+        return respond(new_updated_medical_record, status_code=201)
 
     raise HTTPException(status_code=404, detail="Medical record not found")
 
@@ -149,9 +274,7 @@ async def delete_medical_record(
         HTTPException: 404 if medical record does not exist.
     """
 
-    if await service.get_medical_record_by_id(medical_record_id=medical_record_id):
-        await service.delete_medical_record(medical_record_id)
-
+    if await service.delete_medical_record(medical_record_id):
         return
 
     raise HTTPException(status_code=404, detail="Medical record not found")
@@ -0,0 +1,151 @@
+"""A module containing the Prometheus metrics endpoint."""
+
+from typing import Any
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Response
+
+from animalshelterapi.api.utils.routing import TimedRoute
+from animalshelterapi.config import config
+from animalshelterapi.container import Container
+from animalshelterapi.db import database
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+from animalshelterapi.infrastructure.utils.singleflight import SingleFlight
+from animalshelterapi.utils.metrics import registry, render_family
+
+METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def _pool_families() -> list[str]:
+    """Function rendering the usage of the connection pool.
+
+    Returns:
+        list[str]: The pool families, none without a database.
+    """
+
+    if config.DB_BACKEND == "memory":
+        return []
+
+    stats = database.pool_stats()
+
+    return [
+        render_family(
+            "db_pool_size",
+            "gauge",
+            "The number of connections kept in the pool.",
+            [({}, stats["size"])],
+        ),
+        render_family(
+            "db_pool_in_use",
+            "gauge",
+            "The number of connections checked out of the pool.",
+            [({}, stats["in_use"])],
+        ),
+        render_family(
+            "db_pool_overflow",
+            "gauge",
+            "The number of connections opened beyond the pool size.",
+            [({}, stats["overflow"])],
+        ),
+        render_family(
+            "db_pool_waiting",
+            "gauge",
+            "The number of callers waiting for a connection.",
+            [({}, stats["waiting"])],
+        ),
+    ]
+
+
+def _cache_families(stats: dict[str, Any]) -> list[str]:
+    """Function rendering the usage of the read cache.
+
+    Args:
+        stats (dict[str, Any]): The statistics of the read cache.
+
+    Returns:
+        list[str]: The cache families.
+    """
+
+    operations = stats["operations"]
+
+    return [
+        render_family(
+            "cache_entries",
+            "gauge",
+            "The number of values in the read cache.",
+            [({"backend": stats["backend"]}, stats["size"])],
+        ),
+        render_family(
+            "cache_hits_total",
+            "counter",
+            "The reads served from the cache.",
+            [({"operation": name}, op["hits"]) for name, op in operations.items()],
+        ),
+        render_family(
+            "cache_misses_total",
+            "counter",
+            "The reads loaded from the repository.",
+            [({"operation": name}, op["misses"]) for name, op in operations.items()],
+        ),
+        render_family(
+            "cache_hit_ratio",
+            "gauge",
+            "The share of the reads served from the cache.",
+            [({"operation": name}, op["hit_ratio"]) for name, op in operations.items()],
+        ),
+    ]
+
+
+def _single_flight_families(stats: dict[str, dict[str, Any]]) -> list[str]:
+    """Function rendering the coalesced reads.
+
+    Args:
+        stats (dict[str, dict[str, Any]]): The statistics per operation.
+
+    Returns:
+        list[str]: The single flight families.
+    """
+
+    return [
+        render_family(
+            "single_flight_calls_total",
+            "counter",
+            "The reads requested from the repository.",
+            [({"operation": name}, op["calls"]) for name, op in stats.items()],
+        ),
+        render_family(
+            "single_flight_executions_total",
+            "counter",
+            "The reads executed, the others shared a running one.",
+            [({"operation": name}, op["executions"]) for name, op in stats.items()],
+        ),
+    ]
+
+
+@router.get("/metrics", include_in_schema=False)
+@inject
+async def get_metrics(
+    cache: ReadCache = Depends(Provide[Container.read_cache]),
+    single_flight: SingleFlight = Depends(Provide[Container.single_flight]),
+) -> Response:
+    """An endpoint for getting the metrics in the Prometheus text format.
+
+    Args:
+        cache (ReadCache): The injected read cache.
+        single_flight (SingleFlight): The injected read coalescer.
+
+    Returns:
+        Response: The request and repository histograms, the pool usage
+            and the cache statistics.
+    """
+
+    families = [
+        registry.render(),
+        *_pool_families(),
+        *_cache_families(await cache.stats()),
+        *_single_flight_families(single_flight.stats()),
+    ]
+
+    return Response("".join(families), media_type=METRICS_MEDIA_TYPE)
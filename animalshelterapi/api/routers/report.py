@@ -1,71 +1,212 @@
 """A module containing report endpoints."""
 
-from typing import Iterable
+from datetime import date, datetime
+from typing import Iterable, Optional
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 
+from animalshelterapi.api.utils.conditional import conditional_get
+from animalshelterapi.api.utils.responses import Responder, get_responder
+from animalshelterapi.api.utils.routing import TimedRoute
 from animalshelterapi.container import Container
-from animalshelterapi.core.domain.report import Report, ReportIn
+from animalshelterapi.core.domain.report import (
+    Histogram,
+    HistogramBucket,
+    Report,
+    ReportIn,
+)
 from animalshelterapi.infrastructure.dto.reportdto import ReportDTO
 from animalshelterapi.infrastructure.services.ireport import IReportService
+from animalshelterapi.utils.consts import MAX_HISTOGRAM_BUCKETS
 
 
 bearer_scheme = HTTPBearer()
 
-router = APIRouter()
-@router.get("/adoption_report/{adoptions_report}", response_model=None, status_code=200)
+router = APIRouter(route_class=TimedRoute)
+@router.get(
+    "/adoption_report/{adoptions_report}",
+    response_model=None,
+    status_code=200,
+    dependencies=[Depends(conditional_get("adoptions", "reports", daily=True))],
+)
 @inject
 async def get_adoptions_report(
+    as_of: Optional[datetime] = None,
+    respond: Responder = Depends(get_responder),
     service: IReportService = Depends(Provide[Container.report_service]),
 ) -> Iterable:
     """An endpoint for getting adoptions report.
 
     Args:
+        as_of (Optional[datetime]): The time of the snapshot, None for
+            the latest one.
+        respond (Responder): The injected result builder.
         service (IReportService): The injected service dependency.
 
+    Raises:
+        HTTPException: 404 if no snapshot was stored before the time.
+
     Returns:
         Iterable: The report attributes collection.
     """
 
-    report = await service.get_adoptions_report()
+    if report := await service.get_adoptions_report(as_of):
+        return respond(report)
 
-    return report
+    raise HTTPException(status_code=404, detail="Report not found")
 
-@router.get("/medical_records_report/{medical_records_report}", response_model=None, status_code=200)
+@router.get(
+    "/medical_records_report/{medical_records_report}",
+    response_model=None,
+    status_code=200,
+    dependencies=[Depends(conditional_get("medical_records", "reports", daily=True))],
+)
 @inject
 async def get_medical_records_report(
+    as_of: Optional[datetime] = None,
+    respond: Responder = Depends(get_responder),
     service: IReportService = Depends(Provide[Container.report_service]),
 ) -> Iterable:
     """An endpoint for getting medical records report.
 
     Args:
+        as_of (Optional[datetime]): The time of the snapshot, None for
+            the latest one.
+        respond (Responder): The injected result builder.
         service (IReportService): The injected service dependency.
 
+    Raises:
+        HTTPException: 404 if no snapshot was stored before the time.
+
     Returns:
         Iterable: The report attributes collection.
     """
 
-    report = await service.get_medical_records_report()
+    if report := await service.get_medical_records_report(as_of):
+        return respond(report)
 
-    return report
+    raise HTTPException(status_code=404, detail="Report not found")
 
-@router.get("/animals_report/{animals_report}", response_model=None, status_code=200)
+@router.get(
+    "/animals_report/{animals_report}",
+    response_model=None,
+    status_code=200,
+    dependencies=[Depends(conditional_get("animals", "reports", daily=True))],
+)
 @inject
 async def get_animals_report(
+    as_of: Optional[datetime] = None,
+    respond: Responder = Depends(get_responder),
     service: IReportService = Depends(Provide[Container.report_service]),
 ) -> Iterable:
     """An endpoint for getting report.
 
     Args:
+        as_of (Optional[datetime]): The time of the snapshot, None for
+            the latest one.
+        respond (Responder): The injected result builder.
         service (IReportService): The injected service dependency.
 
+    Raises:
+        HTTPException: 404 if no snapshot was stored before the time.
+
     Returns:
         Iterable: The report attributes collection.
     """
 
-    report = await service.get_animals_report()
+    if report := await service.get_animals_report(as_of):
+        return respond(report)
+
+    raise HTTPException(status_code=404, detail="Report not found")
+
+@router.get(
+    "/dashboard",
+    response_model=None,
+    status_code=200,
+    dependencies=[Depends(conditional_get(
+        "adoptions",
+        "medical_records",
+        "animals",
+        "reports",
+        daily=True,
+    ))],
+)
+@inject
+async def get_dashboard(
+    as_of: Optional[datetime] = None,
+    respond: Responder = Depends(get_responder),
+    service: IReportService = Depends(Provide[Container.report_service]),
+) -> dict:
+    """An endpoint for getting all reports at once.
+
+    Args:
+        as_of (Optional[datetime]): The time of the snapshots, None for
+            the latest ones.
+        respond (Responder): The injected result builder.
+        service (IReportService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if no snapshot was stored before the time.
+
+    Returns:
+        dict: The reports keyed by their subject.
+    """
+
+    dashboard = await service.get_dashboard(as_of)
+    if None in dashboard.values():
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    return respond(dashboard)
+
+@router.get(
+    "/histogram",
+    response_model=Histogram,
+    status_code=200,
+    dependencies=[Depends(conditional_get(
+        "animals",
+        "adoptions",
+        "medical_records",
+    ))],
+)
+@inject
+async def get_histogram(
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    bucket: HistogramBucket = HistogramBucket.DAY,
+    respond: Responder = Depends(get_responder),
+    service: IReportService = Depends(Provide[Container.report_service]),
+) -> dict:
+    """An endpoint for getting the numbers of arrivals, adoptions and
+    medical visits per bucket of the date range.
+
+    Args:
+        start (date): The first day of the range.
+        end (date): The last day of the range.
+        bucket (HistogramBucket): The size of the buckets.
+        respond (Responder): The injected result builder.
+        service (IReportService): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the range is empty or has too many buckets.
+
+    Returns:
+        dict: The counts per bucket.
+    """
+
+    if end < start:
+        raise HTTPException(
+            status_code=400,
+            detail="The range must not end before it starts",
+        )
+
+    if bucket.count(start, end) > MAX_HISTOGRAM_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"The range must not exceed {MAX_HISTOGRAM_BUCKETS} buckets",
+        )
 
-    return report
+    histogram = await service.get_histogram(start, end, bucket)
 
+    return respond(histogram)
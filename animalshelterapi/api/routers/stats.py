@@ -0,0 +1,47 @@
+"""A module containing runtime statistics endpoints."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+
+from animalshelterapi.api.utils.routing import TimedRoute
+from animalshelterapi.container import Container
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+from animalshelterapi.infrastructure.utils.singleflight import SingleFlight
+
+router = APIRouter(route_class=TimedRoute)
+
+
+@router.get("/single_flight", status_code=200)
+@inject
+async def get_single_flight_stats(
+    single_flight: SingleFlight = Depends(Provide[Container.single_flight]),
+) -> dict:
+    """An endpoint for getting statistics of coalesced reads.
+
+    Args:
+        single_flight (SingleFlight): The injected read coalescer.
+
+    Returns:
+        dict: The calls, storage executions and saved executions
+            per service read.
+    """
+
+    return single_flight.stats()
+
+
+@router.get("/cache", status_code=200)
+@inject
+async def get_cache_stats(
+    cache: ReadCache = Depends(Provide[Container.read_cache]),
+) -> dict:
+    """An endpoint for getting statistics of the read cache.
+
+    Args:
+        cache (ReadCache): The injected read cache.
+
+    Returns:
+        dict: The backend, its size and the hits, misses and hit ratio
+            per service read.
+    """
+
+    return await cache.stats()
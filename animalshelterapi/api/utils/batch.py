@@ -0,0 +1,71 @@
+"""A module containing helpers for batch fetch endpoints."""
+
+from typing import Any, Generic, Iterable, TypeVar
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+from animalshelterapi.utils.consts import MAX_BATCH_IDS, MAX_ID
+
+ItemT = TypeVar("ItemT")
+
+
+class Batch(BaseModel, Generic[ItemT]):
+    """Model representing items fetched by their ids."""
+    items: dict[int, ItemT]
+    missing: list[int]
+
+
+def get_batch_ids(
+    ids: list[str] = Query(
+        ...,
+        description="Comma separated or repeated ids.",
+    ),
+) -> list[int]:
+    """Function parsing the requested ids.
+
+    Args:
+        ids (list[str]): The raw values of the `ids` query parameter.
+
+    Raises:
+        HTTPException: 422 if an id is not a valid key or too many are given.
+
+    Returns:
+        list[int]: The unique ids in request order.
+    """
+
+    try:
+        parsed = [int(value) for raw in ids for value in raw.split(",") if value]
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail="Invalid ids") from e
+
+    if any(not 0 <= item_id <= MAX_ID for item_id in parsed):
+        raise HTTPException(status_code=422, detail="Invalid ids")
+
+    unique = list(dict.fromkeys(parsed))
+    if not unique or len(unique) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Between 1 and {MAX_BATCH_IDS} ids are accepted",
+        )
+
+    return unique
+
+
+def build_batch(items: Iterable[Any], ids: list[int]) -> dict:
+    """Function keying the fetched items by id.
+
+    Args:
+        items (Iterable[Any]): The fetched items.
+        ids (list[int]): The requested ids.
+
+    Returns:
+        dict: The items keyed by id and the ids that were not found.
+    """
+
+    found = {item.id: item for item in items}
+
+    return {
+        "items": {item_id: found[item_id] for item_id in ids if item_id in found},
+        "missing": [item_id for item_id in ids if item_id not in found],
+    }
@@ -0,0 +1,169 @@
+"""A module containing helpers for bulk create endpoints."""
+
+import json
+from typing import Any, AsyncIterator, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+
+from animalshelterapi.utils.consts import MAX_BULK_ROWS
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class BulkRowError(BaseModel):
+    """Model representing errors of a single rejected row."""
+    index: int
+    errors: list[dict[str, Any]]
+
+
+class BulkResult(BaseModel):
+    """Model representing the outcome of a bulk create request."""
+    ids: list[Optional[int]]
+    errors: list[BulkRowError]
+
+
+async def _iter_ndjson(request: Request) -> AsyncIterator[bytes]:
+    """Function splitting the streamed request body into lines.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Yields:
+        bytes: The non-empty lines of the body.
+    """
+
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+
+    if buffer.strip():
+        yield buffer
+
+
+async def _iter_rows(request: Request) -> AsyncIterator[Any]:
+    """Function iterating over decoded rows of a JSON array or NDJSON body.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Raises:
+        HTTPException: 400 if a JSON body is not an array.
+
+    Yields:
+        Any: The decoded row or the `ValueError` raised while decoding it.
+    """
+
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if media_type in NDJSON_MEDIA_TYPES:
+        async for line in _iter_ndjson(request):
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield e
+        return
+
+    try:
+        rows = json.loads(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid JSON body") from e
+
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array")
+
+    for row in rows:
+        yield row
+
+
+async def parse_bulk(
+    request: Request,
+    model: type[ModelT],
+) -> tuple[list[tuple[int, ModelT]], list[BulkRowError]]:
+    """Function validating every row of a bulk request against the model.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        model (type[ModelT]): The model of a single row.
+
+    Raises:
+        HTTPException: 413 if the request has too many rows.
+
+    Returns:
+        tuple[list[tuple[int, ModelT]], list[BulkRowError]]: The valid rows
+            with their positions and the errors of the rejected rows.
+    """
+
+    valid: list[tuple[int, ModelT]] = []
+    errors: list[BulkRowError] = []
+    index = -1
+
+    async for row in _iter_rows(request):
+        index += 1
+        if index >= MAX_BULK_ROWS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"At most {MAX_BULK_ROWS} rows are accepted",
+            )
+
+        if isinstance(row, ValueError):
+            errors.append(BulkRowError(
+                index=index,
+                errors=[{"type": "json_invalid", "msg": str(row)}],
+            ))
+            continue
+
+        try:
+            valid.append((index, model.model_validate(row)))
+        except ValidationError as e:
+            errors.append(BulkRowError(
+                index=index,
+                errors=e.errors(
+                    include_url=False,
+                    include_context=False,
+                    include_input=False,
+                ),
+            ))
+
+    return valid, errors
+
+
+def build_bulk_result(
+    valid: Sequence[tuple[int, Any]],
+    ids: Sequence[Optional[int]],
+    errors: list[BulkRowError],
+    missing_detail: str = "Related row not found",
+) -> dict:
+    """Function merging created ids with the rejected rows.
+
+    Args:
+        valid (Sequence[tuple[int, Any]]): The valid rows with positions.
+        ids (Sequence[Optional[int]]): The created ids of the valid rows,
+            None where the storage rejected the row.
+        errors (list[BulkRowError]): The validation errors.
+        missing_detail (str): The message for rows rejected by the storage.
+
+    Returns:
+        dict: The ids in request order and all row errors.
+    """
+
+    result_ids: list[Optional[int]] = [None] * (
+        max([index for index, _ in valid] + [error.index for error in errors], default=-1) + 1
+    )
+
+    for (index, _), new_id in zip(valid, ids):
+        result_ids[index] = new_id
+        if new_id is None:
+            errors.append(BulkRowError(
+                index=index,
+                errors=[{"type": "not_found", "msg": missing_detail}],
+            ))
+
+    errors.sort(key=lambda error: error.index)
+
+    return {"ids": result_ids, "errors": errors}
@@ -0,0 +1,104 @@
+"""A module containing helpers for conditional GET requests."""
+
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response
+
+from animalshelterapi.db import table_versions
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Function comparing the `If-None-Match` header with the ETag.
+
+    Args:
+        if_none_match (str): The value of the header.
+        etag (str): The current ETag.
+
+    Returns:
+        bool: Whether any of the listed tags weakly matches the ETag.
+    """
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        tag.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for tag in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    """Function comparing the `If-Modified-Since` header with the data.
+
+    Args:
+        if_modified_since (str): The value of the header.
+        last_modified (datetime): The time of the latest write.
+
+    Returns:
+        bool: Whether the data did not change after the given time.
+    """
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_get(*tables: str, daily: bool = False) -> Callable[..., None]:
+    """Function creating a dependency answering unchanged reads with 304.
+
+    The validators come from the write counters of the read tables, so
+    a matching request is answered before the query runs.
+
+    Args:
+        *tables (str): The names of the tables the endpoint reads.
+        daily (bool): Whether the result also depends on the current day.
+
+    Returns:
+        Callable[..., None]: The dependency setting `ETag` and
+            `Last-Modified` or raising 304 Not Modified.
+    """
+
+    def dependency(request: Request, response: Response) -> None:
+        """The dependency comparing validators of the request.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            response (Response): The response receiving the validators.
+
+        Raises:
+            HTTPException: 304 if the client copy is still valid.
+        """
+
+        version = table_versions.version(tables)
+        if daily:
+            version = f"{version}-{date.today().isoformat()}"
+
+        etag = f'W/"{version}"'
+        last_modified = table_versions.last_modified(tables)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": format_datetime(last_modified, usegmt=True),
+        }
+
+        if if_none_match := request.headers.get("if-none-match"):
+            not_modified = _etag_matches(if_none_match, etag)
+        elif if_modified_since := request.headers.get("if-modified-since"):
+            not_modified = not daily and \
+                _not_modified_since(if_modified_since, last_modified)
+        else:
+            not_modified = False
+
+        if not_modified:
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+
+    return dependency
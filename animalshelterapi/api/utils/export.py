@@ -0,0 +1,191 @@
+"""A module containing helpers for streaming export endpoints."""
+
+import csv
+import io
+from enum import Enum
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from animalshelterapi.api.utils.formats import (
+    ARROW_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    arrow_chunks,
+    available_media_types,
+    choose_media_type,
+    flat_fields,
+    pack,
+)
+from animalshelterapi.api.utils.responses import dumps
+from animalshelterapi.utils.consts import EXPORT_CHUNK_SIZE
+
+
+class ExportFormat(str, Enum):
+    """Enum representing supported export formats."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+    MSGPACK = "msgpack"
+    ARROW = "arrow"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.MSGPACK: MSGPACK_MEDIA_TYPE,
+    ExportFormat.ARROW: ARROW_MEDIA_TYPE,
+}
+
+
+def get_export_format(
+    request: Request,
+    export_format: Optional[ExportFormat] = Query(None, alias="format"),
+) -> ExportFormat:
+    """Function resolving the format of the export.
+
+    Without the `format` parameter, MessagePack and Arrow are chosen from
+    the `Accept` header and NDJSON otherwise.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        export_format (Optional[ExportFormat]): The requested format.
+
+    Raises:
+        HTTPException: 406 if the format needs a package not installed.
+
+    Returns:
+        ExportFormat: The format of the file.
+    """
+
+    if export_format is None:
+        media_type = choose_media_type(request.headers.get("accept", ""))
+        export_format = {
+            MSGPACK_MEDIA_TYPE: ExportFormat.MSGPACK,
+            ARROW_MEDIA_TYPE: ExportFormat.ARROW,
+        }.get(media_type, ExportFormat.NDJSON)
+
+    media_type = MEDIA_TYPES[export_format]
+    if media_type in (MSGPACK_MEDIA_TYPE, ARROW_MEDIA_TYPE) and \
+            media_type not in available_media_types():
+        raise HTTPException(
+            status_code=406,
+            detail=f"The {export_format.value} format is not available",
+        )
+
+    return export_format
+
+
+async def _ndjson_chunks(rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Function encoding the rows as NDJSON in chunks.
+
+    Args:
+        rows (AsyncIterator[dict]): The rows to encode.
+
+    Yields:
+        bytes: The encoded lines of up to `EXPORT_CHUNK_SIZE` rows.
+    """
+
+    lines: list[bytes] = []
+    async for row in rows:
+        lines.append(dumps(row))
+        if len(lines) >= EXPORT_CHUNK_SIZE:
+            yield b"\n".join(lines) + b"\n"
+            lines.clear()
+
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def _msgpack_chunks(rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Function encoding the rows as a stream of MessagePack maps in chunks.
+
+    Args:
+        rows (AsyncIterator[dict]): The rows to encode.
+
+    Yields:
+        bytes: The encoded maps of up to `EXPORT_CHUNK_SIZE` rows.
+    """
+
+    maps: list[bytes] = []
+    async for row in rows:
+        maps.append(pack(row))
+        if len(maps) >= EXPORT_CHUNK_SIZE:
+            yield b"".join(maps)
+            maps.clear()
+
+    if maps:
+        yield b"".join(maps)
+
+
+async def _csv_chunks(
+    rows: AsyncIterator[dict],
+    columns: list[str],
+) -> AsyncIterator[str]:
+    """Function encoding the rows as CSV with a header in chunks.
+
+    The header is written even if there are no rows.
+
+    Args:
+        rows (AsyncIterator[dict]): The rows to encode.
+        columns (list[str]): The names of the columns.
+
+    Yields:
+        str: The encoded lines of up to `EXPORT_CHUNK_SIZE` rows.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    count = 0
+
+    async for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_export(
+    rows: AsyncIterator[dict],
+    export_format: ExportFormat,
+    filename: str,
+    model: type[BaseModel],
+) -> StreamingResponse:
+    """Function streaming the rows as a downloadable file.
+
+    Args:
+        rows (AsyncIterator[dict]): The rows to export.
+        export_format (ExportFormat): The format of the file.
+        filename (str): The file name without the extension.
+        model (type[BaseModel]): The model describing the Arrow and CSV
+            columns.
+
+    Returns:
+        StreamingResponse: The response encoding rows while they arrive.
+    """
+
+    if export_format is ExportFormat.CSV:
+        columns = [column for column, _, _ in flat_fields(model)]
+        chunks: AsyncIterator = _csv_chunks(rows, columns)
+    elif export_format is ExportFormat.MSGPACK:
+        chunks = _msgpack_chunks(rows)
+    elif export_format is ExportFormat.ARROW:
+        chunks = arrow_chunks(rows, model, EXPORT_CHUNK_SIZE)
+    else:
+        chunks = _ndjson_chunks(rows)
+
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="{filename}.{export_format.value}"',
+        },
+    )
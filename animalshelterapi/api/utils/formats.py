@@ -0,0 +1,284 @@
+"""A module containing the binary MessagePack and Arrow formats."""
+
+import io
+import typing
+from datetime import date
+from enum import Enum
+from typing import Any, AsyncIterator, Sequence
+
+from pydantic import BaseModel
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import pyarrow  # type: ignore
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def available_media_types() -> list[str]:
+    """Function listing the media types in the order of server preference.
+
+    MessagePack and Arrow are offered only if their optional packages are
+    installed, JSON is always available.
+
+    Returns:
+        list[str]: The supported media types, the preferred first.
+    """
+
+    media_types = [JSON_MEDIA_TYPE]
+    if msgpack is not None:
+        media_types.append(MSGPACK_MEDIA_TYPE)
+    if pyarrow is not None:
+        media_types.append(ARROW_MEDIA_TYPE)
+
+    return media_types
+
+
+def choose_media_type(accept: str) -> str:
+    """Function picking the media type accepted by the client.
+
+    Args:
+        accept (str): The value of the `Accept` header.
+
+    Returns:
+        str: The media type with the highest client weight, ties broken by
+            server preference, JSON if nothing else is acceptable.
+    """
+
+    weights = {}
+    for part in accept.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = JSON_MEDIA_TYPE, 0.0
+    for media_type in available_media_types():
+        family = media_type.split("/")[0]
+        weight = weights.get(
+            media_type,
+            weights.get(f"{family}/*", weights.get("*/*", 0.0)),
+        )
+        if weight > best_weight:
+            best, best_weight = media_type, weight
+
+    return best
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Function converting values MessagePack does not support natively.
+
+    Args:
+        value (Any): The value to convert.
+
+    Raises:
+        TypeError: If the value cannot be serialized.
+
+    Returns:
+        Any: The MessagePack compatible value.
+    """
+
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+
+    if isinstance(value, date):
+        return value.isoformat()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if hasattr(value, "items"):
+        return dict(value.items())
+
+    raise TypeError(f"{type(value).__name__} is not MessagePack serializable")
+
+
+def pack(content: Any) -> bytes:
+    """Function encoding the content as MessagePack.
+
+    Dates are encoded as ISO strings, the same as in JSON.
+
+    Args:
+        content (Any): The models, rows or plain values to encode.
+
+    Returns:
+        bytes: The encoded content.
+    """
+
+    return msgpack.packb(content, default=_msgpack_default)
+
+
+def _arrow_type(annotation: Any) -> Any:
+    """Function mapping a field annotation to the Arrow type.
+
+    Args:
+        annotation (Any): The annotation, optionally wrapped in `Optional`.
+
+    Returns:
+        Any: The Arrow data type.
+    """
+
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if args:
+        annotation = args[0]
+
+    if not isinstance(annotation, type):
+        return pyarrow.string()
+    if issubclass(annotation, bool):
+        return pyarrow.bool_()
+    if issubclass(annotation, int):
+        return pyarrow.int64()
+    if issubclass(annotation, float):
+        return pyarrow.float64()
+    if issubclass(annotation, date):
+        return pyarrow.date32()
+
+    return pyarrow.string()
+
+
+def flat_fields(
+    model: type[BaseModel],
+    prefix: str = "",
+) -> list[tuple[str, tuple[str, ...], Any]]:
+    """Function flattening the fields of the model and its nested models.
+
+    Nested fields are named with the `{field}_` prefix, the same as the
+    labelled columns of the joined queries and exports.
+
+    Args:
+        model (type[BaseModel]): The model to flatten.
+        prefix (str): The prefix of the column names.
+
+    Returns:
+        list[tuple[str, tuple[str, ...], Any]]: The column name, the path
+            of attributes and the annotation of every leaf field.
+    """
+
+    fields = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            fields.extend(
+                (column, (name, *path), leaf)
+                for column, path, leaf in flat_fields(annotation, f"{prefix}{name}_")
+            )
+        else:
+            fields.append((f"{prefix}{name}", (name,), annotation))
+
+    return fields
+
+
+def arrow_schema(model: type[BaseModel]) -> Any:
+    """Function building the flat Arrow schema of the model.
+
+    Args:
+        model (type[BaseModel]): The model of the rows.
+
+    Returns:
+        Any: The `pyarrow.Schema` of the rows.
+    """
+
+    return pyarrow.schema([
+        (column, _arrow_type(annotation))
+        for column, _, annotation in flat_fields(model)
+    ])
+
+
+def _resolve(item: Any, path: tuple[str, ...]) -> Any:
+    """Function reading the nested attribute of the item.
+
+    Args:
+        item (Any): The model instance.
+        path (tuple[str, ...]): The names of the nested attributes.
+
+    Returns:
+        Any: The attribute value.
+    """
+
+    for name in path:
+        item = getattr(item, name)
+
+    return item
+
+
+def arrow_table(items: Sequence[BaseModel], model: type[BaseModel]) -> bytes:
+    """Function encoding the models as an Arrow IPC stream.
+
+    Each column is built directly from the model attributes, without
+    dumping the models to dicts first.
+
+    Args:
+        items (Sequence[BaseModel]): The models to encode.
+        model (type[BaseModel]): The model of the items.
+
+    Returns:
+        bytes: The Arrow IPC stream with one record batch.
+    """
+
+    schema = arrow_schema(model)
+    batch = pyarrow.RecordBatch.from_arrays(
+        [
+            pyarrow.array([_resolve(item, path) for item in items], type=arrow_type)
+            for (_, path, _), arrow_type in zip(flat_fields(model), schema.types)
+        ],
+        schema=schema,
+    )
+
+    sink = io.BytesIO()
+    with pyarrow.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+
+    return sink.getvalue()
+
+
+async def arrow_chunks(
+    rows: AsyncIterator[dict],
+    model: type[BaseModel],
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """Function encoding the rows as an Arrow IPC stream in chunks.
+
+    Every chunk of rows becomes one record batch built directly from the
+    fetched columns.
+
+    Args:
+        rows (AsyncIterator[dict]): The flat rows to encode.
+        model (type[BaseModel]): The model describing the columns.
+        chunk_size (int): The number of rows per record batch.
+
+    Yields:
+        bytes: The parts of the stream.
+    """
+
+    schema = arrow_schema(model)
+    sink = io.BytesIO()
+    writer = pyarrow.ipc.new_stream(sink, schema)
+    chunk: list[dict] = []
+
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            writer.write_batch(pyarrow.RecordBatch.from_pylist(chunk, schema=schema))
+            chunk.clear()
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+
+    if chunk:
+        writer.write_batch(pyarrow.RecordBatch.from_pylist(chunk, schema=schema))
+    writer.close()
+    yield sink.getvalue()
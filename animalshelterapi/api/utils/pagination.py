@@ -0,0 +1,160 @@
+"""A module containing keyset pagination helpers for list endpoints."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from animalshelterapi.utils.consts import DEFAULT_PAGE_SIZE, MAX_ID, MAX_PAGE_SIZE
+
+ItemT = TypeVar("ItemT")
+
+
+class Page(BaseModel, Generic[ItemT]):
+    """Model representing a single page of a list endpoint."""
+    items: list[ItemT]
+    next: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class PageQuery:
+    """A class representing requested page position and size."""
+    limit: int
+    after: Optional[dict] = None
+
+    @property
+    def after_id(self) -> int:
+        """The id of the last row of the previous page, 0 on the first page."""
+
+        return self.after["id"] if self.after else 0
+
+    def after_value(self, value_type: Any) -> Any:
+        """A method reading the sort key of the last row of the previous page.
+
+        The value is validated strictly, so a cursor issued for another
+        sort field is rejected instead of resuming at an unrelated row.
+
+        Args:
+            value_type (Any): The type of the sort key.
+
+        Raises:
+            HTTPException: 400 if the value is missing or does not match
+                the type.
+
+        Returns:
+            Any: The sort key value, None on the first page.
+        """
+
+        if not self.after:
+            return None
+
+        try:
+            return TypeAdapter(value_type).validate_json(
+                json.dumps(self.after.get("value")),
+                strict=True,
+            )
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def encode_cursor(values: dict) -> str:
+    """Function encoding keyset values into an opaque cursor.
+
+    Args:
+        values (dict): The keyset values of the last returned row.
+
+    Returns:
+        str: The opaque cursor.
+    """
+
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Function decoding an opaque cursor into keyset values.
+
+    Args:
+        cursor (str): The opaque cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        dict: The keyset values of the last returned row.
+    """
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    last_id = values.get("id")
+    if (
+        not isinstance(last_id, int)
+        or isinstance(last_id, bool)
+        or not 0 <= last_id <= MAX_ID
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
+
+
+def get_page_query(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PageQuery:
+    """A dependency parsing pagination query parameters.
+
+    Args:
+        cursor (Optional[str]): The `next` cursor of the previous page.
+        limit (int): The maximum number of items on the page.
+
+    Returns:
+        PageQuery: The requested page.
+    """
+
+    return PageQuery(
+        limit=limit,
+        after=decode_cursor(cursor) if cursor else None,
+    )
+
+
+def build_page(
+    items: Sequence[Any],
+    limit: int,
+    sort_key: Optional[str] = None,
+) -> dict:
+    """Function building a page from rows fetched with `limit + 1`.
+
+    The extra row only signals that a next page exists and is not returned.
+
+    Args:
+        items (Sequence[Any]): The fetched items ordered by the keyset.
+        limit (int): The requested page size.
+        sort_key (Optional[str]): The attribute sorted on before the id.
+
+    Returns:
+        dict: The page items and the cursor of the next page.
+    """
+
+    items = list(items)
+    if len(items) <= limit:
+        return {"items": items, "next": None}
+
+    items = items[:limit]
+    last = items[-1]
+    values = {"id": last.id}
+    if sort_key:
+        values["value"] = getattr(last, sort_key)
+
+    return {"items": items, "next": encode_cursor(values)}
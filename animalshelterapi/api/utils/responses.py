@@ -0,0 +1,161 @@
+"""A module containing the fast JSON and the binary response paths."""
+
+from typing import Any, Callable, get_args
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from animalshelterapi.api.utils.formats import (
+    ARROW_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    arrow_table,
+    available_media_types,
+    choose_media_type,
+    pack,
+)
+from animalshelterapi.api.utils.pagination import Page
+from animalshelterapi.config import config
+from animalshelterapi.utils.timing import measure
+
+
+def _fallback(value: Any) -> Any:
+    """Function converting values the encoder does not know.
+
+    Args:
+        value (Any): The value to convert, such as a fetched row.
+
+    Raises:
+        TypeError: If the value cannot be serialized.
+
+    Returns:
+        Any: The JSON compatible value.
+    """
+
+    if hasattr(value, "items"):
+        return dict(value.items())
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Function encoding the content as compact JSON.
+
+    The encoder of `pydantic_core` walks dicts, lists, dates and enums
+    natively and dumps models with their compiled serializer without
+    validating them again. Fetched rows are read as mappings.
+
+    Args:
+        content (Any): The models, rows or plain values to encode.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+
+    return to_json(content, fallback=_fallback)
+
+
+class FastJSONResponse(JSONResponse):
+    """A class rendering the content with `dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        """The method encoding the content of the response.
+
+        Args:
+            content (Any): The content to encode.
+
+        Returns:
+            bytes: The encoded body.
+        """
+
+        return dumps(content)
+
+
+Responder = Callable[..., Any]
+
+
+def _page_item_model(request: Request) -> type[BaseModel] | None:
+    """Function getting the item model of the paginated endpoint.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        type[BaseModel] | None: The model of the page items, or None if
+            the endpoint does not return a page.
+    """
+
+    response_model = getattr(request.scope.get("route"), "response_model", None)
+    if not (isinstance(response_model, type) and issubclass(response_model, Page)):
+        return None
+
+    return get_args(response_model.model_fields["items"].annotation)[0]
+
+
+def get_responder(request: Request, response: Response) -> Responder:
+    """Function creating a dependency building the endpoint result.
+
+    Clients asking for MessagePack, or for Arrow on paginated endpoints,
+    get the content encoded in that format. For JSON with `FAST_RESPONSES`
+    disabled the content is returned unchanged and FastAPI validates it
+    against `response_model`. Otherwise the content is encoded right away,
+    skipping that second validation. The headers set by other dependencies
+    are carried over.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        response (Response): The response shared by the dependencies.
+
+    Returns:
+        Responder: The function wrapping the endpoint result.
+    """
+
+    media_type = choose_media_type(request.headers.get("accept", ""))
+    item_model = _page_item_model(request)
+    if media_type == ARROW_MEDIA_TYPE and item_model is None:
+        media_type = JSON_MEDIA_TYPE
+    if len(available_media_types()) > 1:
+        response.headers.add_vary_header("Accept")
+
+    def respond(content: Any, status_code: int = 200) -> Any:
+        """The function wrapping the endpoint result.
+
+        Args:
+            content (Any): The models, records or plain values to return.
+            status_code (int): The status of the response.
+
+        Returns:
+            Any: The content itself or the encoded response.
+        """
+
+        headers = dict(response.headers)
+        if media_type == MSGPACK_MEDIA_TYPE:
+            with measure("ser"):
+                return Response(
+                    pack(content),
+                    status_code=status_code,
+                    headers=headers,
+                    media_type=media_type,
+                )
+
+        if media_type == ARROW_MEDIA_TYPE:
+            if content["next"]:
+                headers["X-Next-Cursor"] = content["next"]
+
+            with measure("ser"):
+                return Response(
+                    arrow_table(content["items"], item_model),
+                    status_code=status_code,
+                    headers=headers,
+                    media_type=media_type,
+                )
+
+        if not config.FAST_RESPONSES:
+            return content
+
+        with measure("ser"):
+            return FastJSONResponse(content, status_code=status_code, headers=headers)
+
+    return respond
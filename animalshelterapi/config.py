@@ -1,6 +1,6 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,37 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = "animalshelter"
     DB_USER: Optional[str] = "postgres"
     DB_PASSWORD: Optional[str] = "passx"
+    DB_BACKEND: Literal["postgres", "memory", "sqlite"] = "postgres"
+    DB_SQLITE_PATH: str = "animalshelter.db"
+
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_ECHO: bool = False
+
+    CACHE_ENABLED: bool = True
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    CACHE_MAX_SIZE: int = 10000
+    CACHE_TTL: float = 30.0
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_INVALIDATION_CHANNEL: Optional[str] = "animalshelter_invalidation"
+
+    FAST_RESPONSES: bool = False
+
+    REPORT_SNAPSHOT_INTERVAL: Optional[float] = 300.0
+    REPORT_RECONCILE_INTERVAL: Optional[float] = 60.0
+
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_OFFLOAD_SIZE: int = 65536
+
+    SERVER_TIMING_ENABLED: bool = True
+    METRICS_ENABLED: bool = True
+    LOG_LEVEL: str = "INFO"
 
 
 config = AppConfig()
@@ -1,55 +1,153 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Factory, Object, Selector, Singleton
 
+from animalshelterapi.config import config
+from animalshelterapi.db import table_versions
 from animalshelterapi.infrastructure.repositories.animaldb import \
     AnimalRepository
+from animalshelterapi.infrastructure.repositories.animalmock import \
+    AnimalMockRepository
 from animalshelterapi.infrastructure.repositories.adopterdb import \
     AdopterRepository
+from animalshelterapi.infrastructure.repositories.adoptermock import \
+    AdopterMockRepository
 from animalshelterapi.infrastructure.repositories.adoptiondb import \
     AdoptionRepository
+from animalshelterapi.infrastructure.repositories.adoptionmock import \
+    AdoptionMockRepository
 from animalshelterapi.infrastructure.repositories.medicalrecorddb import \
     MedicalRecordRepository
+from animalshelterapi.infrastructure.repositories.medicalrecordmock import \
+    MedicalRecordMockRepository
 from animalshelterapi.infrastructure.repositories.reportdb import ReportRepository
+from animalshelterapi.infrastructure.repositories.reportmock import \
+    ReportMockRepository
 from animalshelterapi.infrastructure.services.adopter import AdopterService
 from animalshelterapi.infrastructure.services.adoption import AdoptionService
 from animalshelterapi.infrastructure.services.animal import AnimalService
 from animalshelterapi.infrastructure.services.medicalrecord import MedicalRecordService
 from animalshelterapi.infrastructure.services.report import ReportService
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+from animalshelterapi.infrastructure.utils.cachebackend import MemoryCacheBackend
+from animalshelterapi.infrastructure.utils.invalidation import InvalidationListener
+from animalshelterapi.infrastructure.utils.rediscache import RedisCacheBackend
+from animalshelterapi.infrastructure.utils.rolling import rolling_counters
+from animalshelterapi.infrastructure.utils.scheduler import (
+    CounterReconciler,
+    ReportScheduler,
+)
+from animalshelterapi.infrastructure.utils.singleflight import SingleFlight
 
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
-    animal_repository = Singleton(AnimalRepository)
-    adopter_repository = Singleton(AdopterRepository)
-    adoption_repository = Singleton(AdoptionRepository)
-    medical_record_repository = Singleton(MedicalRecordRepository)
-    report_repository = Singleton(ReportRepository)
+    db_backend = Object(config.DB_BACKEND)
+    animal_repository = Selector(
+        db_backend,
+        postgres=Singleton(AnimalRepository),
+        sqlite=Singleton(AnimalRepository),
+        memory=Singleton(AnimalMockRepository),
+    )
+    adopter_repository = Selector(
+        db_backend,
+        postgres=Singleton(AdopterRepository),
+        sqlite=Singleton(AdopterRepository),
+        memory=Singleton(AdopterMockRepository),
+    )
+    adoption_repository = Selector(
+        db_backend,
+        postgres=Singleton(AdoptionRepository),
+        sqlite=Singleton(AdoptionRepository),
+        memory=Singleton(AdoptionMockRepository),
+    )
+    medical_record_repository = Selector(
+        db_backend,
+        postgres=Singleton(MedicalRecordRepository),
+        sqlite=Singleton(MedicalRecordRepository),
+        memory=Singleton(MedicalRecordMockRepository),
+    )
+    report_repository = Selector(
+        db_backend,
+        postgres=Singleton(ReportRepository),
+        sqlite=Singleton(ReportRepository),
+        memory=Singleton(ReportMockRepository),
+    )
+
+    single_flight = Singleton(SingleFlight)
+    cache_backend = Selector(
+        Object(config.CACHE_BACKEND),
+        memory=Singleton(
+            MemoryCacheBackend,
+            max_size=config.CACHE_MAX_SIZE,
+            ttl=config.CACHE_TTL,
+        ),
+        redis=Singleton(
+            RedisCacheBackend,
+            ttl=config.CACHE_TTL,
+            url=config.CACHE_REDIS_URL,
+        ),
+    )
+    read_cache = Singleton(
+        ReadCache,
+        backend=cache_backend,
+        single_flight=single_flight,
+        enabled=config.CACHE_ENABLED,
+    )
+    invalidation_listener = Singleton(
+        InvalidationListener,
+        cache=read_cache,
+        versions=Object(table_versions),
+        dsn=(
+            f"postgresql://{config.DB_USER}:{config.DB_PASSWORD}"
+            f"@{config.DB_HOST}/{config.DB_NAME}"
+        ),
+        channel=(
+            config.CACHE_INVALIDATION_CHANNEL
+            if config.DB_BACKEND == "postgres" else None
+        ),
+    )
 
     animal_service = Factory(
         AnimalService,
         repository=animal_repository,
+        cache=read_cache,
     )
 
     adopter_service = Factory(
         AdopterService,
         repository=adopter_repository,
+        cache=read_cache,
     )
 
     adoption_service = Factory(
         AdoptionService,
         repository=adoption_repository,
+        cache=read_cache,
     )
 
     medical_record_service = Factory(
         MedicalRecordService,
         repository=medical_record_repository,
+        cache=read_cache,
     )
 
     report_service = Factory(
         ReportService,
         repository=report_repository,
+        counters=Object(rolling_counters),
+        versions=Object(table_versions),
+    )
+    report_scheduler = Singleton(
+        ReportScheduler,
+        service=report_service,
+        interval=config.REPORT_SNAPSHOT_INTERVAL,
+    )
+    counter_reconciler = Singleton(
+        CounterReconciler,
+        service=report_service,
+        interval=config.REPORT_RECONCILE_INTERVAL,
     )
 
 
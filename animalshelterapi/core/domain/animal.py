@@ -1,6 +1,7 @@
 """Module containing animal-related domain models."""
 
 from datetime import date
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -22,4 +23,33 @@ class Animal(AnimalIn):
     """Model representing animal's attributes in the database."""
     id: int
 
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class AnimalSortField(str, Enum):
+    """Enum representing animal attributes available for sorting."""
+    ID = "id"
+    NAME = "name"
+    AGE = "age"
+    ARRIVAL_DATE = "arrival_date"
+
+
+class SortOrder(str, Enum):
+    """Enum representing sorting direction."""
+    ASC = "asc"
+    DESC = "desc"
+
+
+class AnimalSearch(BaseModel):
+    """Model representing animal search criteria."""
+    name: Optional[str] = None
+    species: Optional[str] = None
+    breed: Optional[str] = None
+    gender: Optional[str] = None
+    adoption_status: Optional[str] = None
+    min_age: Optional[int] = None
+    max_age: Optional[int] = None
+    arrived_from: Optional[date] = None
+    arrived_to: Optional[date] = None
+    sort_by: AnimalSortField = AnimalSortField.ID
+    order: SortOrder = SortOrder.ASC
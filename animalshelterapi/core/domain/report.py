@@ -1,11 +1,19 @@
 """Module containing report-related domain models."""
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Mapping, Optional
 
 from pydantic import BaseModel, ConfigDict
 
 
+class ReportTopic(str, Enum):
+    """Enum representing the topics of the generated reports."""
+    ADOPTIONS = "Adoptions Report"
+    MEDICAL_RECORDS = "Medical records Report"
+    ANIMALS = "Animals in shelter Report"
+
+
 class ReportIn(BaseModel):
     """Model representing report's DTO attributes."""
     topic: str
@@ -17,4 +25,127 @@ class Report(ReportIn):
     """Model representing report's attributes in the database."""
     id: int
 
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class HistogramBucket(str, Enum):
+    """Enum representing supported histogram bucket sizes."""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+    def count(self, start: date, end: date) -> int:
+        """The method counting the buckets covering the date range.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+
+        Returns:
+            int: The number of buckets, 0 if the range is empty.
+        """
+
+        if end < start:
+            return 0
+        if self is HistogramBucket.DAY:
+            return (end - start).days + 1
+        if self is HistogramBucket.WEEK:
+            return (end - start).days // 7 + (end.weekday() < start.weekday()) + 1
+
+        return (end.year - start.year) * 12 + end.month - start.month + 1
+
+    def truncate(self, day: date) -> date:
+        """The method getting the start of the bucket containing the day.
+
+        Weeks start on Monday, the same as `date_trunc`.
+
+        Args:
+            day (date): The day to truncate.
+
+        Returns:
+            date: The first day of the bucket.
+        """
+
+        if self is HistogramBucket.DAY:
+            return day
+        if self is HistogramBucket.WEEK:
+            return day - timedelta(days=day.weekday())
+
+        return day.replace(day=1)
+
+    def starts(self, start: date, end: date) -> list[date]:
+        """The method listing the starts of the buckets covering the date range.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+
+        Returns:
+            list[date]: The first days of the buckets in ascending order.
+        """
+
+        starts = []
+        current = self.truncate(start)
+        while current <= end:
+            starts.append(current)
+            if self is HistogramBucket.MONTH:
+                current = (current + timedelta(days=31)).replace(day=1)
+            else:
+                current += timedelta(days=7 if self is HistogramBucket.WEEK else 1)
+
+        return starts
+
+
+class HistogramBin(BaseModel):
+    """Model representing the counts of a single histogram bucket."""
+    start: date
+    arrivals: int
+    adoptions: int
+    medical_visits: int
+
+
+class Histogram(BaseModel):
+    """Model representing the counts of a date range split into buckets."""
+    bucket: HistogramBucket
+    start: date
+    end: date
+    bins: list[HistogramBin]
+
+    @classmethod
+    def from_days(
+        cls,
+        bucket: HistogramBucket,
+        start: date,
+        end: date,
+        days: Mapping[str, Mapping[date, int]],
+    ) -> "Histogram":
+        """The method summing the daily counts into the buckets of the range.
+
+        Args:
+            bucket (HistogramBucket): The size of the buckets.
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+            days (Mapping[str, Mapping[date, int]]): The numbers of rows
+                per day of the range, keyed by the count field of the bins.
+
+        Returns:
+            Histogram: The counts per bucket.
+        """
+
+        bins = {
+            bin_start: {"arrivals": 0, "adoptions": 0, "medical_visits": 0}
+            for bin_start in bucket.starts(start, end)
+        }
+        for field, counts in days.items():
+            for day, count in counts.items():
+                bins[bucket.truncate(day)][field] += count
+
+        return cls(
+            bucket=bucket,
+            start=start,
+            end=end,
+            bins=[
+                HistogramBin(start=bin_start, **counts)
+                for bin_start, counts in bins.items()
+            ],
+        )
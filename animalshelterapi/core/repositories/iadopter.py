@@ -1,7 +1,7 @@
 """Module containing adopter repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.adoption import AdopterIn
 
@@ -21,35 +21,76 @@ class IAdopterRepository(ABC):
         """
 
     @abstractmethod
-    async def get_adopter_by_last_name(self, last_name: str) -> Iterable[Any]:
+    async def get_adopters_by_ids(self, adopter_ids: Sequence[int]) -> Iterable[Any]:
+        """The abstract getting adopters by many ids from the data storage.
+
+        Args:
+            adopter_ids (Sequence[int]): The ids of the adopters.
+
+        Returns:
+            Iterable[Any]: The adopters found, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_adopter_by_last_name(
+        self,
+        last_name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting an adopter from the data storage.
 
         Args:
             last_name (str): The last name of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The collection of the adopters.
         """
 
     @abstractmethod
-    async def get_adopter_by_phone_number(self, phone_number: str) -> Iterable[Any]:
+    async def get_adopter_by_phone_number(
+        self,
+        phone_number: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting an adopter from the data storage.
 
         Args:
             phone_number (str): The phone number of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The collection of the adopters.
         """
 
     @abstractmethod
-    async def get_all_adopters(self) -> Iterable[Any]:
+    async def get_all_adopters(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting all adopters from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: The collection of the all adopters.
         """
 
+    @abstractmethod
+    def export_adopters(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all adopters from the data storage.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The adopter rows ordered by id.
+        """
+
     @abstractmethod
     async def add_adopter(self, data: AdopterIn) -> Any | None:
         """The abstract adding new adopter to the data storage.
@@ -61,6 +102,17 @@ class IAdopterRepository(ABC):
             Any | None: The newly created adopter.
         """
 
+    @abstractmethod
+    async def add_adopters(self, data: Sequence[AdopterIn]) -> list[int]:
+        """The abstract adding many new adopters to the data storage at once.
+
+        Args:
+            data (Sequence[AdopterIn]): The attributes of the adopters.
+
+        Returns:
+            list[int]: The ids of the created adopters in input order.
+        """
+
     @abstractmethod
     async def update_adopter(
         self,
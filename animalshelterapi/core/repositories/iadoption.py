@@ -1,7 +1,7 @@
 """Module containing adoption repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.adoption import AdoptionIn
 
@@ -10,30 +10,52 @@ class IAdoptionRepository(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_all_adoptions(self) -> Iterable[Any]:
+    async def get_all_adoptions(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting all adoptions from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: Adoptions in the data storage.
         """
 
     @abstractmethod
-    async def get_by_animal_id(self, animal_id: int) -> Iterable[Any]:
+    async def get_by_animal_id(
+        self,
+        animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting adoptions assigned to particular animal.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: Adoptions assigned to an animal.
         """
 
     @abstractmethod
-    async def get_by_adopter_id(self, adopter_id: int) -> Iterable[Any]:
+    async def get_by_adopter_id(
+        self,
+        adopter_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting adoptions assigned to particular adopter.
 
         Args:
             adopter_id (int): The id of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: Adoptions assigned to an adopter.
@@ -50,6 +72,26 @@ class IAdoptionRepository(ABC):
             Any | None: The adoption details.
         """
 
+    @abstractmethod
+    async def get_by_ids(self, adoption_ids: Sequence[int]) -> Iterable[Any]:
+        """The abstract getting adoptions by many ids from the data storage.
+
+        Args:
+            adoption_ids (Sequence[int]): The ids of the adoptions.
+
+        Returns:
+            Iterable[Any]: The adoptions found, in no particular order.
+        """
+
+    @abstractmethod
+    def export_adoptions(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all adoptions from the data storage.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The adoption rows with the animal and
+                adopter columns, ordered by id.
+        """
+
     @abstractmethod
     async def add_adoption(self, data: AdoptionIn) -> Any | None:
         """The abstract adding new adoption to the data storage.
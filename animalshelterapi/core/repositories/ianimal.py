@@ -1,9 +1,9 @@
 """Module containing animal repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
-from animalshelterapi.core.domain.animal import AnimalIn
+from animalshelterapi.core.domain.animal import AnimalIn, AnimalSearch
 
 
 class IAnimalRepository(ABC):
@@ -21,68 +21,152 @@ class IAnimalRepository(ABC):
         """
 
     @abstractmethod
-    async def get_animal_by_name(self, name: str) -> Iterable[Any]:
+    async def get_animals_by_ids(self, animal_ids: Sequence[int]) -> Iterable[Any]:
+        """The abstract getting animals by many ids from the data storage.
+
+        Args:
+            animal_ids (Sequence[int]): The ids of the animals.
+
+        Returns:
+            Iterable[Any]: The animals found, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_animal_by_name(
+        self,
+        name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting animals from the data storage.
 
         Args:
             name (str): The name of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
     @abstractmethod
-    async def get_animal_by_species(self, species: str) -> Iterable[Any]:
+    async def get_animal_by_species(
+        self,
+        species: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting animals from the data storage.
 
         Args:
             species (str): The species of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
     @abstractmethod
-    async def get_animal_by_breed(self, breed: str) -> Iterable[Any]:
+    async def get_animal_by_breed(
+        self,
+        breed: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting animals from the data storage.
 
         Args:
             breed (str): The breed of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
     @abstractmethod
-    async def get_animal_by_gender(self, gender: str) -> Iterable[Any]:
+    async def get_animal_by_gender(
+        self,
+        gender: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting animals from the data storage.
 
         Args:
             gender (str): The gender of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
     @abstractmethod
-    async def get_animal_by_adoption_status(self, adoption_status: str) -> Iterable[Any]:
+    async def get_animal_by_adoption_status(
+        self,
+        adoption_status: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting animals from the data storage.
 
         Args:
              adoption_status (str): The adoption status of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
          Returns:
             Iterable[Any]: The animal data if exists.
         """
 
     @abstractmethod
-    async def get_all_animals(self) -> Iterable[Any]:
+    async def get_all_animals(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting all animals from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: The collection of the all animals.
         """
 
+    @abstractmethod
+    async def search_animals(
+        self,
+        criteria: AnimalSearch,
+        after_value: Any = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
+        """The abstract searching animals in the data storage.
+
+        Args:
+            criteria (AnimalSearch): The filters and the sort order.
+            after_value (Any): The sort key of the row after which
+                the collection starts.
+            after_id (int | None): The id of the row after which
+                the collection starts.
+            limit (int | None): The maximum number of items.
+
+        Returns:
+            Iterable[Any]: The collection of the matching animals.
+        """
+
+    @abstractmethod
+    def export_animals(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all animals from the data storage.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The animal rows ordered by id.
+        """
+
     @abstractmethod
     async def add_animal(self, data: AnimalIn) -> Any | None:
         """The abstract adding new continent to the data storage.
@@ -94,6 +178,17 @@ class IAnimalRepository(ABC):
             Any | None: The newly created continent.
         """
 
+    @abstractmethod
+    async def add_animals(self, data: Sequence[AnimalIn]) -> list[int]:
+        """The abstract adding many new animals to the data storage at once.
+
+        Args:
+            data (Sequence[AnimalIn]): The attributes of the animals.
+
+        Returns:
+            list[int]: The ids of the created animals in input order.
+        """
+
     @abstractmethod
     async def update_animal(
         self,
@@ -1,7 +1,7 @@
 """Module containing medical record repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.medicalrecord import MedicalRecordIn
 
@@ -21,9 +21,28 @@ class IMedicalRecordRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all_medical_records(self) -> Iterable[Any]:
+    async def get_medical_records_by_ids(self, medical_record_ids: Sequence[int]) -> Iterable[Any]:
+        """The abstract getting medical records by many ids from the data storage.
+
+        Args:
+            medical_record_ids (Sequence[int]): The ids of the medical records.
+
+        Returns:
+            Iterable[Any]: The medical records found, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_all_medical_records(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The abstract getting all medical records from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: The collection of the all medical records.
         """
@@ -32,17 +51,29 @@ class IMedicalRecordRepository(ABC):
     async def get_medical_record_by_animal_id(
         self,
         animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
     ) -> Iterable[Any]:
         """The abstract getting all provided animal's medical records
             from the data storage.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The collection of the medical records.
         """
 
+    @abstractmethod
+    def export_medical_records(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all medical records from the data storage.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The medical record rows ordered by id.
+        """
+
     @abstractmethod
     async def add_medical_record(self, data: MedicalRecordIn) -> Any | None:
         """The abstract adding new medical record to the data storage.
@@ -54,6 +85,18 @@ class IMedicalRecordRepository(ABC):
             Any | None: The newly created medical record.
         """
 
+    @abstractmethod
+    async def add_medical_records(self, data: Sequence[MedicalRecordIn]) -> list[int | None]:
+        """The abstract adding many new medical records to the data storage at once.
+
+        Args:
+            data (Sequence[MedicalRecordIn]): The attributes of the medical records.
+
+        Returns:
+            list[int | None]: The ids of the created medical records
+                in input order, None where the animal does not exist.
+        """
+
     @abstractmethod
     async def update_medical_record(
         self,
@@ -1,9 +1,16 @@
 """Module containing animal repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from datetime import date, datetime
+from typing import Any, Iterable, Sequence
 
 from animalshelterapi.core.domain.animal import AnimalIn
+from animalshelterapi.core.domain.report import (
+    Histogram,
+    HistogramBucket,
+    ReportIn,
+    ReportTopic,
+)
 
 
 class IReportRepository(ABC):
@@ -36,3 +43,73 @@ class IReportRepository(ABC):
             Iterable[Any]: Report
         """
 
+    @abstractmethod
+    async def get_daily_counts(self, since: date) -> dict[str, dict[date, int]]:
+        """The abstract counting arrivals, adoptions and medical visits
+         per day in the data storage.
+
+        Args:
+            since (date): The first counted day.
+
+        Returns:
+            dict[str, dict[date, int]]: The numbers of rows per day,
+                keyed by table.
+        """
+
+    @abstractmethod
+    async def get_histogram(
+        self,
+        start: date,
+        end: date,
+        bucket: HistogramBucket,
+    ) -> Histogram:
+        """The abstract getting the numbers of arrivals, adoptions and
+         medical visits per bucket from the data storage.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+            bucket (HistogramBucket): The size of the buckets.
+
+        Returns:
+            Histogram: The counts per bucket.
+        """
+
+    @abstractmethod
+    async def add_reports(self, data: Sequence[ReportIn]) -> Iterable[Any]:
+        """The abstract storing generated reports as snapshots
+         in the data storage.
+
+        Args:
+            data (Sequence[ReportIn]): The attributes of the reports.
+
+        Returns:
+            Iterable[Any]: The stored reports in input order.
+        """
+
+    @abstractmethod
+    async def get_latest_report(
+        self,
+        topic: ReportTopic,
+        as_of: datetime | None = None,
+    ) -> Any | None:
+        """The abstract getting the latest stored snapshot of the report
+         from the data storage.
+
+        Args:
+            topic (ReportTopic): The topic of the report.
+            as_of (datetime | None): The time the snapshot must not be
+                newer than, None for the latest one.
+
+        Returns:
+            Any | None: The snapshot if exists.
+        """
+
+    @abstractmethod
+    async def get_last_generated(self) -> datetime | None:
+        """The abstract getting the time of the latest stored snapshot
+         from the data storage.
+
+        Returns:
+            datetime | None: The creation time if any snapshot exists.
+        """
@@ -1,17 +1,34 @@
 """A module providing database access."""
 
 import asyncio
+import json
+import logging
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterable, Mapping
 
-import databases
 import sqlalchemy
+from sqlalchemy import ARRAY, Integer, any_, literal
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    create_async_engine,
+)
+from sqlalchemy.sql import ColumnElement, Executable
+from sqlalchemy.sql.dml import UpdateBase
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
 )
 
 from animalshelterapi.config import config
+from animalshelterapi.utils.consts import MAX_NOTIFY_IDS
+from animalshelterapi.utils.timing import count_query, measure, timed
+
+logger = logging.getLogger(__name__)
 
 metadata = sqlalchemy.MetaData()
 
@@ -27,6 +44,18 @@ animal_table = sqlalchemy.Table(
     sqlalchemy.Column("arrival_date", sqlalchemy.Date),
     sqlalchemy.Column("adoption_status", sqlalchemy.String),
     sqlalchemy.Column("description", sqlalchemy.String, nullable=True),
+    sqlalchemy.Index("ix_animals_name_id", "name", "id"),
+    sqlalchemy.Index("ix_animals_species_id", "species", "id"),
+    sqlalchemy.Index(
+        "ix_animals_species_adoption_status_id",
+        "species",
+        "adoption_status",
+        "id",
+    ),
+    sqlalchemy.Index("ix_animals_breed_id", "breed", "id"),
+    sqlalchemy.Index("ix_animals_gender_id", "gender", "id"),
+    sqlalchemy.Index("ix_animals_adoption_status_id", "adoption_status", "id"),
+    sqlalchemy.Index("ix_animals_arrival_date", "arrival_date"),
 )
 
 adopter_table = sqlalchemy.Table(
@@ -38,6 +67,8 @@ adopter_table = sqlalchemy.Table(
     sqlalchemy.Column("phone_number", sqlalchemy.String),
     sqlalchemy.Column("email", sqlalchemy.String),
     sqlalchemy.Column("address", sqlalchemy.String),
+    sqlalchemy.Index("ix_adopters_last_name_id", "last_name", "id"),
+    sqlalchemy.Index("ix_adopters_phone_number_id", "phone_number", "id"),
 )
 
 adoption_table = sqlalchemy.Table(
@@ -55,6 +86,9 @@ adoption_table = sqlalchemy.Table(
         nullable=False,
     ),
     sqlalchemy.Column("adoption_date", sqlalchemy.Date),
+    sqlalchemy.Index("ix_adoptions_animal_id_id", "animal_id", "id"),
+    sqlalchemy.Index("ix_adoptions_adopter_id_id", "adopter_id", "id"),
+    sqlalchemy.Index("ix_adoptions_adoption_date", "adoption_date"),
 )
 
 medical_record_table = sqlalchemy.Table(
@@ -69,24 +103,537 @@ medical_record_table = sqlalchemy.Table(
     sqlalchemy.Column("visit_date", sqlalchemy.Date),
     sqlalchemy.Column("diagnosis", sqlalchemy.String),
     sqlalchemy.Column("treatment", sqlalchemy.String, nullable=True),
+    sqlalchemy.Index("ix_medical_records_animal_id_id", "animal_id", "id"),
+    sqlalchemy.Index("ix_medical_records_visit_date", "visit_date"),
 )
 
-db_uri = (
-    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
-    f"@{config.DB_HOST}/{config.DB_NAME}"
+report_table = sqlalchemy.Table(
+    "reports",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("topic", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("content", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("created_at", sqlalchemy.DateTime, nullable=False),
+    sqlalchemy.Index("ix_reports_topic_created_at", "topic", "created_at"),
+    sqlalchemy.Index("ix_reports_created_at", "created_at"),
 )
 
+if config.DB_BACKEND == "sqlite":
+    db_uri = f"sqlite+aiosqlite:///{config.DB_SQLITE_PATH}"
+    connect_args: dict[str, Any] = {}
+else:
+    db_uri = (
+        f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+        f"@{config.DB_HOST}/{config.DB_NAME}"
+    )
+    connect_args = {
+        "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+    }
+
 engine = create_async_engine(
     db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
+    echo=config.DB_ECHO,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_recycle=config.DB_POOL_RECYCLE,
+    pool_timeout=config.DB_POOL_TIMEOUT,
+    pool_pre_ping=config.DB_POOL_PRE_PING,
+    connect_args=connect_args,
 )
 
-database = databases.Database(
-    db_uri,
-    #force_rollback=True,
-)
+
+@sqlalchemy.event.listens_for(engine.sync_engine, "connect")
+def _configure_sqlite(dbapi_connection: Any, _: Any) -> None:
+    """Function configuring every new SQLite connection.
+
+    WAL lets the readers run alongside the single writer, `NORMAL`
+    synchronous mode is durable enough with WAL and skips an fsync per
+    commit, and foreign keys are enforced as on PostgreSQL.
+
+    Args:
+        dbapi_connection (Any): The new driver connection.
+        _ (Any): The pool record of the connection.
+    """
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+@sqlalchemy.event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_statement(*_: Any) -> None:
+    """Function counting the statement towards the running request."""
+
+    count_query()
+
+
+def match_ids(column: sqlalchemy.Column, ids: Iterable[int]) -> ColumnElement[bool]:
+    """Function building the condition matching the column against many ids.
+
+    On PostgreSQL the ids are sent as one array parameter of `= ANY(...)`,
+    so the statement and its prepared plan do not depend on the number of
+    ids. Other backends use an expanding `IN`.
+
+    Args:
+        column (sqlalchemy.Column): The matched column.
+        ids (Iterable[int]): The ids to match.
+
+    Returns:
+        ColumnElement[bool]: The condition.
+    """
+
+    if engine.dialect.name == "postgresql":
+        return column == any_(literal(list(ids), ARRAY(Integer)))
+
+    return column.in_(list(ids))
+
+
+class Database:
+    """A class executing queries over the shared engine connection pool.
+
+    Single statements run in autocommit mode, so each of them costs one
+    round trip instead of being wrapped in `BEGIN` and `COMMIT`/`ROLLBACK`.
+    Work spanning several statements goes through `transaction`. The
+    statements and the transactions count towards the `db` request phase,
+    and the callers waiting for a pooled connection are counted.
+
+    SQLite ignores `FOR UPDATE`, so there the transactions take the write
+    lock upfront with `BEGIN IMMEDIATE`, keeping their reads consistent
+    with their writes.
+    """
+
+    _engine: AsyncEngine
+    _autocommit_engine: AsyncEngine
+    _waiting: int
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """The initializer of the `database`.
+
+        Args:
+            engine (AsyncEngine): The engine owning the connection pool.
+        """
+
+        self._engine = engine
+        self._autocommit_engine = engine.execution_options(
+            isolation_level="AUTOCOMMIT",
+        )
+        self._waiting = 0
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """The engine owning the connection pool."""
+
+        return self._engine
+
+    async def connect(self) -> None:
+        """A method checking that a pooled connection can be acquired."""
+
+        async with self._engine.connect():
+            pass
+
+    async def disconnect(self) -> None:
+        """A method closing all pooled connections."""
+
+        await self._engine.dispose()
+
+    def pool_stats(self) -> dict[str, int]:
+        """A method summarizing the connection pool.
+
+        Returns:
+            dict[str, int]: The configured size, the connections in use,
+                the connections beyond the size and the waiting callers.
+        """
+
+        pool: Any = self._engine.pool
+
+        return {
+            "size": pool.size() if hasattr(pool, "size") else 0,
+            "in_use": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+            "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0,
+            "waiting": self._waiting,
+        }
+
+    @asynccontextmanager
+    async def _connect(
+        self,
+        engine: AsyncEngine | None = None,
+    ) -> AsyncIterator[AsyncConnection]:
+        """A method checking out a pooled connection.
+
+        Args:
+            engine (AsyncEngine | None): The engine to connect with,
+                None for the autocommit one.
+
+        Yields:
+            AsyncConnection: The connection returned to the pool on exit.
+        """
+
+        conn = (engine or self._autocommit_engine).connect()
+        self._waiting += 1
+        try:
+            await conn.start()
+        finally:
+            self._waiting -= 1
+
+        try:
+            yield conn
+        finally:
+            await asyncio.shield(conn.close())
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncConnection]:
+        """A method providing a pooled connection inside a transaction.
+
+        Yields:
+            AsyncConnection: The connection committed on success.
+        """
+
+        with measure("db"):
+            async with self._connect(self._engine) as conn, conn.begin():
+                if conn.dialect.name == "sqlite":
+                    await conn.exec_driver_sql("BEGIN IMMEDIATE")
+                yield conn
+
+    @timed("db")
+    async def fetch_all(self, query: Executable) -> list[RowMapping]:
+        """A method fetching all rows of the query.
+
+        Args:
+            query (Executable): The query to run.
+
+        Returns:
+            list[RowMapping]: The fetched rows.
+        """
+
+        async with self._connect() as conn:
+            result = await conn.execute(query)
+
+            return list(result.mappings().all())
+
+    @timed("db")
+    async def fetch_one(self, query: Executable) -> RowMapping | None:
+        """A method fetching the first row of the query.
+
+        Args:
+            query (Executable): The query to run.
+
+        Returns:
+            RowMapping | None: The fetched row if exists.
+        """
+
+        async with self._connect() as conn:
+            result = await conn.execute(query)
+
+            return result.mappings().first()
+
+    @timed("db")
+    async def fetch_val(self, query: Executable) -> Any:
+        """A method fetching the first column of the first row of the query.
+
+        Args:
+            query (Executable): The query to run.
+
+        Returns:
+            Any: The fetched value.
+        """
+
+        async with self._connect() as conn:
+            return await conn.scalar(query)
+
+    async def stream(
+        self,
+        query: Executable,
+        chunk_size: int,
+    ) -> AsyncIterator[RowMapping]:
+        """A method iterating over the rows of the query via a server-side cursor.
+
+        Only `chunk_size` rows are held in memory at a time and the pooled
+        connection is released once the iteration ends or is closed.
+
+        Args:
+            query (Executable): The query to run.
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Yields:
+            RowMapping: The fetched rows.
+        """
+
+        async with self._connect(self._engine) as conn:
+            result = await conn.stream(
+                query.execution_options(yield_per=chunk_size),
+            )
+            async for row in result.mappings():
+                yield row
+
+    async def update_returning_previous(
+        self,
+        table: sqlalchemy.Table,
+        row_id: int,
+        values: Mapping[str, Any],
+        column: str,
+    ) -> RowMapping | None:
+        """A method updating the row and returning it with the old value of the column.
+
+        On PostgreSQL this is one statement updating the row locked by its
+        `FROM` subquery. SQLite cannot return the columns of the `FROM`
+        clause, so there the value is read and the row is updated in one
+        transaction instead.
+
+        Args:
+            table (sqlalchemy.Table): The updated table.
+            row_id (int): The id of the row.
+            values (Mapping[str, Any]): The new values of the row.
+            column (str): The name of the column whose old value is returned
+                as `previous_{column}`.
+
+        Returns:
+            RowMapping | None: The updated row if exists.
+        """
+
+        if self._engine.dialect.name == "postgresql":
+            previous = (
+                sqlalchemy.select(table.c.id, table.c[column])
+                .where(table.c.id == row_id)
+                .with_for_update()
+                .subquery()
+            )
+            query = (
+                table.update()
+                .where(table.c.id == previous.c.id)
+                .values(**values)
+                .returning(table, previous.c[column].label(f"previous_{column}"))
+            )
+
+            return await self.write(query, notify=table.name)
+
+        async with self.transaction() as conn:
+            old = await conn.scalar(
+                sqlalchemy.select(table.c[column]).where(table.c.id == row_id),
+            )
+            query = (
+                table.update()
+                .where(table.c.id == row_id)
+                .values(**values)
+                .returning(
+                    table,
+                    literal(old, table.c[column].type).label(f"previous_{column}"),
+                )
+            )
+            result = await conn.execute(query)
+
+            return result.mappings().first()
+
+    async def write(
+        self,
+        query: UpdateBase,
+        notify: str | None = None,
+    ) -> RowMapping | None:
+        """A method running the write of a single row returning the row.
+
+        With `notify`, the same statement announces the written row to the
+        other processes, so PostgreSQL delivers the notification when the
+        write commits and not at all if no row matched.
+
+        Args:
+            query (UpdateBase): The `INSERT`, `UPDATE` or `DELETE` returning
+                at least the `id` column.
+            notify (str | None): The name of the written table to announce,
+                None to only run the statement.
+
+        Returns:
+            RowMapping | None: The written row if any matched.
+        """
+
+        channel = _invalidation_channel()
+        if notify is not None and channel is not None:
+            written = query.cte("written")
+            payload = sqlalchemy.func.json_build_object(
+                "origin", table_versions.epoch,
+                "table", literal(notify, sqlalchemy.String),
+                "ids", sqlalchemy.func.json_build_array(written.c.id),
+            )
+            # `pg_notify` returns void, which is never NULL.
+            query = sqlalchemy.select(written).where(
+                sqlalchemy.func.pg_notify(
+                    channel,
+                    sqlalchemy.cast(payload, sqlalchemy.Text),
+                ).is_not(None),
+            )
+
+        return await self.fetch_one(query)
+
+    async def announce(self, conn: AsyncConnection, table: str, *ids: int) -> None:
+        """A method announcing the rows written in the transaction.
+
+        PostgreSQL delivers the notification when the transaction commits,
+        so the other processes never hear of a write that was rolled back.
+
+        Args:
+            conn (AsyncConnection): The connection of the transaction.
+            table (str): The name of the written table.
+            *ids (int): The ids of the written rows.
+        """
+
+        channel = _invalidation_channel()
+        if channel is None or not ids:
+            return
+
+        payload = json.dumps({
+            "origin": table_versions.epoch,
+            "table": table,
+            "ids": list(ids) if len(ids) <= MAX_NOTIFY_IDS else None,
+        })
+        await conn.execute(
+            sqlalchemy.select(sqlalchemy.func.pg_notify(channel, payload)),
+        )
+
+    @timed("db")
+    async def execute(self, query: Executable) -> Any:
+        """A method executing the statement without fetching rows.
+
+        Args:
+            query (Executable): The statement to run.
+
+        Returns:
+            Any: The inserted primary key for inserts, otherwise
+                the number of affected rows.
+        """
+
+        async with self._connect() as conn:
+            result = await conn.execute(query)
+
+            if result.is_insert and result.inserted_primary_key:
+                return result.inserted_primary_key[0]
+
+            return result.rowcount
+
+
+database = Database(engine)
+
+
+class TableVersions:
+    """A class counting writes to each table.
+
+    The repositories bump a table after writing to it, so readers can tell
+    whether the data changed without querying it. Versions are kept per
+    process, hence the random epoch distinguishing processes.
+    """
+
+    _epoch: str
+    _started: datetime
+    _versions: dict[str, int]
+    _modified: dict[str, datetime]
+
+    def __init__(self) -> None:
+        """The initializer of the `table versions`."""
+
+        self._epoch = uuid.uuid4().hex[:8]
+        self._started = datetime.now(timezone.utc)
+        self._versions = {}
+        self._modified = {}
+
+    @property
+    def epoch(self) -> str:
+        """The random identifier of the process."""
+
+        return self._epoch
+
+    def bump(self, *tables: str) -> None:
+        """A method recording a write to the tables.
+
+        Args:
+            *tables (str): The names of the written tables.
+        """
+
+        now = datetime.now(timezone.utc)
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+            self._modified[table] = now
+
+    def version(self, tables: Iterable[str]) -> str:
+        """A method building a validator changing with any of the tables.
+
+        Args:
+            tables (Iterable[str]): The names of the read tables.
+
+        Returns:
+            str: The epoch and the version of each table.
+        """
+
+        return "-".join(
+            [self._epoch, *(str(self._versions.get(table, 0)) for table in tables)]
+        )
+
+    def last_modified(self, tables: Iterable[str]) -> datetime:
+        """A method getting the time of the latest write to the tables.
+
+        Args:
+            tables (Iterable[str]): The names of the read tables.
+
+        Returns:
+            datetime: The time of the latest write, or the process start
+                if no write was seen.
+        """
+
+        return max(
+            (self._modified.get(table, self._started) for table in tables),
+            default=self._started,
+        )
+
+
+table_versions = TableVersions()
+
+
+def _invalidation_channel() -> str | None:
+    """Function getting the channel announcing the writes.
+
+    Only PostgreSQL has `LISTEN/NOTIFY`, the other backends serve one
+    process.
+
+    Returns:
+        str | None: The channel, None if the writes are not announced.
+    """
+
+    if config.DB_BACKEND != "postgres":
+        return None
+
+    return config.CACHE_INVALIDATION_CHANNEL or None
+
+
+def record_write(table: str) -> None:
+    """Function recording a committed write to the table in this process.
+
+    The other processes learn about the write from the notification sent
+    with it, see `Database.write` and `Database.announce`.
+
+    Args:
+        table (str): The name of the written table.
+    """
+
+    table_versions.bump(table)
+
+
+def _create_schema(connection: sqlalchemy.Connection) -> None:
+    """Function creating missing tables and indexes.
+
+    `create_all` skips tables that already exist together with their
+    indexes, so indexes declared later are created separately.
+
+    Args:
+        connection (sqlalchemy.Connection): The synchronous connection.
+    """
+    metadata.create_all(connection)
+
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 async def init_db(retries: int = 5, delay: int = 5) -> None:
@@ -100,7 +647,7 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
     for attempt in range(retries):
         try:
             async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
+                await conn.run_sync(_create_schema)
             return
         except (
             OperationalError,
@@ -108,7 +655,7 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
             CannotConnectNowError,
             ConnectionDoesNotExistError,
         ) as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
+            logger.warning("Attempt %d failed: %s", attempt + 1, e)
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
@@ -18,3 +18,9 @@ class AdopterDTO(BaseModel):
         extra="ignore",
         arbitrary_types_allowed=True,
     )
+
+
+# The DTO fields paired with their labels in joined queries.
+ADOPTER_LABELS = tuple(
+    (field, f"adopter_{field}") for field in AdopterDTO.model_fields
+)
@@ -2,11 +2,13 @@
 
 
 from datetime import date
+from typing import Iterable
+
 from asyncpg import Record  # type: ignore
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from animalshelterapi.infrastructure.dto.adopterdto import AdopterDTO
-from animalshelterapi.infrastructure.dto.animaldto import AnimalDTO
+from animalshelterapi.infrastructure.dto.adopterdto import ADOPTER_LABELS, AdopterDTO
+from animalshelterapi.infrastructure.dto.animaldto import ANIMAL_LABELS, AnimalDTO
 
 
 class AdoptionDTO(BaseModel):
@@ -30,30 +32,39 @@ class AdoptionDTO(BaseModel):
             record (Record): The DB record.
 
         Returns:
-            AirportDTO: The final DTO instance.
+            AdoptionDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            animal=AnimalDTO(
-                id=record_dict.get("id_1"),
-                name=record_dict.get("name"),
-                species=record_dict.get("species"),
-                breed=record_dict.get("breed"),
-                age=record_dict.get("age"),
-                gender=record_dict.get("gender"),
-                arrival_date=record_dict.get("arrival_date"),
-                adoption_status=record_dict.get("adoption_status"),
-                description=record_dict.get("description"),
-            ),
-            adopter=AdopterDTO(
-                id=record_dict.get("id_2"),
-                first_name=record_dict.get("first_name"),
-                last_name=record_dict.get("last_name"),
-                phone_number=record_dict.get("phone_number"),
-                email=record_dict.get("email"),
-                address=record_dict.get("address"),
-            ),
-            adoption_date=record_dict.get("adoption_date"),
-        )
+
+        return cls.from_records([record])[0]
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> list["AdoptionDTO"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        The records hold the adoption `id` and `adoption_date` followed by
+        the animal and adopter columns labelled with the `animal_` and
+        `adopter_` prefixes. The whole list is validated in one call.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            list[AdoptionDTO]: The final DTO instances.
+        """
+
+        return _adoptions_adapter.validate_python([
+            {
+                "id": record["id"],
+                "adoption_date": record["adoption_date"],
+                "animal": {
+                    field: record[label] for field, label in ANIMAL_LABELS
+                },
+                "adopter": {
+                    field: record[label] for field, label in ADOPTER_LABELS
+                },
+            }
+            for record in records
+        ])
+
+
+_adoptions_adapter = TypeAdapter(list[AdoptionDTO])
@@ -23,3 +23,9 @@ class AnimalDTO(BaseModel):
         extra="ignore",
         arbitrary_types_allowed=True,
     )
+
+
+# The DTO fields paired with their labels in joined queries.
+ANIMAL_LABELS = tuple(
+    (field, f"animal_{field}") for field in AnimalDTO.model_fields
+)
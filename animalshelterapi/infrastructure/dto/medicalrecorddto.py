@@ -2,11 +2,12 @@
 
 
 from datetime import date
-from typing import Optional
+from typing import Iterable, Optional
+
 from asyncpg import Record  # type: ignore
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from animalshelterapi.infrastructure.dto.animaldto import AnimalDTO
+from animalshelterapi.infrastructure.dto.animaldto import ANIMAL_LABELS, AnimalDTO
 
 
 class MedicalRecordDTO(BaseModel):
@@ -31,24 +32,38 @@ class MedicalRecordDTO(BaseModel):
             record (Record): The DB record.
 
         Returns:
-            AirportDTO: The final DTO instance.
+            MedicalRecordDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            animal=AnimalDTO(
-                id=record_dict.get("id_1"),
-                name=record_dict.get("name"),
-                species=record_dict.get("species"),
-                breed=record_dict.get("breed"),
-                age=record_dict.get("age"),
-                gender=record_dict.get("gender"),
-                arrival_date=record_dict.get("arrival_date"),
-                adoption_status=record_dict.get("adoption_status"),
-                description=record_dict.get("description"),
-            ),
-            visit_date = record_dict.get("visit_date"),
-            diagnosis = record_dict.get("diagnosis"),
-            treatment = record_dict.get("treatment"),
-        )
+
+        return cls.from_records([record])[0]
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> list["MedicalRecordDTO"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        The records hold the medical record columns followed by the animal
+        columns labelled with the `animal_` prefix. The whole list is
+        validated in one call.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            list[MedicalRecordDTO]: The final DTO instances.
+        """
+
+        return _medical_records_adapter.validate_python([
+            {
+                "id": record["id"],
+                "visit_date": record["visit_date"],
+                "diagnosis": record["diagnosis"],
+                "treatment": record["treatment"],
+                "animal": {
+                    field: record[label] for field, label in ANIMAL_LABELS
+                },
+            }
+            for record in records
+        ])
+
+
+_medical_records_adapter = TypeAdapter(list[MedicalRecordDTO])
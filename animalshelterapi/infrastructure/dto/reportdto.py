@@ -1,10 +1,20 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from animalshelterapi.core.domain.report import ReportTopic
+
+# The subjects of the reports, also the names of the counted tables.
+REPORT_SUBJECTS = {
+    ReportTopic.ADOPTIONS: "adoptions",
+    ReportTopic.MEDICAL_RECORDS: "medical_records",
+    ReportTopic.ANIMALS: "animals",
+}
 
 class ReportDTO(BaseModel):
     """A model representing DTO for report data."""
-    id: int
+    # None for the reports built from the counters, which are not stored.
+    id: Optional[int] = None
     topic: str
     content: str
     created_at: datetime
@@ -25,3 +35,24 @@ class ReportDTO(BaseModel):
             record['created_at'] = datetime.now()  # Default to current timestamp if missing
 
         return cls(**record)
+
+    @classmethod
+    def from_counts(
+        cls,
+        topic: ReportTopic,
+        day_count: int,
+        week_count: int,
+        month_count: int,
+    ) -> 'ReportDTO':
+        """Creates an unstored instance of ReportDTO from the counts of the last day, week and month."""
+        subject = REPORT_SUBJECTS[topic]
+
+        return cls(
+            topic=topic.value,
+            content=(
+                f"{subject}_last_day: {day_count}, "
+                f"{subject}_last_week: {week_count}, "
+                f"{subject}_last_month: {month_count}"
+            ),
+            created_at=datetime.now(),
+        )
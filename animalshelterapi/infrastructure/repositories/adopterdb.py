@@ -1,14 +1,18 @@
 """Module containing adopter database repository implementation."""
 
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from asyncpg import Record  # type: ignore
-
 from animalshelterapi.core.domain.adoption import Adopter, AdopterIn
 from animalshelterapi.core.repositories.iadopter import IAdopterRepository
-from animalshelterapi.db import adopter_table, database
+from animalshelterapi.db import adopter_table, database, match_ids, record_write
+from animalshelterapi.utils.consts import EXPORT_CHUNK_SIZE
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
 
 
+@observed_methods(repository_latency)
+@timed_methods("map")
 class AdopterRepository(IAdopterRepository):
     """A class implementing the adopter repository."""
 
@@ -26,63 +30,170 @@ class AdopterRepository(IAdopterRepository):
 
         return Adopter(**dict(adopter)) if adopter else None
 
-    async def get_adopter_by_last_name(self, last_name: str) -> Iterable[Any]:
+    async def get_adopters_by_ids(self, adopter_ids: Sequence[int]) -> Iterable[Any]:
+        """The method getting adopters by many ids from the data storage.
+
+        All ids are resolved in one query, see `match_ids`.
+
+        Args:
+            adopter_ids (Sequence[int]): The ids of the adopters.
+
+        Returns:
+            Iterable[Any]: The adopters found, in no particular order.
+        """
+
+        query = (
+            adopter_table.select()
+            .where(match_ids(adopter_table.c.id, adopter_ids))
+        )
+        adopters = await database.fetch_all(query)
+
+        return [Adopter(**dict(adopter)) for adopter in adopters]
+
+    async def get_adopter_by_last_name(
+        self,
+        last_name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting an adopter from the data storage.
 
         Args:
             last_name (str): The last name of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The collection of the adopters.
         """
 
-        query = adopter_table.select().where(adopter_table.c.last_name == last_name).order_by(adopter_table.c.id.asc())
+        query = (
+            adopter_table.select()
+            .where(adopter_table.c.last_name == last_name)
+            .where(adopter_table.c.id > after_id)
+            .order_by(adopter_table.c.id.asc())
+            .limit(limit)
+        )
         adopters = await database.fetch_all(query)
 
         return [Adopter(**dict(adopter)) for adopter in adopters]
 
-    async def get_adopter_by_phone_number(self, phone_number: str) -> Iterable[Any]:
+    async def get_adopter_by_phone_number(
+        self,
+        phone_number: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting an adopter from the data storage.
 
         Args:
             phone_number (str): The phone number of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The collection of the adopters.
         """
 
-        query = adopter_table.select().where(adopter_table.c.phone_number == phone_number).order_by(adopter_table.c.id.asc())
+        query = (
+            adopter_table.select()
+            .where(adopter_table.c.phone_number == phone_number)
+            .where(adopter_table.c.id > after_id)
+            .order_by(adopter_table.c.id.asc())
+            .limit(limit)
+        )
         adopters = await database.fetch_all(query)
 
         return [Adopter(**dict(adopter)) for adopter in adopters]
 
-    async def get_all_adopters(self) -> Iterable[Any]:
+    async def get_all_adopters(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting all adopters from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: The collection of the all adopters.
         """
 
-        query = adopter_table.select().order_by(adopter_table.c.id.asc())
+        query = (
+            adopter_table.select()
+            .where(adopter_table.c.id > after_id)
+            .order_by(adopter_table.c.id.asc())
+            .limit(limit)
+        )
         adopters = await database.fetch_all(query)
 
         return [Adopter(**dict(adopter)) for adopter in adopters]
 
-    async def add_adopter(self, data: AdopterIn) -> Any | None:
+    async def export_adopters(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all adopters from the data storage.
+
+        The rows come from a server-side cursor, so memory use does not
+        depend on the size of the table.
+
+        Yields:
+            dict[str, Any]: The adopter rows ordered by id.
+        """
+
+        query = (
+            adopter_table.select()
+            .order_by(adopter_table.c.id.asc())
+        )
+        async for row in database.stream(query, EXPORT_CHUNK_SIZE):
+            yield dict(row)
+
+    async def add_adopter(self, data: AdopterIn) -> Adopter:
         """The method adding new adopter to the data storage.
 
         Args:
             data (AdopterIn): The attributes of the adopter.
 
         Returns:
-            Any | None: The newly created adopter.
+            Adopter: The newly created adopter.
+        """
+
+        query = (
+            adopter_table.insert()
+            .values(**data.model_dump())
+            .returning(adopter_table)
+        )
+        new_adopter = await database.write(query, notify=adopter_table.name)
+        record_write(adopter_table.name)
+
+        return Adopter(**dict(new_adopter))
+
+    async def add_adopters(self, data: Sequence[AdopterIn]) -> list[int]:
+        """The method adding many new adopters to the data storage at once.
+
+        The rows are sent as batched multi-row inserts in one transaction.
+
+        Args:
+            data (Sequence[AdopterIn]): The attributes of the adopters.
+
+        Returns:
+            list[int]: The ids of the created adopters in input order.
         """
 
-        query = adopter_table.insert().values(**data.model_dump())
-        new_adopter_id = await database.execute(query)
-        new_adopter = await self._get_by_id(new_adopter_id)
+        if not data:
+            return []
 
-        return Adopter(**dict(new_adopter)) if new_adopter else None
+        query = adopter_table.insert().returning(
+            adopter_table.c.id,
+            sort_by_parameter_order=True,
+        )
+        async with database.transaction() as conn:
+            result = await conn.execute(query, [obj.model_dump() for obj in data])
+            new_ids = list(result.scalars().all())
+            await database.announce(conn, adopter_table.name, *new_ids)
+        record_write(adopter_table.name)
+
+        return new_ids
 
     async def update_adopter(
         self,
@@ -99,19 +210,17 @@ class AdopterRepository(IAdopterRepository):
             Any | None: The updated adopter.
         """
 
-        if self._get_by_id(adopter_id):
-            query = (
-                adopter_table.update()
-                .where(adopter_table.c.id == adopter_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            adopter = await self._get_by_id(adopter_id)
-
-            return Adopter(**dict(adopter)) if adopter else None
+        query = (
+            adopter_table.update()
+            .where(adopter_table.c.id == adopter_id)
+            .values(**data.model_dump())
+            .returning(adopter_table)
+        )
+        adopter = await database.write(query, notify=adopter_table.name)
+        if adopter:
+            record_write(adopter_table.name)
 
-        return None
+        return Adopter(**dict(adopter)) if adopter else None
 
     async def delete_adopter(self, adopter_id: int) -> bool:
         """The method removing adopter from the data storage.
@@ -123,15 +232,16 @@ class AdopterRepository(IAdopterRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(adopter_id):
-            query = adopter_table \
-                .delete() \
-                .where(adopter_table.c.id == adopter_id)
-            await database.execute(query)
+        query = adopter_table \
+            .delete() \
+            .where(adopter_table.c.id == adopter_id) \
+            .returning(adopter_table.c.id)
 
-            return True
+        deleted = await database.write(query, notify=adopter_table.name) is not None
+        if deleted:
+            record_write(adopter_table.name)
 
-        return False
+        return deleted
 
     async def _get_by_id(self, adopter_id: int) -> Record | None:
         """A private method getting adopter from the DB based on its ID.
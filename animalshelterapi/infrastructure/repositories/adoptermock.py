@@ -1,13 +1,18 @@
 """Module containing adopter repository implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.adoption import Adopter, AdopterIn
 from animalshelterapi.core.repositories.iadopter import IAdopterRepository
+from animalshelterapi.db import record_write
 from animalshelterapi.infrastructure.repositories.db import adopters
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
 
 
-class AdopterRepository(IAdopterRepository):
+@observed_methods(repository_latency)
+@timed_methods("map")
+class AdopterMockRepository(IAdopterRepository):
     """A class implementing the adopter repository."""
 
     async def get_adopter_by_id(self, adopter_id: int) -> Adopter | None:
@@ -20,53 +25,119 @@ class AdopterRepository(IAdopterRepository):
             Adopter | None: The adopter data if exists.
         """
 
-        return next(
-            (obj for obj in adopters if obj.id == adopter_id),
-            None,
-        )
+        return adopters.get(adopter_id)
+
+    async def get_adopters_by_ids(self, adopter_ids: Sequence[int]) -> Iterable[Adopter]:
+        """The method getting adopters by many ids from the data storage.
+
+        Args:
+            adopter_ids (Sequence[int]): The ids of the adopters.
+
+        Returns:
+            Iterable[Adopter]: The adopters found, in no particular order.
+        """
+
+        return adopters.get_many(adopter_ids)
 
-    async def get_adopter_by_last_name(self, last_name: str) -> Iterable[Adopter]:
+    async def get_adopter_by_last_name(
+        self,
+        last_name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The method getting adopters from the data storage.
 
         Args:
             last_name (str): The last name of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adopter]: The adopter data if exists.
         """
 
-        return (obj for obj in adopters if obj.last_name == last_name)
+        return adopters.find("last_name", last_name, after_id, limit)
 
-    async def get_adopter_by_phone_number(self, phone_number: str) -> Iterable[Adopter]:
+    async def get_adopter_by_phone_number(
+        self,
+        phone_number: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The method getting adopters from the data storage.
 
         Args:
             phone_number (str): The phone number of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adopter]: The adopter data if exists.
         """
 
-        return (obj for obj in adopters if obj.phone_number == phone_number)
+        return adopters.find("phone_number", phone_number, after_id, limit)
 
 
-    async def get_all_adopters(self) -> Iterable[Adopter]:
+    async def get_all_adopters(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The method getting all adopters from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Adopter]: The collection of the all adopters.
         """
 
-        return adopters
+        return adopters.page(after_id, limit)
+
+    async def export_adopters(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all adopters from the data storage.
+
+        Yields:
+            dict[str, Any]: The adopter rows ordered by id.
+        """
 
-    async def add_adopter(self, data: AdopterIn) -> None:
+        for obj in adopters:
+            yield obj.model_dump()
+
+    async def add_adopter(self, data: AdopterIn) -> Adopter:
         """The method adding new adopter to the data storage.
 
         Args:
             data (AdopterIn): The attributes of the adopter.
+
+        Returns:
+            Adopter: The newly created adopter.
         """
 
-        adopters.append(data)
+        adopter = adopters.insert(lambda new_id: Adopter(id=new_id, **data.model_dump()))
+        record_write(adopters.name)
+
+        return adopter
+
+    async def add_adopters(self, data: Sequence[AdopterIn]) -> list[int]:
+        """The method adding many new adopters to the data storage at once.
+
+        Args:
+            data (Sequence[AdopterIn]): The attributes of the adopters.
+
+        Returns:
+            list[int]: The ids of the created adopters in input order.
+        """
+
+        new_ids = [
+            adopters.insert(lambda new_id: Adopter(id=new_id, **obj.model_dump())).id
+            for obj in data
+        ]
+        if new_ids:
+            record_write(adopters.name)
+
+        return new_ids
 
     async def update_adopter(
         self,
@@ -83,13 +154,15 @@ class AdopterRepository(IAdopterRepository):
             Adopter | None: The updated adopter.
         """
 
-        if adopter_pos := \
-                next(filter(lambda x: x.id == adopter_id, adopters)):
-            adopters[adopter_pos] = data
-
-            return Adopter(id=0, **data.model_dump())
+        previous = adopters.get(adopter_id)
+        adopter = adopters.update(
+            adopter_id,
+            lambda row_id: Adopter(id=row_id, **data.model_dump()),
+        )
+        if adopter:
+            record_write(adopters.name)
 
-        return None
+        return adopter
 
     async def delete_adopter(self, adopter_id: int) -> bool:
         """The method removing adopter from the data storage.
@@ -101,9 +174,10 @@ class AdopterRepository(IAdopterRepository):
             bool: Success of the operation.
         """
 
-        if adopter_pos := \
-                next(filter(lambda x: x.id == adopter_id, adopters)):
-            adopters.remove(adopter_pos)
-            return True
+        if (deleted := adopters.get(adopter_id)) is None:
+            return False
+
+        adopters.delete(adopter_id)
+        record_write(adopters.name)
 
-        return False
+        return True
@@ -1,9 +1,8 @@
 """Module containing adoption repository implementation."""
 
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
-from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import Select, join, select
 
 from animalshelterapi.core.repositories.iadoption import IAdoptionRepository
 from animalshelterapi.core.domain.adoption import Adoption, AdoptionIn
@@ -12,47 +11,86 @@ from animalshelterapi.db import (
     adopter_table,
     adoption_table,
     database,
+    match_ids,
+    record_write,
 )
 from animalshelterapi.infrastructure.dto.adoptiondto import AdoptionDTO
+from animalshelterapi.infrastructure.utils.rolling import rolling_counters
+from animalshelterapi.utils.consts import EXPORT_CHUNK_SIZE
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
+
+
+def _adoption_dto_query() -> Select:
+    """Function building the query of adoptions with animals and adopters.
+
+    Returns:
+        Select: The query with the columns labelled as expected by
+            `AdoptionDTO.from_records`.
+    """
+
+    return (
+        select(
+            adoption_table.c.id,
+            adoption_table.c.adoption_date,
+            *(column.label(f"animal_{column.name}") for column in animal_table.c),
+            *(column.label(f"adopter_{column.name}") for column in adopter_table.c),
+        )
+        .select_from(
+            join(
+                adoption_table,
+                adopter_table,
+                adoption_table.c.adopter_id == adopter_table.c.id
+            ).join(
+                animal_table,
+                adoption_table.c.animal_id == animal_table.c.id
+            )
+        )
+    )
 
 
+@observed_methods(repository_latency)
+@timed_methods("map")
 class AdoptionRepository(IAdoptionRepository):
     """A class representing continent DB repository."""
 
-    async def get_all_adoptions(self) -> Iterable[Any]:
+    async def get_all_adoptions(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting all adoptions from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: Adoptions in the data storage.
         """
 
         query = (
-            select(
-                adoption_table,
-                animal_table,
-                adopter_table
-            )
-            .select_from(
-                join(
-                    adoption_table,
-                    adopter_table,
-                    adoption_table.c.adopter_id == adopter_table.c.id
-                ).join(
-                    animal_table,
-                    adoption_table.c.animal_id == animal_table.c.id
-                )
-            )
+            _adoption_dto_query()
+            .where(adoption_table.c.id > after_id)
             .order_by(adoption_table.c.id.asc())
+            .limit(limit)
         )
         adoptions = await database.fetch_all(query)
 
-        return [AdoptionDTO.from_record(adoption) for adoption in adoptions]
+        return AdoptionDTO.from_records(adoptions)
 
-    async def get_by_animal_id(self, animal_id: int) -> Iterable[Any]:
+    async def get_by_animal_id(
+        self,
+        animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting adoption assigned to a particular animal.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: Adoption assigned to an animal.
@@ -61,16 +99,26 @@ class AdoptionRepository(IAdoptionRepository):
         query = adoption_table \
             .select() \
             .where(adoption_table.c.animal_id == animal_id) \
+            .where(adoption_table.c.id > after_id) \
+            .order_by(adoption_table.c.id.asc()) \
+            .limit(limit)
 
         adoptions = await database.fetch_all(query)
 
         return [Adoption(**dict(adoption)) for adoption in adoptions]
 
-    async def get_by_adopter_id(self, adopter_id: int) -> Iterable[Any]:
+    async def get_by_adopter_id(
+        self,
+        adopter_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting adoptions assigned to particular adopter.
 
         Args:
             adopter_id (int): The id of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: Adoptions assigned to an adopter.
@@ -79,7 +127,9 @@ class AdoptionRepository(IAdoptionRepository):
         query = adoption_table \
             .select() \
             .where(adoption_table.c.adopter_id == adopter_id) \
-            .order_by(adoption_table.c.id.asc())
+            .where(adoption_table.c.id > after_id) \
+            .order_by(adoption_table.c.id.asc()) \
+            .limit(limit)
 
         adoptions = await database.fetch_all(query)
 
@@ -96,21 +146,7 @@ class AdoptionRepository(IAdoptionRepository):
         """
 
         query = (
-            select(
-                adoption_table,
-                animal_table,
-                adopter_table
-            )
-            .select_from(
-                join(
-                    adoption_table,
-                    adopter_table,
-                    adoption_table.c.adopter_id == adopter_table.c.id
-                ).join(
-                    animal_table,
-                    adoption_table.c.animal_id == animal_table.c.id
-                )
-            )
+            _adoption_dto_query()
             .order_by(adoption_table.c.id.asc())
             .where(adoption_table.c.id == adoption_id))
 
@@ -118,21 +154,64 @@ class AdoptionRepository(IAdoptionRepository):
 
         return AdoptionDTO.from_record(adoption) if adoption else None
 
-    async def add_adoption(self, data: AdoptionIn) -> Any | None:
+    async def get_by_ids(self, adoption_ids: Sequence[int]) -> Iterable[Any]:
+        """The method getting adoptions by many ids from the data storage.
+
+        All ids are resolved in one query, see `match_ids`.
+
+        Args:
+            adoption_ids (Sequence[int]): The ids of the adoptions.
+
+        Returns:
+            Iterable[Any]: The adoptions found, in no particular order.
+        """
+
+        query = (
+            _adoption_dto_query()
+            .where(match_ids(adoption_table.c.id, adoption_ids))
+        )
+        adoptions = await database.fetch_all(query)
+
+        return AdoptionDTO.from_records(adoptions)
+
+    async def export_adoptions(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all adoptions from the data storage.
+
+        The rows come from a server-side cursor, so memory use does not
+        depend on the size of the table.
+
+        Yields:
+            dict[str, Any]: The adoption rows with the animal and
+                adopter columns, ordered by id.
+        """
+
+        query = (
+            _adoption_dto_query()
+            .order_by(adoption_table.c.id.asc())
+        )
+        async for row in database.stream(query, EXPORT_CHUNK_SIZE):
+            yield dict(row)
+
+    async def add_adoption(self, data: AdoptionIn) -> Adoption:
         """The method adding new adoption to the data storage.
 
         Args:
             data (AdoptionIn): The details of the new adoption.
 
         Returns:
-            Any | None: The newly added adoption.
+            Adoption: The newly added adoption.
         """
 
-        query = adoption_table.insert().values(**data.model_dump())
-        new_adoption_id = await database.execute(query)
-        new_adoption = await self._get_by_id(new_adoption_id)
+        query = (
+            adoption_table.insert()
+            .values(**data.model_dump())
+            .returning(adoption_table)
+        )
+        new_adoption = await database.write(query, notify=adoption_table.name)
+        record_write(adoption_table.name)
+        rolling_counters.add(adoption_table.name, new_adoption["adoption_date"])
 
-        return Adoption(**dict(new_adoption)) if new_adoption else None
+        return Adoption(**dict(new_adoption))
 
     async def update_adoption(
         self,
@@ -149,19 +228,21 @@ class AdoptionRepository(IAdoptionRepository):
             Any | None: The updated adoption details.
         """
 
-        if self._get_by_id(adoption_id):
-            query = (
-                adoption_table.update()
-                .where(adoption_table.c.id == adoption_id)
-                .values(**data.model_dump())
+        adoption = await database.update_returning_previous(
+            adoption_table,
+            adoption_id,
+            data.model_dump(),
+            "adoption_date",
+        )
+        if adoption:
+            record_write(adoption_table.name)
+            rolling_counters.move(
+                adoption_table.name,
+                adoption["previous_adoption_date"],
+                adoption["adoption_date"],
             )
-            await database.execute(query)
-
-            adoption = await self._get_by_id(adoption_id)
-
-            return Adoption(**dict(adoption)) if adoption else None
 
-        return None
+        return Adoption(**dict(adoption)) if adoption else None
 
     async def delete_adoption(self, adoption_id: int) -> bool:
         """The method removing adoption from the data storage.
@@ -173,30 +254,18 @@ class AdoptionRepository(IAdoptionRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(adoption_id):
-            query = adoption_table \
-                .delete() \
-                .where(adoption_table.c.id == adoption_id)
-            await database.execute(query)
-
-            return True
-
-        return False
-
-    async def _get_by_id(self, adoption_id: int) -> Record | None:
-        """A private method getting adoption from the DB based on its ID.
-
-        Args:
-            adoption_id (int): The ID of the adoption.
-
-        Returns:
-            Any | None: Adoption record if exists.
-        """
-
-        query = (
-            adoption_table.select()
-            .where(adoption_table.c.id == adoption_id)
-            .order_by(adoption_table.c.id.asc())
-        )
+        query = adoption_table \
+            .delete() \
+            .where(adoption_table.c.id == adoption_id) \
+            .returning(adoption_table.c.id, adoption_table.c.adoption_date)
+
+        deleted = await database.write(query, notify=adoption_table.name)
+        if deleted:
+            record_write(adoption_table.name)
+            rolling_counters.add(
+                adoption_table.name,
+                deleted["adoption_date"],
+                -1,
+            )
 
-        return await database.fetch_one(query)
+        return deleted is not None
@@ -1,61 +1,161 @@
 """Module containing adoption repository implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.repositories.iadoption import IAdoptionRepository
-from animalshelterapi.core.domain.adoption import Adoption, AdoptionIn, Adopter
-from animalshelterapi.infrastructure.repositories.db import adoptions
+from animalshelterapi.core.domain.adoption import Adoption, AdoptionIn
+from animalshelterapi.db import record_write
+from animalshelterapi.infrastructure.dto.adoptiondto import AdoptionDTO
+from animalshelterapi.infrastructure.repositories.db import (
+    adopters,
+    adoptions,
+    animals,
+)
+from animalshelterapi.infrastructure.utils.rolling import rolling_counters
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
+
+
+def _joined(obj: Adoption) -> dict[str, Any] | None:
+    """Function joining the adoption with its animal and adopter.
+
+    Args:
+        obj (Adoption): The stored adoption.
+
+    Returns:
+        dict[str, Any] | None: The row labelled as by the joined query,
+            None if the animal or the adopter no longer exists.
+    """
+
+    animal = animals.get(obj.animal_id)
+    adopter = adopters.get(obj.adopter_id)
+    if animal is None or adopter is None:
+        return None
+
+    return {
+        "id": obj.id,
+        "adoption_date": obj.adoption_date,
+        **{f"animal_{k}": v for k, v in animal.model_dump().items()},
+        **{f"adopter_{k}": v for k, v in adopter.model_dump().items()},
+    }
+
+
+def _to_dtos(objs: Iterable[Adoption]) -> list[AdoptionDTO]:
+    """Function mapping the adoptions to DTOs, as the database repository does.
 
+    Args:
+        objs (Iterable[Adoption]): The stored adoptions.
 
+    Returns:
+        list[AdoptionDTO]: The DTOs of the adoptions with existing
+            animal and adopter.
+    """
+
+    return AdoptionDTO.from_records(
+        [row for row in map(_joined, objs) if row is not None],
+    )
+
+
+@observed_methods(repository_latency)
+@timed_methods("map")
 class AdoptionMockRepository(IAdoptionRepository):
     """A class representing adoption repository."""
 
-    async def get_all_adoptions(self) -> Iterable[Adoption]:
+    async def get_all_adoptions(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[AdoptionDTO]:
         """The method getting all adoptions from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
-            Iterable[Adoption]: Adoptions in the data storage.
+            Iterable[AdoptionDTO]: Adoptions in the data storage.
         """
 
-        return adoptions
+        return _to_dtos(adoptions.page(after_id, limit))
 
-    async def get_by_animal_id(self, animal_id: int) -> Iterable[Adoption]:
+    async def get_by_animal_id(
+        self,
+        animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adoption]:
         """The method getting adoption assigned to particular animal.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Adoption | None: Adoption assigned to an animal.
         """
 
-        return list(filter(lambda x: x.animal_id == animal_id, adoptions))
+        return adoptions.find("animal_id", animal_id, after_id, limit)
 
-    async def get_by_adopter_id(self, adopter_id: int) -> Iterable[Adoption]:
+    async def get_by_adopter_id(
+        self,
+        adopter_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adoption]:
         """The method getting adoptions assigned to particular adopter.
 
         Args:
             adopter_id (int): The id of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adoption]: Adoptions assigned to an adopter.
         """
 
-        return list(filter(lambda x: x.adopter_id == adopter_id, adoptions))
+        return adoptions.find("adopter_id", adopter_id, after_id, limit)
 
-    async def get_by_id(self, adoption_id: int) -> Adoption | None:
+    async def get_by_id(self, adoption_id: int) -> AdoptionDTO | None:
         """The method getting adoption by provided id.
 
         Args:
             adoption_id (int): The id of the adoption.
 
         Returns:
-            Adoption | None: The adoption details.
+            AdoptionDTO | None: The adoption details.
         """
 
-        return next((obj for obj in adoptions if obj.id == adoption_id), None)
+        obj = adoptions.get(adoption_id)
+        found = _to_dtos([obj]) if obj else []
 
-    async def add_adoption(self, data: AdoptionIn) -> None:
+        return found[0] if found else None
+
+    async def get_by_ids(self, adoption_ids: Sequence[int]) -> Iterable[AdoptionDTO]:
+        """The method getting adoptions by many ids from the data storage.
+
+        Args:
+            adoption_ids (Sequence[int]): The ids of the adoptions.
+
+        Returns:
+            Iterable[AdoptionDTO]: The adoptions found, in no particular order.
+        """
+
+        return _to_dtos(adoptions.get_many(adoption_ids))
+
+    async def export_adoptions(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all adoptions from the data storage.
+
+        Yields:
+            dict[str, Any]: The adoption rows with the animal and
+                adopter columns, ordered by id.
+        """
+
+        for obj in adoptions:
+            if (row := _joined(obj)) is not None:
+                yield row
+
+    async def add_adoption(self, data: AdoptionIn) -> Adoption:
         """The method adding new adoption to the data storage.
 
         Args:
@@ -65,7 +165,11 @@ class AdoptionMockRepository(IAdoptionRepository):
             Adoption: Full details of the newly added adoption.
         """
 
-        adoptions.append(data)
+        adoption = adoptions.insert(lambda new_id: Adoption(id=new_id, **data.model_dump()))
+        record_write(adoptions.name)
+        rolling_counters.add(adoptions.name, adoption.adoption_date)
+
+        return adoption
 
     async def update_adoption(
         self,
@@ -82,13 +186,20 @@ class AdoptionMockRepository(IAdoptionRepository):
             Adoption | None: The updated adoption details.
         """
 
-        if adoption_pos := \
-                next(filter(lambda x: x.id == adoption_id, adoptions)):
-            adoptions[adoption_pos] = data
-
-            return Adoption(id=0, **data.model_dump())
-
-        return None
+        previous = adoptions.get(adoption_id)
+        adoption = adoptions.update(
+            adoption_id,
+            lambda row_id: Adoption(id=row_id, **data.model_dump()),
+        )
+        if adoption:
+            record_write(adoptions.name)
+            rolling_counters.move(
+                adoptions.name,
+                previous.adoption_date,
+                adoption.adoption_date,
+            )
+
+        return adoption
 
     async def delete_adoption(self, adoption_id: int) -> bool:
         """The method removing adoption from the data storage.
@@ -100,9 +211,11 @@ class AdoptionMockRepository(IAdoptionRepository):
             bool: Success of the operation.
         """
 
-        if adoption_pos := \
-                next(filter(lambda x: x.id == adoption_id, adoptions)):
-            adoptions.remove(adoption_pos)
-            return True
+        if (deleted := adoptions.get(adoption_id)) is None:
+            return False
+
+        adoptions.delete(adoption_id)
+        record_write(adoptions.name)
+        rolling_counters.add(adoptions.name, deleted.adoption_date, -1)
 
-        return False
+        return True
@@ -1,14 +1,27 @@
 """Module containing continent database repository implementation."""
 
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from asyncpg import Record  # type: ignore
-
-from animalshelterapi.core.domain.animal import Animal, AnimalIn
+from sqlalchemy import literal, tuple_
+
+from animalshelterapi.core.domain.animal import (
+    Animal,
+    AnimalIn,
+    AnimalSearch,
+    AnimalSortField,
+    SortOrder,
+)
 from animalshelterapi.core.repositories.ianimal import IAnimalRepository
-from animalshelterapi.db import animal_table, database
+from animalshelterapi.db import animal_table, database, match_ids, record_write
+from animalshelterapi.infrastructure.utils.rolling import rolling_counters
+from animalshelterapi.utils.consts import EXPORT_CHUNK_SIZE
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
 
 
+@observed_methods(repository_latency)
+@timed_methods("map")
 class AnimalRepository(IAnimalRepository):
     """A class implementing the animal repository."""
 
@@ -26,108 +39,323 @@ class AnimalRepository(IAnimalRepository):
 
         return Animal(**dict(animal)) if animal else None
 
-    async def get_animal_by_name(self, name: str) -> Iterable[Any]:
+    async def get_animals_by_ids(self, animal_ids: Sequence[int]) -> Iterable[Any]:
+        """The method getting animals by many ids from the data storage.
+
+        All ids are resolved in one query, see `match_ids`.
+
+        Args:
+            animal_ids (Sequence[int]): The ids of the animals.
+
+        Returns:
+            Iterable[Any]: The animals found, in no particular order.
+        """
+
+        query = (
+            animal_table.select()
+            .where(match_ids(animal_table.c.id, animal_ids))
+        )
+        animals = await database.fetch_all(query)
+
+        return [Animal(**dict(animal)) for animal in animals]
+
+    async def get_animal_by_name(
+        self,
+        name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting animals from the data storage.
 
         Args:
             name (str): The name of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
-        query = animal_table.select().where(animal_table.c.name == name).order_by(animal_table.c.id.asc())
+        query = (
+            animal_table.select()
+            .where(animal_table.c.name == name)
+            .where(animal_table.c.id > after_id)
+            .order_by(animal_table.c.id.asc())
+            .limit(limit)
+        )
         animals = await database.fetch_all(query)
 
         return[Animal(**dict(animal)) for animal in animals]
 
-    async def get_animal_by_species(self, species: str) -> Iterable[Any]:
+    async def get_animal_by_species(
+        self,
+        species: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting animals from the data storage.
 
         Args:
             species (str): The species of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
-        query = animal_table.select().where(animal_table.c.species == species).order_by(animal_table.c.id.asc())
+        query = (
+            animal_table.select()
+            .where(animal_table.c.species == species)
+            .where(animal_table.c.id > after_id)
+            .order_by(animal_table.c.id.asc())
+            .limit(limit)
+        )
         animals = await database.fetch_all(query)
 
         return[Animal(**dict(animal)) for animal in animals]
 
-    async def get_animal_by_breed(self, breed: str) -> Iterable[Any]:
+    async def get_animal_by_breed(
+        self,
+        breed: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting animals from the data storage.
 
         Args:
             breed (str): The breed of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
-        query = animal_table.select().where(animal_table.c.breed == breed).order_by(animal_table.c.id.asc())
+        query = (
+            animal_table.select()
+            .where(animal_table.c.breed == breed)
+            .where(animal_table.c.id > after_id)
+            .order_by(animal_table.c.id.asc())
+            .limit(limit)
+        )
         animals = await database.fetch_all(query)
 
         return[Animal(**dict(animal)) for animal in animals]
 
-    async def get_animal_by_gender(self, gender: str) -> Iterable[Any]:
+    async def get_animal_by_gender(
+        self,
+        gender: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting animals from the data storage.
 
         Args:
             gender (str): The gender of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
-        query = animal_table.select().where(animal_table.c.gender == gender).order_by(animal_table.c.id.asc())
+        query = (
+            animal_table.select()
+            .where(animal_table.c.gender == gender)
+            .where(animal_table.c.id > after_id)
+            .order_by(animal_table.c.id.asc())
+            .limit(limit)
+        )
         animals = await database.fetch_all(query)
 
         return[Animal(**dict(animal)) for animal in animals]
 
-    async def get_animal_by_adoption_status(self, adoption_status: str) -> Iterable[Any]:
+    async def get_animal_by_adoption_status(
+        self,
+        adoption_status: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting animals from the data storage.
 
         Args:
             adoption_status (str): The adoption status of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: The animal data if exists.
         """
 
-        query = animal_table.select().where(animal_table.c.adoption_status == adoption_status).order_by(animal_table.c.id.asc())
+        query = (
+            animal_table.select()
+            .where(animal_table.c.adoption_status == adoption_status)
+            .where(animal_table.c.id > after_id)
+            .order_by(animal_table.c.id.asc())
+            .limit(limit)
+        )
         animals = await database.fetch_all(query)
 
         return[Animal(**dict(animal)) for animal in animals]
 
-    async def get_all_animals(self) -> Iterable[Any]:
+    async def get_all_animals(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting all animals from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: The collection of the all animals.
         """
 
-        query = animal_table.select().order_by(animal_table.c.id.asc())
+        query = (
+            animal_table.select()
+            .where(animal_table.c.id > after_id)
+            .order_by(animal_table.c.id.asc())
+            .limit(limit)
+        )
+        animals = await database.fetch_all(query)
+
+        return [Animal(**dict(animal)) for animal in animals]
+
+    async def search_animals(
+        self,
+        criteria: AnimalSearch,
+        after_value: Any = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
+        """The method searching animals in the data storage.
+
+        All criteria are combined into a single query ordered by the sort
+        key and the id, so pages can be resumed with a keyset condition.
+
+        Args:
+            criteria (AnimalSearch): The filters and the sort order.
+            after_value (Any): The sort key of the row after which
+                the collection starts.
+            after_id (int | None): The id of the row after which
+                the collection starts.
+            limit (int | None): The maximum number of items.
+
+        Returns:
+            Iterable[Any]: The collection of the matching animals.
+        """
+
+        query = animal_table.select()
+
+        for column in ("name", "species", "breed", "gender", "adoption_status"):
+            if (value := getattr(criteria, column)) is not None:
+                query = query.where(animal_table.c[column] == value)
+
+        if criteria.min_age is not None:
+            query = query.where(animal_table.c.age >= criteria.min_age)
+        if criteria.max_age is not None:
+            query = query.where(animal_table.c.age <= criteria.max_age)
+        if criteria.arrived_from is not None:
+            query = query.where(animal_table.c.arrival_date >= criteria.arrived_from)
+        if criteria.arrived_to is not None:
+            query = query.where(animal_table.c.arrival_date <= criteria.arrived_to)
+
+        descending = criteria.order is SortOrder.DESC
+        sort_column = animal_table.c[criteria.sort_by.value]
+
+        if criteria.sort_by is AnimalSortField.ID:
+            order_by = [animal_table.c.id]
+            key, bound = animal_table.c.id, literal(after_id)
+        else:
+            order_by = [sort_column, animal_table.c.id]
+            key = tuple_(sort_column, animal_table.c.id)
+            bound = tuple_(
+                literal(after_value, sort_column.type),
+                literal(after_id),
+            )
+
+        if after_id is not None:
+            query = query.where(key < bound if descending else key > bound)
+
+        query = query \
+            .order_by(*(
+                column.desc() if descending else column.asc()
+                for column in order_by
+            )) \
+            .limit(limit)
         animals = await database.fetch_all(query)
 
         return [Animal(**dict(animal)) for animal in animals]
 
-    async def add_animal(self, data: AnimalIn) -> Any | None:
+    async def export_animals(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all animals from the data storage.
+
+        The rows come from a server-side cursor, so memory use does not
+        depend on the size of the table.
+
+        Yields:
+            dict[str, Any]: The animal rows ordered by id.
+        """
+
+        query = (
+            animal_table.select()
+            .order_by(animal_table.c.id.asc())
+        )
+        async for row in database.stream(query, EXPORT_CHUNK_SIZE):
+            yield dict(row)
+
+    async def add_animal(self, data: AnimalIn) -> Animal:
         """The method adding new animal to the data storage.
 
         Args:
             data (AnimalIn): The attributes of the animal.
 
         Returns:
-            Any | None: The newly created animal.
+            Animal: The newly created animal.
+        """
+
+        query = (
+            animal_table.insert()
+            .values(**data.model_dump())
+            .returning(animal_table)
+        )
+        new_animal = await database.write(query, notify=animal_table.name)
+        record_write(animal_table.name)
+        rolling_counters.add(animal_table.name, new_animal["arrival_date"])
+
+        return Animal(**dict(new_animal))
+
+    async def add_animals(self, data: Sequence[AnimalIn]) -> list[int]:
+        """The method adding many new animals to the data storage at once.
+
+        The rows are sent as batched multi-row inserts in one transaction.
+
+        Args:
+            data (Sequence[AnimalIn]): The attributes of the animals.
+
+        Returns:
+            list[int]: The ids of the created animals in input order.
         """
 
-        query = animal_table.insert().values(**data.model_dump())
-        new_animal_id = await database.execute(query)
-        new_animal = await self._get_by_id(new_animal_id)
+        if not data:
+            return []
 
-        return Animal(**dict(new_animal)) if new_animal else None
+        query = animal_table.insert().returning(
+            animal_table.c.id,
+            sort_by_parameter_order=True,
+        )
+        async with database.transaction() as conn:
+            result = await conn.execute(query, [obj.model_dump() for obj in data])
+            new_ids = list(result.scalars().all())
+            await database.announce(conn, animal_table.name, *new_ids)
+        record_write(animal_table.name)
+        for obj in data:
+            rolling_counters.add(animal_table.name, obj.arrival_date)
+
+        return new_ids
 
     async def update_animal(
         self,
@@ -144,19 +372,21 @@ class AnimalRepository(IAnimalRepository):
             Any | None: The updated animal.
         """
 
-        if self._get_by_id(animal_id):
-            query = (
-                animal_table.update()
-                .where(animal_table.c.id == animal_id)
-                .values(**data.model_dump())
+        animal = await database.update_returning_previous(
+            animal_table,
+            animal_id,
+            data.model_dump(),
+            "arrival_date",
+        )
+        if animal:
+            record_write(animal_table.name)
+            rolling_counters.move(
+                animal_table.name,
+                animal["previous_arrival_date"],
+                animal["arrival_date"],
             )
-            await database.execute(query)
 
-            animal = await self._get_by_id(animal_id)
-
-            return Animal(**dict(animal)) if animal else None
-
-        return None
+        return Animal(**dict(animal)) if animal else None
 
     async def delete_animal(self, animal_id: int) -> bool:
         """The method removing animal from the data storage.
@@ -168,15 +398,21 @@ class AnimalRepository(IAnimalRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(animal_id):
-            query = animal_table \
-                .delete() \
-                .where(animal_table.c.id == animal_id)
-            await database.execute(query)
-
-            return True
+        query = animal_table \
+            .delete() \
+            .where(animal_table.c.id == animal_id) \
+            .returning(animal_table.c.id, animal_table.c.arrival_date)
+
+        deleted = await database.write(query, notify=animal_table.name)
+        if deleted:
+            record_write(animal_table.name)
+            rolling_counters.add(
+                animal_table.name,
+                deleted["arrival_date"],
+                -1,
+            )
 
-        return False
+        return deleted is not None
 
     async def _get_by_id(self, animal_id: int) -> Record | None:
         """A private method getting animal from the DB based on its ID.
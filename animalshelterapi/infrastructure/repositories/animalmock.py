@@ -1,13 +1,26 @@
 """Module containing animal repository implementation."""
 
-from typing import Iterable
-
-from animalshelterapi.core.domain.animal import Animal, AnimalIn
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Sequence
+
+from animalshelterapi.core.domain.animal import (
+    Animal,
+    AnimalIn,
+    AnimalSearch,
+    AnimalSortField,
+    SortOrder,
+)
 from animalshelterapi.core.repositories.ianimal import IAnimalRepository
+from animalshelterapi.db import record_write
 from animalshelterapi.infrastructure.repositories.db import animals
+from animalshelterapi.infrastructure.utils.rolling import rolling_counters
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
 
 
-class AnimalRepository(IAnimalRepository):
+@observed_methods(repository_latency)
+@timed_methods("map")
+class AnimalMockRepository(IAnimalRepository):
     """A class implementing the animal repository."""
 
     async def get_animal_by_id(self, animal_id: int) -> Animal | None:
@@ -20,88 +33,234 @@ class AnimalRepository(IAnimalRepository):
             Animal | None: The animal data if exists.
         """
 
-        return next(
-            (obj for obj in animals if obj.id == animal_id),
-            None,
-        )
+        return animals.get(animal_id)
+
+    async def get_animals_by_ids(self, animal_ids: Sequence[int]) -> Iterable[Animal]:
+        """The method getting animals by many ids from the data storage.
+
+        Args:
+            animal_ids (Sequence[int]): The ids of the animals.
+
+        Returns:
+            Iterable[Animal]: The animals found, in no particular order.
+        """
+
+        return animals.get_many(animal_ids)
 
-    async def get_animal_by_name(self, name: str) -> Iterable[Animal]:
+    async def get_animal_by_name(
+        self,
+        name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting animals from the data storage.
 
         Args:
             name (str): The name of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return (obj for obj in animals if obj.name == name)
+        return animals.find("name", name, after_id, limit)
 
-    async def get_animal_by_species(self, species: str) -> Iterable[Animal]:
+    async def get_animal_by_species(
+        self,
+        species: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting animals from the data storage.
 
         Args:
             species (str): The species of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return (obj for obj in animals if obj.species == species)
+        return animals.find("species", species, after_id, limit)
 
-    async def get_animal_by_breed(self, breed: str) -> Iterable[Animal]:
+    async def get_animal_by_breed(
+        self,
+        breed: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting animals from the data storage.
 
         Args:
             breed (str): The breed of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return (obj for obj in animals if obj.breed == breed)
+        return animals.find("breed", breed, after_id, limit)
 
-    async def get_animal_by_gender(self, gender: str) -> Iterable[Animal]:
+    async def get_animal_by_gender(
+        self,
+        gender: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting animals from the data storage.
 
         Args:
             gender (str): The gender of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return (obj for obj in animals if obj.gender == gender)
+        return animals.find("gender", gender, after_id, limit)
 
-    async def get_animal_by_adoption_status(self, adoption_status: str) -> Iterable[Animal]:
+    async def get_animal_by_adoption_status(
+        self,
+        adoption_status: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting animals from the data storage.
 
         Args:
             adoption_status (str): The adoption status of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return (obj for obj in animals if obj.adoption_status == adoption_status)
+        return animals.find("adoption_status", adoption_status, after_id, limit)
 
-    async def get_all_animals(self) -> Iterable[Animal]:
+    async def get_all_animals(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting all animals from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Animal]: The collection of the all animals.
         """
 
-        return animals
+        return animals.page(after_id, limit)
+
+    async def search_animals(
+        self,
+        criteria: AnimalSearch,
+        after_value: Any = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
+        """The method searching animals in the data storage.
+
+        Args:
+            criteria (AnimalSearch): The filters and the sort order.
+            after_value (Any): The sort key of the row after which
+                the collection starts.
+            after_id (int | None): The id of the row after which
+                the collection starts.
+            limit (int | None): The maximum number of items.
+
+        Returns:
+            Iterable[Animal]: The collection of the matching animals.
+        """
+
+        def matches(obj: Animal) -> bool:
+            return all(
+                getattr(obj, column) == getattr(criteria, column)
+                for column in ("name", "species", "breed", "gender", "adoption_status")
+                if getattr(criteria, column) is not None
+            ) and (criteria.min_age is None or obj.age >= criteria.min_age) \
+                and (criteria.max_age is None or obj.age <= criteria.max_age) \
+                and (criteria.arrived_from is None or obj.arrival_date >= criteria.arrived_from) \
+                and (criteria.arrived_to is None or obj.arrival_date <= criteria.arrived_to)
+
+        def sort_key(obj: Animal) -> tuple:
+            if criteria.sort_by is AnimalSortField.ID:
+                return (obj.id,)
+
+            return (getattr(obj, criteria.sort_by.value), obj.id)
+
+        descending = criteria.order is SortOrder.DESC
+        found = sorted(
+            filter(matches, animals.candidates(
+                criteria.model_dump(exclude_none=True),
+            )),
+            key=sort_key,
+            reverse=descending,
+        )
+
+        if after_id is not None:
+            bound = (after_id,) if criteria.sort_by is AnimalSortField.ID \
+                else (after_value, after_id)
+            found = [
+                obj for obj in found
+                if (sort_key(obj) < bound if descending else sort_key(obj) > bound)
+            ]
+
+        return list(islice(found, limit))
+
+    async def export_animals(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all animals from the data storage.
+
+        Yields:
+            dict[str, Any]: The animal rows ordered by id.
+        """
+
+        for obj in animals:
+            yield obj.model_dump()
 
-    async def add_animal(self, data: AnimalIn) -> None:
+    async def add_animal(self, data: AnimalIn) -> Animal:
         """The method adding new animal to the data storage.
 
         Args:
             data (AnimalIn): The attributes of the animal.
+
+        Returns:
+            Animal: The newly created animal.
         """
 
-        animals.append(data)
+        animal = animals.insert(lambda new_id: Animal(id=new_id, **data.model_dump()))
+        record_write(animals.name)
+        rolling_counters.add(animals.name, animal.arrival_date)
+
+        return animal
+
+    async def add_animals(self, data: Sequence[AnimalIn]) -> list[int]:
+        """The method adding many new animals to the data storage at once.
+
+        Args:
+            data (Sequence[AnimalIn]): The attributes of the animals.
+
+        Returns:
+            list[int]: The ids of the created animals in input order.
+        """
+
+        new_animals = [
+            animals.insert(lambda new_id: Animal(id=new_id, **obj.model_dump()))
+            for obj in data
+        ]
+        if new_animals:
+            record_write(animals.name)
+        for obj in new_animals:
+            rolling_counters.add(animals.name, obj.arrival_date)
+
+        return [obj.id for obj in new_animals]
 
     async def update_animal(
         self,
@@ -118,13 +277,20 @@ class AnimalRepository(IAnimalRepository):
             Animal | None: The updated animal.
         """
 
-        if animal_pos := \
-                next(filter(lambda x: x.id == animal_id, animals)):
-            animals[animal_pos] = data
-
-            return Animal(id=0, **data.model_dump())
+        previous = animals.get(animal_id)
+        animal = animals.update(
+            animal_id,
+            lambda row_id: Animal(id=row_id, **data.model_dump()),
+        )
+        if animal:
+            record_write(animals.name)
+            rolling_counters.move(
+                animals.name,
+                previous.arrival_date,
+                animal.arrival_date,
+            )
 
-        return None
+        return animal
 
     async def delete_animal(self, animal_id: int) -> bool:
         """The method removing animal from the data storage.
@@ -136,9 +302,11 @@ class AnimalRepository(IAnimalRepository):
             bool: Success of the operation.
         """
 
-        if animal_pos := \
-                next(filter(lambda x: x.id == animal_id, animals)):
-            animals.remove(animal_pos)
-            return True
+        if (deleted := animals.get(animal_id)) is None:
+            return False
+
+        animals.delete(animal_id)
+        record_write(animals.name)
+        rolling_counters.add(animals.name, deleted.arrival_date, -1)
 
-        return False
+        return True
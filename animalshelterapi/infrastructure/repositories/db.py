@@ -1,6 +1,378 @@
 """Module containing temporary data storage."""
 
-animals: list = []
-adopters: list = []
-adoptions: list = []
-medical_records: list = []
\ No newline at end of file
+import itertools
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from pydantic import BaseModel
+
+RowT = TypeVar("RowT", bound=BaseModel)
+
+# The most ids kept in one chunk of a sorted id set.
+CHUNK_SIZE = 1024
+
+
+class SortedIds:
+    """A class keeping a set of ids sorted in chunks.
+
+    Inserting or removing an id shifts one chunk of at most `CHUNK_SIZE`
+    ids instead of the whole list, so the sets stay cheap to change even
+    for values shared by most of the rows.
+    """
+
+    _chunks: list[list[int]]
+    _maxes: list[int]
+    _size: int
+
+    def __init__(self) -> None:
+        """The initializer of the `sorted ids`."""
+
+        self._chunks = []
+        self._maxes = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        """The method counting the ids.
+
+        Returns:
+            int: The number of ids.
+        """
+
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        """The method iterating over the ids in ascending order.
+
+        Returns:
+            Iterator[int]: The ids.
+        """
+
+        return itertools.chain.from_iterable(self._chunks)
+
+    def add(self, row_id: int) -> None:
+        """The method adding the id.
+
+        Args:
+            row_id (int): The id to add.
+        """
+
+        self._size += 1
+        if not self._chunks or row_id > self._maxes[-1]:
+            if not self._chunks or len(self._chunks[-1]) >= CHUNK_SIZE:
+                self._chunks.append([])
+                self._maxes.append(row_id)
+            self._chunks[-1].append(row_id)
+            self._maxes[-1] = row_id
+            return
+
+        pos = bisect_left(self._maxes, row_id)
+        chunk = self._chunks[pos]
+        insort(chunk, row_id)
+        if len(chunk) > 2 * CHUNK_SIZE:
+            self._chunks[pos:pos + 1] = [chunk[:CHUNK_SIZE], chunk[CHUNK_SIZE:]]
+            self._maxes[pos:pos + 1] = [chunk[CHUNK_SIZE - 1], chunk[-1]]
+
+    def remove(self, row_id: int) -> None:
+        """The method removing the id.
+
+        Args:
+            row_id (int): The id to remove, it must be present.
+        """
+
+        pos = bisect_left(self._maxes, row_id)
+        chunk = self._chunks[pos]
+        del chunk[bisect_left(chunk, row_id)]
+        self._size -= 1
+        if not chunk:
+            del self._chunks[pos]
+            del self._maxes[pos]
+        else:
+            self._maxes[pos] = chunk[-1]
+
+    def after(self, row_id: int, limit: int | None = None) -> list[int]:
+        """The method getting the ids following the id.
+
+        Args:
+            row_id (int): The id after which the ids start.
+            limit (int | None): The maximum number of ids.
+
+        Returns:
+            list[int]: The ids in ascending order.
+        """
+
+        pos = bisect_right(self._maxes, row_id)
+        if pos == len(self._chunks):
+            return []
+
+        chunk = self._chunks[pos]
+        ids = itertools.chain(
+            chunk[bisect_right(chunk, row_id):],
+            itertools.chain.from_iterable(
+                itertools.islice(self._chunks, pos + 1, None),
+            ),
+        )
+
+        return list(itertools.islice(ids, limit))
+
+
+class MemoryTable(Generic[RowT]):
+    """A class storing rows in memory, indexed by id and by chosen fields.
+
+    Rows are kept in a dict by id, next to the sorted set of all ids.
+    Every indexed field maps each value to the sorted ids of the rows
+    holding it, so lookups by id or by an indexed value cost O(1) and
+    a page after a given id costs O(log n + limit) instead of a scan.
+    Ids come from a counter and are never reused.
+    """
+
+    _name: str
+    _rows: dict[int, RowT]
+    _ids: SortedIds
+    _indexes: dict[str, dict[Any, SortedIds]]
+    _counter: Iterator[int]
+
+    def __init__(self, name: str, indexed: Iterable[str] = ()) -> None:
+        """The initializer of the `memory table`.
+
+        Args:
+            name (str): The name of the table, the same as in the database.
+            indexed (Iterable[str]): The names of the indexed fields.
+        """
+
+        self._name = name
+        self._rows = {}
+        self._ids = SortedIds()
+        self._indexes = {field: {} for field in indexed}
+        self._counter = itertools.count(1)
+
+    @property
+    def name(self) -> str:
+        """The name of the table."""
+
+        return self._name
+
+    def __len__(self) -> int:
+        """The method counting the stored rows.
+
+        Returns:
+            int: The number of rows.
+        """
+
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[RowT]:
+        """The method iterating over the rows ordered by id.
+
+        Returns:
+            Iterator[RowT]: The stored rows.
+        """
+
+        return (self._rows[row_id] for row_id in list(self._ids))
+
+    def __contains__(self, row_id: object) -> bool:
+        """The method checking whether the row exists.
+
+        Args:
+            row_id (object): The id of the row.
+
+        Returns:
+            bool: Whether the row is stored.
+        """
+
+        return row_id in self._rows
+
+    def get(self, row_id: int) -> RowT | None:
+        """The method getting the row by its id.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            RowT | None: The row if exists.
+        """
+
+        return self._rows.get(row_id)
+
+    def get_many(self, row_ids: Iterable[int]) -> list[RowT]:
+        """The method getting the rows by many ids.
+
+        Args:
+            row_ids (Iterable[int]): The ids of the rows.
+
+        Returns:
+            list[RowT]: The rows found, missing ids are skipped.
+        """
+
+        return [
+            self._rows[row_id] for row_id in set(row_ids) if row_id in self._rows
+        ]
+
+    def page(self, after_id: int = 0, limit: int | None = None) -> list[RowT]:
+        """The method getting the rows following the id.
+
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of rows.
+
+        Returns:
+            list[RowT]: The rows ordered by id.
+        """
+
+        return self._slice(self._ids, after_id, limit)
+
+    def find(
+        self,
+        field: str,
+        value: Any,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> list[RowT]:
+        """The method getting the rows holding the value of the indexed field.
+
+        Args:
+            field (str): The name of the indexed field.
+            value (Any): The value of the field.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of rows.
+
+        Returns:
+            list[RowT]: The rows ordered by id.
+        """
+
+        if (ids := self._indexes[field].get(value)) is None:
+            return []
+
+        return self._slice(ids, after_id, limit)
+
+    def candidates(self, criteria: dict[str, Any]) -> Iterable[RowT]:
+        """The method narrowing the rows using the most selective index.
+
+        Args:
+            criteria (dict[str, Any]): The required values of the fields,
+                only the indexed ones are used.
+
+        Returns:
+            Iterable[RowT]: The rows which may hold all the values,
+                ordered by id.
+        """
+
+        matches = [
+            self._indexes[field].get(value, SortedIds())
+            for field, value in criteria.items()
+            if field in self._indexes
+        ]
+        if not matches:
+            return iter(self)
+
+        return [self._rows[row_id] for row_id in min(matches, key=len)]
+
+    def insert(self, build: Callable[[int], RowT]) -> RowT:
+        """The method storing a new row under the next id.
+
+        Args:
+            build (Callable[[int], RowT]): The factory of the row
+                receiving its id.
+
+        Returns:
+            RowT: The stored row.
+        """
+
+        row = build(next(self._counter))
+        self._rows[row.id] = row
+        self._ids.add(row.id)
+        self._index(row)
+
+        return row
+
+    def update(self, row_id: int, build: Callable[[int], RowT]) -> RowT | None:
+        """The method replacing the row and moving it in the indexes.
+
+        Args:
+            row_id (int): The id of the row.
+            build (Callable[[int], RowT]): The factory of the new row
+                receiving its id.
+
+        Returns:
+            RowT | None: The updated row if exists.
+        """
+
+        if (old := self._rows.get(row_id)) is None:
+            return None
+
+        row = build(row_id)
+        self._unindex(old)
+        self._rows[row_id] = row
+        self._index(row)
+
+        return row
+
+    def delete(self, row_id: int) -> bool:
+        """The method removing the row.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            bool: Whether the row existed.
+        """
+
+        if (row := self._rows.pop(row_id, None)) is None:
+            return False
+
+        self._unindex(row)
+        self._ids.remove(row_id)
+
+        return True
+
+    def _index(self, row: RowT) -> None:
+        """The method adding the row to the secondary indexes.
+
+        Args:
+            row (RowT): The stored row.
+        """
+
+        for field, index in self._indexes.items():
+            index.setdefault(getattr(row, field), SortedIds()).add(row.id)
+
+    def _unindex(self, row: RowT) -> None:
+        """The method removing the row from the secondary indexes.
+
+        Args:
+            row (RowT): The stored row.
+        """
+
+        for field, index in self._indexes.items():
+            value = getattr(row, field)
+            ids = index[value]
+            ids.remove(row.id)
+            if not ids:
+                del index[value]
+
+    def _slice(
+        self,
+        ids: SortedIds,
+        after_id: int,
+        limit: int | None,
+    ) -> list[RowT]:
+        """The method getting the rows of the sorted ids following the id.
+
+        Args:
+            ids (SortedIds): The sorted ids.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of rows.
+
+        Returns:
+            list[RowT]: The rows ordered by id.
+        """
+
+        return [self._rows[row_id] for row_id in ids.after(after_id, limit)]
+
+
+animals: MemoryTable = MemoryTable(
+    "animals",
+    ("name", "species", "breed", "gender", "adoption_status"),
+)
+adopters: MemoryTable = MemoryTable("adopters", ("last_name", "phone_number"))
+adoptions: MemoryTable = MemoryTable("adoptions", ("animal_id", "adopter_id"))
+medical_records: MemoryTable = MemoryTable("medical_records", ("animal_id",))
+reports: MemoryTable = MemoryTable("reports", ("topic",))
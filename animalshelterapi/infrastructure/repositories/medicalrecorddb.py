@@ -1,10 +1,9 @@
 
 """Module containing airport repository implementation."""
 
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
-from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import Select, join, select
 
 from animalshelterapi.core.repositories.imedicalrecord import IMedicalRecordRepository
 from animalshelterapi.core.domain.medicalrecord import MedicalRecord, MedicalRecordIn
@@ -12,61 +11,100 @@ from animalshelterapi.db import (
     animal_table,
     medical_record_table,
     database,
+    match_ids,
+    record_write,
 )
 from animalshelterapi.infrastructure.dto.medicalrecorddto import MedicalRecordDTO
+from animalshelterapi.infrastructure.utils.rolling import rolling_counters
+from animalshelterapi.utils.consts import EXPORT_CHUNK_SIZE
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
+
+
+def _medical_record_dto_query() -> Select:
+    """Function building the query of medical records with animals.
+
+    Returns:
+        Select: The query with the columns labelled as expected by
+            `MedicalRecordDTO.from_records`.
+    """
+
+    return (
+        select(
+            medical_record_table.c.id,
+            medical_record_table.c.visit_date,
+            medical_record_table.c.diagnosis,
+            medical_record_table.c.treatment,
+            *(column.label(f"animal_{column.name}") for column in animal_table.c),
+        )
+        .select_from(
+            join(
+                medical_record_table,
+                animal_table,
+                medical_record_table.c.animal_id == animal_table.c.id
+            )
+        )
+    )
 
 
+@observed_methods(repository_latency)
+@timed_methods("map")
 class MedicalRecordRepository(IMedicalRecordRepository):
     """A class representing continent DB repository."""
 
-    async def get_all_medical_records(self) -> Iterable[Any]:
+    async def get_all_medical_records(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting all airports from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Any]: Airports in the data storage.
         """
 
         query = (
-            select(medical_record_table, animal_table)
-            .select_from(
-                join(
-                    medical_record_table,
-                    animal_table,
-                    medical_record_table.c.animal_id == animal_table.c.id
-                )
-            )
+            _medical_record_dto_query()
+            .where(medical_record_table.c.id > after_id)
             .order_by(medical_record_table.c.id.asc())
+            .limit(limit)
         )
         medical_records = await database.fetch_all(query)
 
-        return [MedicalRecordDTO.from_record(medical_record) for medical_record in medical_records]
+        return MedicalRecordDTO.from_records(medical_records)
 
-    async def get_medical_record_by_animal_id(self, animal_id: int) -> Iterable[Any]:
+    async def get_medical_record_by_animal_id(
+        self,
+        animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Any]:
         """The method getting airports assigned to particular country.
 
         Args:
             animal_id (int): The id of the country.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Any]: Airports assigned to a country.
         """
 
         query = (
-            select(medical_record_table, animal_table)
-            .select_from(
-                join(
-                    medical_record_table,
-                    animal_table,
-                    medical_record_table.c.animal_id == animal_table.c.id
-                )
-            )
+            _medical_record_dto_query()
             .where(medical_record_table.c.animal_id == animal_id)
+            .where(medical_record_table.c.id > after_id)
             .order_by(medical_record_table.c.id.asc())
+            .limit(limit)
         )
 
         medical_records = await database.fetch_all(query)
 
-        return [MedicalRecordDTO.from_record(medical_record) for medical_record in medical_records]
+        return MedicalRecordDTO.from_records(medical_records)
 
 
     async def get_medical_record_by_id(self, medical_record_id: int) -> Any | None:
@@ -80,14 +118,7 @@ class MedicalRecordRepository(IMedicalRecordRepository):
         """
 
         query = (
-            select(medical_record_table, animal_table)
-            .select_from(
-                join(
-                    medical_record_table,
-                    animal_table,
-                    medical_record_table.c.animal_id == animal_table.c.id
-                )
-            )
+            _medical_record_dto_query()
             .where(medical_record_table.c.id == medical_record_id)
             .order_by(medical_record_table.c.id.asc())
         )
@@ -95,7 +126,44 @@ class MedicalRecordRepository(IMedicalRecordRepository):
 
         return MedicalRecordDTO.from_record(medical_record) if medical_record else None
 
-    async def add_medical_record(self, data: MedicalRecordIn) -> Any | None:
+    async def get_medical_records_by_ids(self, medical_record_ids: Sequence[int]) -> Iterable[Any]:
+        """The method getting medical records by many ids from the data storage.
+
+        All ids are resolved in one query, see `match_ids`.
+
+        Args:
+            medical_record_ids (Sequence[int]): The ids of the medical records.
+
+        Returns:
+            Iterable[Any]: The medical records found, in no particular order.
+        """
+
+        query = (
+            _medical_record_dto_query()
+            .where(match_ids(medical_record_table.c.id, medical_record_ids))
+        )
+        medical_records = await database.fetch_all(query)
+
+        return MedicalRecordDTO.from_records(medical_records)
+
+    async def export_medical_records(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all medical records from the data storage.
+
+        The rows come from a server-side cursor, so memory use does not
+        depend on the size of the table.
+
+        Yields:
+            dict[str, Any]: The medical record rows ordered by id.
+        """
+
+        query = (
+            medical_record_table.select()
+            .order_by(medical_record_table.c.id.asc())
+        )
+        async for row in database.stream(query, EXPORT_CHUNK_SIZE):
+            yield dict(row)
+
+    async def add_medical_record(self, data: MedicalRecordIn) -> MedicalRecord:
         """The method adding new medical record to the data storage.
 
         Args:
@@ -103,16 +171,70 @@ class MedicalRecordRepository(IMedicalRecordRepository):
 
         Returns:
             MedicalRecord: Full details of the newly added medical record.
+        """
+
+        query = (
+            medical_record_table.insert()
+            .values(**data.model_dump())
+            .returning(medical_record_table)
+        )
+        new_medical_record = await database.write(
+            query,
+            notify=medical_record_table.name,
+        )
+        record_write(medical_record_table.name)
+        rolling_counters.add(
+            medical_record_table.name,
+            new_medical_record["visit_date"],
+        )
+
+        return MedicalRecord(**dict(new_medical_record))
+
+    async def add_medical_records(
+        self,
+        data: Sequence[MedicalRecordIn],
+    ) -> list[int | None]:
+        """The method adding many new medical records to the data storage at once.
+
+        The referenced animals are locked against removal and the rows are
+        sent as batched multi-row inserts, all in one transaction.
+
+        Args:
+            data (Sequence[MedicalRecordIn]): The attributes of the medical records.
 
         Returns:
-            Any | None: The newly added medical record.
+            list[int | None]: The ids of the created medical records
+                in input order, None where the animal does not exist.
         """
 
-        query = medical_record_table.insert().values(**data.model_dump())
-        new_medical_record_id = await database.execute(query)
-        new_medical_record = await self._get_by_id(new_medical_record_id)
+        if not data:
+            return []
 
-        return MedicalRecord(**dict(new_medical_record)) if new_medical_record else None
+        animal_query = (
+            select(animal_table.c.id)
+            .where(animal_table.c.id.in_({obj.animal_id for obj in data}))
+            .with_for_update(key_share=True)
+        )
+        query = medical_record_table.insert().returning(
+            medical_record_table.c.id,
+            sort_by_parameter_order=True,
+        )
+        async with database.transaction() as conn:
+            existing = set((await conn.execute(animal_query)).scalars())
+            rows = [obj.model_dump() for obj in data if obj.animal_id in existing]
+            created = (await conn.execute(query, rows)).scalars().all() if rows else []
+            await database.announce(conn, medical_record_table.name, *created)
+        if created:
+            record_write(medical_record_table.name)
+        for row in rows:
+            rolling_counters.add(medical_record_table.name, row["visit_date"])
+
+        new_ids = iter(created)
+
+        return [
+            next(new_ids) if obj.animal_id in existing else None
+            for obj in data
+        ]
 
     async def update_medical_record(
         self,
@@ -129,19 +251,21 @@ class MedicalRecordRepository(IMedicalRecordRepository):
             Any | None: The updated medical record details.
         """
 
-        if self._get_by_id(medical_record_id):
-            query = (
-                medical_record_table.update()
-                .where(medical_record_table.c.id == medical_record_id)
-                .values(**data.model_dump())
+        medical_record = await database.update_returning_previous(
+            medical_record_table,
+            medical_record_id,
+            data.model_dump(),
+            "visit_date",
+        )
+        if medical_record:
+            record_write(medical_record_table.name)
+            rolling_counters.move(
+                medical_record_table.name,
+                medical_record["previous_visit_date"],
+                medical_record["visit_date"],
             )
-            await database.execute(query)
-
-            medical_record = await self._get_by_id(medical_record_id)
-
-            return MedicalRecord(**dict(medical_record)) if medical_record else None
 
-        return None
+        return MedicalRecord(**dict(medical_record)) if medical_record else None
 
     async def delete_medical_record(self, medical_record_id: int) -> bool:
         """The method removing medical record from the data storage.
@@ -153,30 +277,21 @@ class MedicalRecordRepository(IMedicalRecordRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(medical_record_id):
-            query = medical_record_table \
-                .delete() \
-                .where(medical_record_table.c.id == medical_record_id)
-            await database.execute(query)
-
-            return True
-
-        return False
-
-    async def _get_by_id(self, medical_record_id: int) -> Record | None:
-        """A private method getting medical record from the DB based on its ID.
-
-        Args:
-            medical_record_id (int): The ID of the medical record.
-
-        Returns:
-            Any | None: Medical record if exists.
-        """
+        query = medical_record_table \
+            .delete() \
+            .where(medical_record_table.c.id == medical_record_id) \
+            .returning(
+                medical_record_table.c.id,
+                medical_record_table.c.visit_date,
+            )
 
-        query = (
-            medical_record_table.select()
-            .where(medical_record_table.c.id == medical_record_id)
-            .order_by(medical_record_table.c.id.asc())
-        )
+        deleted = await database.write(query, notify=medical_record_table.name)
+        if deleted:
+            record_write(medical_record_table.name)
+            rolling_counters.add(
+                medical_record_table.name,
+                deleted["visit_date"],
+                -1,
+            )
 
-        return await database.fetch_one(query)
+        return deleted is not None
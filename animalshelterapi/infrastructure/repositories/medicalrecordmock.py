@@ -1,60 +1,181 @@
 """Module containing medical record repository implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.repositories.imedicalrecord import IMedicalRecordRepository
 from animalshelterapi.core.domain.medicalrecord import MedicalRecord, MedicalRecordIn
-from animalshelterapi.infrastructure.repositories.db import medical_records
+from animalshelterapi.db import record_write
+from animalshelterapi.infrastructure.dto.medicalrecorddto import MedicalRecordDTO
+from animalshelterapi.infrastructure.repositories.db import animals, medical_records
+from animalshelterapi.infrastructure.utils.rolling import rolling_counters
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
 
 
+def _joined(obj: MedicalRecord) -> dict[str, Any] | None:
+    """Function joining the medical record with its animal.
+
+    Args:
+        obj (MedicalRecord): The stored medical record.
+
+    Returns:
+        dict[str, Any] | None: The row labelled as by the joined query,
+            None if the animal no longer exists.
+    """
+
+    if (animal := animals.get(obj.animal_id)) is None:
+        return None
+
+    return {
+        "id": obj.id,
+        "visit_date": obj.visit_date,
+        "diagnosis": obj.diagnosis,
+        "treatment": obj.treatment,
+        **{f"animal_{k}": v for k, v in animal.model_dump().items()},
+    }
+
+
+def _to_dtos(objs: Iterable[MedicalRecord]) -> list[MedicalRecordDTO]:
+    """Function mapping the medical records to DTOs, as the database
+    repository does.
+
+    Args:
+        objs (Iterable[MedicalRecord]): The stored medical records.
+
+    Returns:
+        list[MedicalRecordDTO]: The DTOs of the medical records with
+            existing animal.
+    """
+
+    return MedicalRecordDTO.from_records(
+        [row for row in map(_joined, objs) if row is not None],
+    )
+
+
+@observed_methods(repository_latency)
+@timed_methods("map")
 class MedicalRecordMockRepository(IMedicalRecordRepository):
     """A class representing medical record repository."""
 
-    async def get_all_medical_records(self) -> Iterable[MedicalRecord]:
+    async def get_all_medical_records(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[MedicalRecordDTO]:
         """The method getting all medical records from the data storage.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
-            Iterable[MedicalRecord]: Medical records in the data storage.
+            Iterable[MedicalRecordDTO]: Medical records in the data storage.
         """
 
-        return medical_records
+        return _to_dtos(medical_records.page(after_id, limit))
 
-    async def get_medical_record_by_animal_id(self, animal_id: int) -> Iterable[MedicalRecord]:
+    async def get_medical_record_by_animal_id(
+        self,
+        animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[MedicalRecordDTO]:
         """The method getting medical records assigned to particular animal.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
-            Iterable[MedicalRecord]: Medical records assigned to a country.
+            Iterable[MedicalRecordDTO]: Medical records assigned to a country.
         """
 
-        return list(filter(lambda x: x.animal_id == animal_id, medical_records))
+        return _to_dtos(medical_records.find("animal_id", animal_id, after_id, limit))
 
-    async def get_medical_record_by_id(self, medical_record_id: int) -> MedicalRecord | None:
+    async def get_medical_record_by_id(self, medical_record_id: int) -> MedicalRecordDTO | None:
         """The method getting medical record by provided id.
 
         Args:
             medical_record_id (int): The id of the medical record.
 
         Returns:
-            MedicalRecord | None: The medical record details.
+            MedicalRecordDTO | None: The medical record details.
+        """
+
+        obj = medical_records.get(medical_record_id)
+        found = _to_dtos([obj]) if obj else []
+
+        return found[0] if found else None
+
+
+    async def get_medical_records_by_ids(self, medical_record_ids: Sequence[int]) -> Iterable[MedicalRecordDTO]:
+        """The method getting medical records by many ids from the data storage.
+
+        Args:
+            medical_record_ids (Sequence[int]): The ids of the medical records.
+
+        Returns:
+            Iterable[MedicalRecordDTO]: The medical records found, in no particular order.
         """
 
-        return next((obj for obj in medical_records if obj.id == medical_record_id), None)
+        return _to_dtos(medical_records.get_many(medical_record_ids))
+
+    async def export_medical_records(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all medical records from the data storage.
 
+        Yields:
+            dict[str, Any]: The medical record rows ordered by id.
+        """
 
-    async def add_medical_record(self, data: MedicalRecordIn) -> None:
+        for obj in medical_records:
+            yield obj.model_dump()
+
+    async def add_medical_record(self, data: MedicalRecordIn) -> MedicalRecord:
         """The method adding new medical record to the data storage.
 
         Args:
             data (MedicalRecordIn): The details of the new medical record.
 
         Returns:
-            Airport: Full details of the newly added medical record.
+            MedicalRecord: Full details of the newly added medical record.
         """
 
-        medical_records.append(data)
+        medical_record = medical_records.insert(
+            lambda new_id: MedicalRecord(id=new_id, **data.model_dump()),
+        )
+        record_write(medical_records.name)
+        rolling_counters.add(medical_records.name, medical_record.visit_date)
+
+        return medical_record
+
+    async def add_medical_records(
+        self,
+        data: Sequence[MedicalRecordIn],
+    ) -> list[int | None]:
+        """The method adding many new medical records to the data storage at once.
+
+        Args:
+            data (Sequence[MedicalRecordIn]): The attributes of the medical records.
+
+        Returns:
+            list[int | None]: The ids of the created medical records
+                in input order, None where the animal does not exist.
+        """
+
+        created = [
+            medical_records.insert(
+                lambda new_id: MedicalRecord(id=new_id, **obj.model_dump()),
+            ) if obj.animal_id in animals else None
+            for obj in data
+        ]
+        new_records = [obj for obj in created if obj is not None]
+        if new_records:
+            record_write(medical_records.name)
+        for obj in new_records:
+            rolling_counters.add(medical_records.name, obj.visit_date)
+
+        return [obj.id if obj else None for obj in created]
 
     async def update_medical_record(
         self,
@@ -71,13 +192,20 @@ class MedicalRecordMockRepository(IMedicalRecordRepository):
             MedicalRecord | None: The updated medical record details.
         """
 
-        if medical_record_pos := \
-                next(filter(lambda x: x.id == medical_record_id, medical_records)):
-            medical_records[medical_record_pos] = data
-
-            return MedicalRecord(id=0, **data.model_dump())
-
-        return None
+        previous = medical_records.get(medical_record_id)
+        medical_record = medical_records.update(
+            medical_record_id,
+            lambda row_id: MedicalRecord(id=row_id, **data.model_dump()),
+        )
+        if medical_record:
+            record_write(medical_records.name)
+            rolling_counters.move(
+                medical_records.name,
+                previous.visit_date,
+                medical_record.visit_date,
+            )
+
+        return medical_record
 
     async def delete_medical_record(self, medical_record_id: int) -> bool:
         """The method removing medical record from the data storage.
@@ -89,9 +217,11 @@ class MedicalRecordMockRepository(IMedicalRecordRepository):
             bool: Success of the operation.
         """
 
-        if medical_record_pos := \
-                next(filter(lambda x: x.id == medical_record_id, medical_records)):
-            medical_records.remove(medical_record_pos)
-            return True
+        if (deleted := medical_records.get(medical_record_id)) is None:
+            return False
+
+        medical_records.delete(medical_record_id)
+        record_write(medical_records.name)
+        rolling_counters.add(medical_records.name, deleted.visit_date, -1)
 
-        return False
+        return True
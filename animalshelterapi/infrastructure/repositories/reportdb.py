@@ -1,113 +1,350 @@
-from datetime import datetime, timedelta
-from sqlalchemy import select, func
+from datetime import date, datetime, timedelta
+from typing import Any, Sequence
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Subquery,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    union_all,
+)
+from animalshelterapi.core.domain.report import (
+    Histogram,
+    HistogramBin,
+    HistogramBucket,
+    ReportIn,
+    ReportTopic,
+)
 from animalshelterapi.core.repositories.ireport import IReportRepository
 from animalshelterapi.db import (
     adoption_table,
     medical_record_table,
     animal_table,
     database,
+    record_write,
+    report_table,
 )
 from animalshelterapi.infrastructure.dto.reportdto import ReportDTO
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
+
+
+# The bin fields of the histograms with the counted tables.
+HISTOGRAM_COLUMNS = (
+    ("arrivals", animal_table.c.arrival_date),
+    ("adoptions", adoption_table.c.adoption_date),
+    ("medical_visits", medical_record_table.c.visit_date),
+)
+
+
+async def _count_recent(column: Column) -> tuple[int, int, int]:
+    """Function counting rows dated within the last day, week and month.
+
+    All three counts come from one statement using aggregate `FILTER`
+    clauses, scanning only the rows of the last month. A window of `n`
+    days starts `n - 1` days before today, compared as dates so every
+    backend counts the same rows as the rolling counters.
+
+    Args:
+        column (Column): The date column of the counted table.
+
+    Returns:
+        tuple[int, int, int]: The counts of the last day, week and month.
+    """
+
+    today = date.today()
+    last_day = today
+    last_week = today - timedelta(days=6)
+    last_month = today - timedelta(days=29)
+
+    query = (
+        select(
+            func.count().filter(column >= last_day).label("day"),
+            func.count().filter(column >= last_week).label("week"),
+            func.count().label("month"),
+        )
+        .where(column >= last_month)
+    )
+    counts = await database.fetch_one(query)
+
+    return counts["day"], counts["week"], counts["month"]
+
+
+async def _count_days(
+    since: date,
+    until: date | None = None,
+) -> dict[str, dict[date, int]]:
+    """Function counting arrivals, adoptions and medical visits per day.
+
+    Args:
+        since (date): The first counted day.
+        until (date | None): The last counted day, None for no limit.
+
+    Returns:
+        dict[str, dict[date, int]]: The numbers of rows per day,
+            keyed by table.
+    """
+
+    tables = [column.table for _, column in HISTOGRAM_COLUMNS]
+    query = union_all(*(
+        select(
+            literal(column.table.name).label("table"),
+            column.label("day"),
+            func.count().label("count"),
+        )
+        .where(column >= since)
+        .where(column <= until if until is not None else true())
+        .group_by(column)
+        for _, column in HISTOGRAM_COLUMNS
+    ))
+    counts: dict[str, dict[date, int]] = {table.name: {} for table in tables}
+    for row in await database.fetch_all(query):
+        counts[row["table"]][row["day"]] = row["count"]
+
+    return counts
+
+
+def _truncate(value: Any, bucket: HistogramBucket) -> Any:
+    """Function truncating the date to the start of its bucket.
+
+    Args:
+        value (Any): The date expression.
+        bucket (HistogramBucket): The size of the buckets.
+
+    Returns:
+        Any: The timestamp expression of the bucket start.
+    """
+
+    unit = literal_column(f"'{bucket.value}'")
+
+    return func.date_trunc(unit, cast(value, DateTime))
+
+
+def _bucket_counts(
+    column: Column,
+    label: str,
+    start: date,
+    end: date,
+    bucket: HistogramBucket,
+) -> Subquery:
+    """Function building the per-bucket counts of the table.
+
+    The range condition on the bare column lets the date index narrow the
+    scan, the rows are truncated to buckets only afterwards.
+
+    Args:
+        column (Column): The date column of the counted table.
+        label (str): The name of the count column.
+        start (date): The first day of the range.
+        end (date): The last day of the range.
+        bucket (HistogramBucket): The size of the buckets.
+
+    Returns:
+        Subquery: The bucket starts with their counts.
+    """
+
+    bucket_start = cast(_truncate(column, bucket), Date)
+
+    return (
+        select(bucket_start.label("start"), func.count().label(label))
+        .where(column >= start, column <= end)
+        .group_by(bucket_start)
+        .subquery()
+    )
 
 
+@observed_methods(repository_latency)
+@timed_methods("map")
 class ReportRepository(IReportRepository):
     """A class representing report DB repository."""
 
-    async def get_adoptions_report(self) -> ReportDTO:
-        """The method generating a report about number of adoptions
-        in the last day, week, and month."""
+    async def add_reports(self, data: Sequence[ReportIn]) -> list[ReportDTO]:
+        """The method storing generated reports as snapshots.
 
-        now = datetime.now()
-        last_day = now - timedelta(days=1)
-        last_week = now - timedelta(days=7)
-        last_month = now - timedelta(days=30)
+        Args:
+            data (Sequence[ReportIn]): The attributes of the reports.
 
-        print(last_day)
-        print(last_week)
-        print(last_month)
+        Returns:
+            list[ReportDTO]: The stored reports in input order.
+        """
 
-        query_day = select(func.count()).where(adoption_table.c.adoption_date >= last_day)
-        query_week = select(func.count()).where(adoption_table.c.adoption_date >= last_week)
-        query_month = select(func.count()).where(adoption_table.c.adoption_date >= last_month)
+        if not data:
+            return []
 
-        day_count = await database.fetch_val(query_day)
-        week_count = await database.fetch_val(query_week)
-        month_count = await database.fetch_val(query_month)
+        query = report_table.insert().returning(
+            report_table,
+            sort_by_parameter_order=True,
+        )
+        async with database.transaction() as conn:
+            result = await conn.execute(query, [obj.model_dump() for obj in data])
+            reports = [ReportDTO(**row) for row in result.mappings().all()]
+            await database.announce(
+                conn,
+                report_table.name,
+                *(report.id for report in reports),
+            )
+        record_write(report_table.name)
 
-        fake_record = {
-            "topic": "Adoptions Report",
-            "content": (
-                f"adoptions_last_day: {day_count}, "
-                f"adoptions_last_week: {week_count}, "
-                f"adoptions_last_month: {month_count}"
-            ),
-        }
+        return reports
 
-        # fake_obj_record = Report(**dict(fake_record))
+    async def get_latest_report(
+        self,
+        topic: ReportTopic,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
+        """The method getting the latest stored snapshot of the report.
 
-        return ReportDTO.from_record(fake_record)
+        Args:
+            topic (ReportTopic): The topic of the report.
+            as_of (datetime | None): The time the snapshot must not be
+                newer than, None for the latest one.
 
-    async def get_medical_records_report(self) -> ReportDTO:
-        """The method generating a report about the number of medical records
-        in the last day, week, and month."""
+        Returns:
+            ReportDTO | None: The snapshot if exists.
+        """
+
+        query = (
+            select(report_table)
+            .where(report_table.c.topic == topic.value)
+            .order_by(report_table.c.created_at.desc())
+            .limit(1)
+        )
+        if as_of is not None:
+            if as_of.tzinfo is not None:
+                as_of = as_of.astimezone().replace(tzinfo=None)
+            query = query.where(report_table.c.created_at <= as_of)
+
+        report = await database.fetch_one(query)
 
-        now = datetime.now()
-        last_day = now - timedelta(days=1)
-        last_week = now - timedelta(days=7)
-        last_month = now - timedelta(days=30)
+        return ReportDTO(**report) if report else None
 
-        print(last_day)
-        print(last_week)
-        print(last_month)
+    async def get_last_generated(self) -> datetime | None:
+        """The method getting the time of the latest stored snapshot.
 
-        query_day = select(func.count()).where(medical_record_table.c.visit_date >= last_day)
-        query_week = select(func.count()).where(medical_record_table.c.visit_date >= last_week)
-        query_month = select(func.count()).where(medical_record_table.c.visit_date >= last_month)
+        Returns:
+            datetime | None: The creation time if any snapshot exists.
+        """
 
-        day_count = await database.fetch_val(query_day)
-        week_count = await database.fetch_val(query_week)
-        month_count = await database.fetch_val(query_month)
+        return await database.fetch_val(
+            select(func.max(report_table.c.created_at)),
+        )
 
-        fake_record = {
-            "topic": "Medical records Report",
-            "content": (
-                f"medical_records_last_day: {day_count}, "
-                f"medical_records_last_week: {week_count}, "
-                f"medical_records_last_month: {month_count}"
-            ),
-        }
+    async def get_adoptions_report(self) -> ReportDTO:
+        """The method generating a report about number of adoptions
+        in the last day, week, and month."""
+
+        counts = await _count_recent(adoption_table.c.adoption_date)
+
+        return ReportDTO.from_counts(ReportTopic.ADOPTIONS, *counts)
+
+    async def get_medical_records_report(self) -> ReportDTO:
+        """The method generating a report about the number of medical records
+        in the last day, week, and month."""
 
+        counts = await _count_recent(medical_record_table.c.visit_date)
 
-        return ReportDTO.from_record(fake_record)
+        return ReportDTO.from_counts(ReportTopic.MEDICAL_RECORDS, *counts)
 
     async def get_animals_report(self) -> ReportDTO:
         """The method generating a report about the number of animals
         in the shelter in the last day, week, and month."""
 
-        now = datetime.now()
-        last_day = now - timedelta(days=1)
-        last_week = now - timedelta(days=7)
-        last_month = now - timedelta(days=30)
-
-        print(last_day)
-        print(last_week)
-        print(last_month)
-
-        query_day = select(func.count()).where(animal_table.c.arrival_date >= last_day)
-        query_week = select(func.count()).where(animal_table.c.arrival_date >= last_week)
-        query_month = select(func.count()).where(animal_table.c.arrival_date >= last_month)
-
-        day_count = await database.fetch_val(query_day)
-        week_count = await database.fetch_val(query_week)
-        month_count = await database.fetch_val(query_month)
-
-        fake_record = {
-            "topic": "Animals in shelter Report",
-            "content": (
-                f"animals_last_day: {day_count}, "
-                f"animals_last_week: {week_count}, "
-                f"animals_last_month: {month_count}"
-            ),
-        }
-
-        return ReportDTO.from_record(fake_record)
+        counts = await _count_recent(animal_table.c.arrival_date)
+
+        return ReportDTO.from_counts(ReportTopic.ANIMALS, *counts)
+
+    async def get_daily_counts(self, since: date) -> dict[str, dict[date, int]]:
+        """The method counting arrivals, adoptions and medical visits
+        per day.
+
+        Args:
+            since (date): The first counted day.
+
+        Returns:
+            dict[str, dict[date, int]]: The numbers of rows per day,
+                keyed by table.
+        """
+
+        return await _count_days(since)
+
+    async def get_histogram(
+        self,
+        start: date,
+        end: date,
+        bucket: HistogramBucket,
+    ) -> Histogram:
+        """The method getting the numbers of arrivals, adoptions and
+        medical visits per bucket.
+
+        On PostgreSQL all buckets of the range, including the empty ones,
+        come from one query joining the per-table counts to a
+        `generate_series` of the bucket starts. Other backends have no
+        `generate_series`, there the daily counts of the range are summed
+        into the buckets.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+            bucket (HistogramBucket): The size of the buckets.
+
+        Returns:
+            Histogram: The counts per bucket.
+        """
+
+        if database.engine.dialect.name != "postgresql":
+            days = await _count_days(start, end)
+
+            return Histogram.from_days(bucket, start, end, {
+                field: days[column.table.name]
+                for field, column in HISTOGRAM_COLUMNS
+            })
+
+        step = literal_column(f"interval '1 {bucket.value}'")
+        series = select(
+            cast(
+                func.generate_series(
+                    _truncate(start, bucket),
+                    cast(end, DateTime),
+                    step,
+                ),
+                Date,
+            ).label("start"),
+        ).subquery()
+        counts = [
+            _bucket_counts(column, label, start, end, bucket)
+            for label, column in HISTOGRAM_COLUMNS
+        ]
+
+        joined = series
+        for subquery in counts:
+            joined = joined.outerjoin(
+                subquery,
+                subquery.c.start == series.c.start,
+            )
+
+        query = (
+            select(
+                series.c.start,
+                *(
+                    func.coalesce(column, 0).label(column.name)
+                    for subquery in counts
+                    for column in subquery.c
+                    if column.name != "start"
+                ),
+            )
+            .select_from(joined)
+            .order_by(series.c.start)
+        )
+        rows = await database.fetch_all(query)
+
+        return Histogram(
+            bucket=bucket,
+            start=start,
+            end=end,
+            bins=[HistogramBin(**row) for row in rows],
+        )
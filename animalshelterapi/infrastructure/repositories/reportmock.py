@@ -0,0 +1,207 @@
+"""Module containing report repository implementation."""
+
+from datetime import date, datetime, timedelta
+from typing import Sequence
+
+from animalshelterapi.core.domain.report import (
+    Histogram,
+    HistogramBucket,
+    ReportIn,
+    ReportTopic,
+)
+from animalshelterapi.core.repositories.ireport import IReportRepository
+from animalshelterapi.db import record_write
+from animalshelterapi.infrastructure.dto.reportdto import ReportDTO
+from animalshelterapi.infrastructure.repositories.db import (
+    MemoryTable,
+    adoptions,
+    animals,
+    medical_records,
+    reports,
+)
+from animalshelterapi.infrastructure.utils.rolling import REPORT_WINDOWS
+from animalshelterapi.utils.metrics import observed_methods, repository_latency
+from animalshelterapi.utils.timing import timed_methods
+
+# The bin fields of the histograms with the counted tables and date fields.
+HISTOGRAM_FIELDS = (
+    ("arrivals", animals, "arrival_date"),
+    ("adoptions", adoptions, "adoption_date"),
+    ("medical_visits", medical_records, "visit_date"),
+)
+
+
+def _count_days(
+    table: MemoryTable,
+    field: str,
+    since: date,
+    until: date | None = None,
+) -> dict[date, int]:
+    """Function counting the rows of the table per day.
+
+    Args:
+        table (MemoryTable): The counted table.
+        field (str): The date field of the rows.
+        since (date): The first counted day.
+        until (date | None): The last counted day, None for no limit.
+
+    Returns:
+        dict[date, int]: The numbers of rows per day.
+    """
+
+    counts: dict[date, int] = {}
+    for row in table:
+        day = getattr(row, field)
+        if day is not None and day >= since and (until is None or day <= until):
+            counts[day] = counts.get(day, 0) + 1
+
+    return counts
+
+
+def _count_recent(table: MemoryTable, field: str) -> tuple[int, int, int]:
+    """Function counting rows dated within the last day, week and month.
+
+    Args:
+        table (MemoryTable): The counted table.
+        field (str): The date field of the rows.
+
+    Returns:
+        tuple[int, int, int]: The counts of the last day, week and month.
+    """
+
+    today = date.today()
+    days = _count_days(table, field, today - timedelta(days=max(REPORT_WINDOWS) - 1))
+
+    return tuple(  # type: ignore
+        sum(
+            count for day, count in days.items()
+            if day >= today - timedelta(days=length - 1)
+        )
+        for length in REPORT_WINDOWS
+    )
+
+
+@observed_methods(repository_latency)
+@timed_methods("map")
+class ReportMockRepository(IReportRepository):
+    """A class representing report repository."""
+
+    async def add_reports(self, data: Sequence[ReportIn]) -> list[ReportDTO]:
+        """The method storing generated reports as snapshots.
+
+        Args:
+            data (Sequence[ReportIn]): The attributes of the reports.
+
+        Returns:
+            list[ReportDTO]: The stored reports in input order.
+        """
+
+        new_reports = [
+            reports.insert(lambda new_id: ReportDTO(id=new_id, **obj.model_dump()))
+            for obj in data
+        ]
+        if new_reports:
+            record_write(reports.name)
+
+        return new_reports
+
+    async def get_latest_report(
+        self,
+        topic: ReportTopic,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
+        """The method getting the latest stored snapshot of the report.
+
+        Args:
+            topic (ReportTopic): The topic of the report.
+            as_of (datetime | None): The time the snapshot must not be
+                newer than, None for the latest one.
+
+        Returns:
+            ReportDTO | None: The snapshot if exists.
+        """
+
+        if as_of is not None and as_of.tzinfo is not None:
+            as_of = as_of.astimezone().replace(tzinfo=None)
+
+        return max(
+            (
+                report for report in reports.find("topic", topic.value)
+                if as_of is None or report.created_at <= as_of
+            ),
+            key=lambda report: report.created_at,
+            default=None,
+        )
+
+    async def get_last_generated(self) -> datetime | None:
+        """The method getting the time of the latest stored snapshot.
+
+        Returns:
+            datetime | None: The creation time if any snapshot exists.
+        """
+
+        return max((report.created_at for report in reports), default=None)
+
+    async def get_adoptions_report(self) -> ReportDTO:
+        """The method generating a report about number of adoptions
+        in the last day, week, and month."""
+
+        counts = _count_recent(adoptions, "adoption_date")
+
+        return ReportDTO.from_counts(ReportTopic.ADOPTIONS, *counts)
+
+    async def get_medical_records_report(self) -> ReportDTO:
+        """The method generating a report about the number of medical records
+        in the last day, week, and month."""
+
+        counts = _count_recent(medical_records, "visit_date")
+
+        return ReportDTO.from_counts(ReportTopic.MEDICAL_RECORDS, *counts)
+
+    async def get_animals_report(self) -> ReportDTO:
+        """The method generating a report about the number of animals
+        in the shelter in the last day, week, and month."""
+
+        counts = _count_recent(animals, "arrival_date")
+
+        return ReportDTO.from_counts(ReportTopic.ANIMALS, *counts)
+
+    async def get_daily_counts(self, since: date) -> dict[str, dict[date, int]]:
+        """The method counting arrivals, adoptions and medical visits
+        per day.
+
+        Args:
+            since (date): The first counted day.
+
+        Returns:
+            dict[str, dict[date, int]]: The numbers of rows per day,
+                keyed by table.
+        """
+
+        return {
+            table.name: _count_days(table, field, since)
+            for _, table, field in HISTOGRAM_FIELDS
+        }
+
+    async def get_histogram(
+        self,
+        start: date,
+        end: date,
+        bucket: HistogramBucket,
+    ) -> Histogram:
+        """The method getting the numbers of arrivals, adoptions and
+        medical visits per bucket.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+            bucket (HistogramBucket): The size of the buckets.
+
+        Returns:
+            Histogram: The counts per bucket.
+        """
+
+        return Histogram.from_days(bucket, start, end, {
+            label: _count_days(table, field, start, end)
+            for label, table, field in HISTOGRAM_FIELDS
+        })
@@ -1,28 +1,38 @@
 
 """Module containing continent service implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 
 from animalshelterapi.core.domain.adoption import Adopter, AdopterIn
 from animalshelterapi.core.repositories.iadopter import IAdopterRepository
 from animalshelterapi.infrastructure.services.iadopter import IAdopterService
 from animalshelterapi.infrastructure.services.ianimal import IAnimalService
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+from animalshelterapi.utils.timing import timed_methods
 
 
+@timed_methods("svc")
 class AdopterService(IAdopterService):
     """A class implementing the continent service."""
 
     _repository: IAdopterRepository
+    _cache: ReadCache
 
-    def __init__(self, repository: IAdopterRepository) -> None:
+    def __init__(
+        self,
+        repository: IAdopterRepository,
+        cache: ReadCache,
+    ) -> None:
         """The initializer of the `Adopter service`.
 
         Args:
             repository (IAdopterRepository): The reference to the repository.
+            cache (ReadCache): The cache of the repository reads.
         """
 
         self._repository = repository
+        self._cache = cache
 
     async def get_adopter_by_id(self, adopter_id: int) -> Adopter | None:
         """The method getting an adopter from the repository.
@@ -34,40 +44,119 @@ class AdopterService(IAdopterService):
             Adopter | None: The adopter data if exists.
         """
 
-        return await self._repository.get_adopter_by_id(adopter_id)
+        return await self._cache.read(
+            ("adopter.get_adopter_by_id", adopter_id),
+            lambda: self._repository.get_adopter_by_id(adopter_id),
+            tags=lambda _: [f"adopters:{adopter_id}"],
+            value_type=Adopter | None,
+        )
+
+    async def get_adopters_by_ids(self, adopter_ids: Sequence[int]) -> Iterable[Adopter]:
+        """The method getting adopters by many ids from the repository.
+
+        Args:
+            adopter_ids (Sequence[int]): The ids of the adopters.
+
+        Returns:
+            Iterable[Adopter]: The adopters found, in no particular order.
+        """
+
+        return await self._cache.read(
+            ("adopter.get_adopters_by_ids", tuple(adopter_ids)),
+            lambda: self._repository.get_adopters_by_ids(adopter_ids),
+            tags=lambda _: [f"adopters:{adopter_id}" for adopter_id in adopter_ids],
+            value_type=list[Adopter],
+        )
 
-    async def get_adopter_by_last_name(self, last_name: str) -> Iterable[Adopter]:
+    async def get_adopter_by_last_name(
+        self,
+        last_name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The method getting an adopter from the repository.
 
         Args:
             last_name (str): The last name of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adopter]: The adopter data if exists.
         """
 
-        return await self._repository.get_adopter_by_last_name(last_name)
+        return await self._cache.read(
+            ("adopter.get_adopter_by_last_name", last_name, after_id, limit),
+            lambda: self._repository.get_adopter_by_last_name(
+                last_name,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["adopters:list"],
+            value_type=list[Adopter],
+        )
 
-    async def get_adopter_by_phone_number(self, phone_number: str) -> Iterable[Adopter]:
+    async def get_adopter_by_phone_number(
+        self,
+        phone_number: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The method getting an adopter from the repository.
 
         Args:
             phone_number (str): The phone number of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adopter]: The adopter data if exists.
         """
 
-        return await self._repository.get_adopter_by_phone_number(phone_number)
+        return await self._cache.read(
+            ("adopter.get_adopter_by_phone_number", phone_number, after_id, limit),
+            lambda: self._repository.get_adopter_by_phone_number(
+                phone_number,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["adopters:list"],
+            value_type=list[Adopter],
+        )
 
-    async def get_all_adopters(self) -> Iterable[Adopter]:
+    async def get_all_adopters(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The method getting all adopters from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Adopter]: The collection of the all adopters.
         """
 
-        return await self._repository.get_all_adopters()
+        return await self._cache.read(
+            ("adopter.get_all_adopters", after_id, limit),
+            lambda: self._repository.get_all_adopters(
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["adopters:list"],
+            value_type=list[Adopter],
+        )
+
+    def export_adopters(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all adopters from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The adopter rows ordered by id.
+        """
+
+        return self._repository.export_adopters()
 
     async def add_adopter(self, data: AdopterIn) -> Adopter | None:
         """The method adding new adopter to the repository.
@@ -79,7 +168,29 @@ class AdopterService(IAdopterService):
             Adopter | None: The newly created adopter.
         """
 
-        return await self._repository.add_adopter(data)
+        new_adopter = await self._repository.add_adopter(data)
+        if new_adopter:
+            await self._cache.invalidate(f"adopters:{new_adopter.id}", "adopters:list")
+
+        return new_adopter
+
+    async def add_adopters(self, data: Sequence[AdopterIn]) -> list[int]:
+        """The method adding many new adopters to the repository at once.
+
+        Args:
+            data (Sequence[AdopterIn]): The attributes of the adopters.
+
+        Returns:
+            list[int]: The ids of the created adopters in input order.
+        """
+
+        new_ids = await self._repository.add_adopters(data)
+        await self._cache.invalidate(
+            *(f"adopters:{new_id}" for new_id in new_ids),
+            "adopters:list",
+        )
+
+        return new_ids
 
     async def update_adopter(
         self,
@@ -96,10 +207,13 @@ class AdopterService(IAdopterService):
             Adopter | None: The updated continent.
         """
 
-        return await self._repository.update_adopter(
+        updated_adopter = await self._repository.update_adopter(
             adopter_id=adopter_id,
             data=data,
         )
+        await self._cache.invalidate(f"adopters:{adopter_id}", "adopters:list")
+
+        return updated_adopter
 
     async def delete_adopter(self, adopter_id: int) -> bool:
         """The method removing adopter from the repository.
@@ -111,4 +225,7 @@ class AdopterService(IAdopterService):
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_adopter(adopter_id)
+        deleted = await self._repository.delete_adopter(adopter_id)
+        await self._cache.invalidate(f"adopters:{adopter_id}", "adopters:list")
+
+        return deleted
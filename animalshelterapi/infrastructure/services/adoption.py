@@ -1,60 +1,135 @@
 
 """Module containing continent service implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.adoption import Adoption, AdoptionIn
 from animalshelterapi.core.repositories.iadoption import IAdoptionRepository
 from animalshelterapi.infrastructure.dto.adoptiondto import AdoptionDTO
 from animalshelterapi.infrastructure.services.iadoption import IAdoptionService
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+from animalshelterapi.utils.timing import timed_methods
 
 
+def _embedded_tags(adoptions: Iterable[Any]) -> list[str]:
+    """Function listing the cache tags of animals and adopters in adoptions.
+
+    Args:
+        adoptions (Iterable[Any]): The adoptions, None or without details.
+
+    Returns:
+        list[str]: The tags of the embedded animals and adopters.
+    """
+
+    return [
+        tag
+        for adoption in adoptions
+        if isinstance(adoption, AdoptionDTO)
+        for tag in (f"animals:{adoption.animal.id}", f"adopters:{adoption.adopter.id}")
+    ]
+
+@timed_methods("svc")
 class AdoptionService(IAdoptionService):
     """A class implementing the airport service."""
 
     _repository: IAdoptionRepository
+    _cache: ReadCache
 
-    def __init__(self, repository: IAdoptionRepository) -> None:
+    def __init__(
+        self,
+        repository: IAdoptionRepository,
+        cache: ReadCache,
+    ) -> None:
         """The initializer of the `adoption service`.
 
         Args:
             repository (IAdoptionRepository): The reference to the repository.
+            cache (ReadCache): The cache of the repository reads.
         """
 
         self._repository = repository
+        self._cache = cache
 
-    async def get_all(self) -> Iterable[AdoptionDTO]:
+    async def get_all(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[AdoptionDTO]:
         """The method getting all adoptions from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[AdoptionDTO]: All adoptions.
         """
 
-        return await self._repository.get_all_adoptions()
+        return await self._cache.read(
+            ("adoption.get_all_adoptions", after_id, limit),
+            lambda: self._repository.get_all_adoptions(
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda adoptions: ["adoptions:list", *_embedded_tags(adoptions)],
+            value_type=list[AdoptionDTO],
+        )
 
-    async def get_by_animal_id(self, animal_id: int) -> Iterable[Adoption]:
+    async def get_by_animal_id(
+        self,
+        animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adoption]:
         """The method getting adoption assigned to particular animal.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adoption]: The adoption details
         """
 
-        return await self._repository.get_by_animal_id(animal_id)
+        return await self._cache.read(
+            ("adoption.get_by_animal_id", animal_id, after_id, limit),
+            lambda: self._repository.get_by_animal_id(
+                animal_id,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda adoptions: ["adoptions:list", *_embedded_tags(adoptions)],
+            value_type=list[Adoption],
+        )
 
-    async def get_by_adopter_id(self, adopter_id: int) -> Iterable[Adoption]:
+    async def get_by_adopter_id(
+        self,
+        adopter_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adoption]:
         """The method getting adoptions assigned to particular adopter.
 
         Args:
             adopter_id (int): The id of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adoption]: Adoptions assigned to an adopter.
         """
 
-        return await self._repository.get_by_adopter_id(adopter_id)
+        return await self._cache.read(
+            ("adoption.get_by_adopter_id", adopter_id, after_id, limit),
+            lambda: self._repository.get_by_adopter_id(
+                adopter_id,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda adoptions: ["adoptions:list", *_embedded_tags(adoptions)],
+            value_type=list[Adoption],
+        )
 
     async def get_by_id(self, adoption_id: int) -> AdoptionDTO | None:
         """The method getting adoption by provided id.
@@ -66,7 +141,42 @@ class AdoptionService(IAdoptionService):
             AdoptionDTO | None: The adoption details.
         """
 
-        return await self._repository.get_by_id(adoption_id)
+        return await self._cache.read(
+            ("adoption.get_by_id", adoption_id),
+            lambda: self._repository.get_by_id(adoption_id),
+            tags=lambda adoption: [f"adoptions:{adoption_id}", *_embedded_tags([adoption])],
+            value_type=AdoptionDTO | None,
+        )
+
+    async def get_by_ids(self, adoption_ids: Sequence[int]) -> Iterable[AdoptionDTO]:
+        """The method getting adoptions by many ids from the repository.
+
+        Args:
+            adoption_ids (Sequence[int]): The ids of the adoptions.
+
+        Returns:
+            Iterable[AdoptionDTO]: The adoptions found, in no particular order.
+        """
+
+        return await self._cache.read(
+            ("adoption.get_by_ids", tuple(adoption_ids)),
+            lambda: self._repository.get_by_ids(adoption_ids),
+            tags=lambda adoptions: [
+                *(f"adoptions:{adoption_id}" for adoption_id in adoption_ids),
+                *_embedded_tags(adoptions),
+            ],
+            value_type=list[AdoptionDTO],
+        )
+
+    def export_adoptions(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all adoptions from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The adoption rows with the animal and
+                adopter columns, ordered by id.
+        """
+
+        return self._repository.export_adoptions()
 
     async def add_adoption(self, data: AdoptionIn) -> Adoption | None:
         """The method adding new adoption to the data storage.
@@ -78,7 +188,11 @@ class AdoptionService(IAdoptionService):
             Adoption | None: Full details of the newly added adoption.
         """
 
-        return await self._repository.add_adoption(data)
+        new_adoption = await self._repository.add_adoption(data)
+        if new_adoption:
+            await self._cache.invalidate(f"adoptions:{new_adoption.id}", "adoptions:list")
+
+        return new_adoption
 
     async def update_adoption(
         self,
@@ -95,10 +209,13 @@ class AdoptionService(IAdoptionService):
             Adoption | None: The updated adoption details.
         """
 
-        return await self._repository.update_adoption(
+        updated_adoption = await self._repository.update_adoption(
             adoption_id=adoption_id,
             data=data,
         )
+        await self._cache.invalidate(f"adoptions:{adoption_id}", "adoptions:list")
+
+        return updated_adoption
 
     async def delete_adoption(self, adoption_id: int) -> bool:
         """The method removing adoption from the data storage.
@@ -110,4 +227,7 @@ class AdoptionService(IAdoptionService):
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_adoption(adoption_id)
+        deleted = await self._repository.delete_adoption(adoption_id)
+        await self._cache.invalidate(f"adoptions:{adoption_id}", "adoptions:list")
+
+        return deleted
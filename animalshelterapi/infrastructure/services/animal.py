@@ -1,26 +1,36 @@
 """Module containing animal service implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 
-from animalshelterapi.core.domain.animal import Animal, AnimalIn
+from animalshelterapi.core.domain.animal import Animal, AnimalIn, AnimalSearch
 from animalshelterapi.core.repositories.ianimal import IAnimalRepository
 from animalshelterapi.infrastructure.services.ianimal import IAnimalService
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+from animalshelterapi.utils.timing import timed_methods
 
 
+@timed_methods("svc")
 class AnimalService(IAnimalService):
     """A class implementing the continent service."""
 
     _repository: IAnimalRepository
+    _cache: ReadCache
 
-    def __init__(self, repository: IAnimalRepository) -> None:
+    def __init__(
+        self,
+        repository: IAnimalRepository,
+        cache: ReadCache,
+    ) -> None:
         """The initializer of the `animal service`.
 
         Args:
             repository (IAnimalRepository): The reference to the repository.
+            cache (ReadCache): The cache of the repository reads.
         """
 
         self._repository = repository
+        self._cache = cache
 
     async def get_animal_by_id(self, animal_id: int) -> Animal | None:
         """The method getting an animal from the repository.
@@ -32,76 +42,242 @@ class AnimalService(IAnimalService):
             Animal | None: The animal data if exists.
         """
 
-        return await self._repository.get_animal_by_id(animal_id)
+        return await self._cache.read(
+            ("animal.get_animal_by_id", animal_id),
+            lambda: self._repository.get_animal_by_id(animal_id),
+            tags=lambda _: [f"animals:{animal_id}"],
+            value_type=Animal | None,
+        )
+
+    async def get_animals_by_ids(self, animal_ids: Sequence[int]) -> Iterable[Animal]:
+        """The method getting animals by many ids from the repository.
 
-    async def get_animal_by_name(self, name: str) -> Iterable[Animal]:
+        Args:
+            animal_ids (Sequence[int]): The ids of the animals.
+
+        Returns:
+            Iterable[Animal]: The animals found, in no particular order.
+        """
+
+        return await self._cache.read(
+            ("animal.get_animals_by_ids", tuple(animal_ids)),
+            lambda: self._repository.get_animals_by_ids(animal_ids),
+            tags=lambda _: [f"animals:{animal_id}" for animal_id in animal_ids],
+            value_type=list[Animal],
+        )
+
+    async def get_animal_by_name(
+        self,
+        name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting an animal from the repository.
 
         Args:
             name (str): The name of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return await self._repository.get_animal_by_name(name)
+        return await self._cache.read(
+            ("animal.get_animal_by_name", name, after_id, limit),
+            lambda: self._repository.get_animal_by_name(
+                name,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["animals:list"],
+            value_type=list[Animal],
+        )
 
-    async def get_animal_by_species(self, species: str) -> Iterable[Animal]:
+    async def get_animal_by_species(
+        self,
+        species: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting an animal from the repository.
 
         Args:
             species (str): The species of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return await self._repository.get_animal_by_species(species)
+        return await self._cache.read(
+            ("animal.get_animal_by_species", species, after_id, limit),
+            lambda: self._repository.get_animal_by_species(
+                species,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["animals:list"],
+            value_type=list[Animal],
+        )
 
-    async def get_animal_by_breed(self, breed: str) -> Iterable[Animal]:
+    async def get_animal_by_breed(
+        self,
+        breed: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting an animal from the repository.
 
         Args:
             breed (str): The breed of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return await self._repository.get_animal_by_breed(breed)
+        return await self._cache.read(
+            ("animal.get_animal_by_breed", breed, after_id, limit),
+            lambda: self._repository.get_animal_by_breed(
+                breed,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["animals:list"],
+            value_type=list[Animal],
+        )
 
-    async def get_animal_by_gender(self, gender: str) -> Iterable[Animal]:
+    async def get_animal_by_gender(
+        self,
+        gender: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting an animal from the repository.
 
         Args:
             gender (str): The gender of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return await self._repository.get_animal_by_gender(gender)
+        return await self._cache.read(
+            ("animal.get_animal_by_gender", gender, after_id, limit),
+            lambda: self._repository.get_animal_by_gender(
+                gender,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["animals:list"],
+            value_type=list[Animal],
+        )
 
-    async def get_animal_by_adoption_status(self, adoption_status: str) -> Iterable[Animal]:
+    async def get_animal_by_adoption_status(
+        self,
+        adoption_status: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting an animal from the repository.
 
         Args:
             adoption_status (str): The adoption status of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The animal data if exists.
         """
 
-        return await self._repository.get_animal_by_adoption_status(adoption_status)
+        return await self._cache.read(
+            ("animal.get_animal_by_adoption_status", adoption_status, after_id, limit),
+            lambda: self._repository.get_animal_by_adoption_status(
+                adoption_status,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["animals:list"],
+            value_type=list[Animal],
+        )
 
-    async def get_all_animals(self) -> Iterable[Animal]:
+    async def get_all_animals(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The method getting all animals from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Animal]: The collection of the all animals.
         """
 
-        return await self._repository.get_all_animals()
+        return await self._cache.read(
+            ("animal.get_all_animals", after_id, limit),
+            lambda: self._repository.get_all_animals(
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["animals:list"],
+            value_type=list[Animal],
+        )
+
+    async def search_animals(
+        self,
+        criteria: AnimalSearch,
+        after_value: Any = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
+        """The method searching animals in the repository.
+
+        Args:
+            criteria (AnimalSearch): The filters and the sort order.
+            after_value (Any): The sort key of the row after which
+                the collection starts.
+            after_id (int | None): The id of the row after which
+                the collection starts.
+            limit (int | None): The maximum number of items.
+
+        Returns:
+            Iterable[Animal]: The collection of the matching animals.
+        """
+
+        return await self._cache.read(
+            (
+                "animal.search_animals",
+                criteria.model_dump_json(),
+                str(after_value),
+                after_id,
+                limit,
+            ),
+            lambda: self._repository.search_animals(
+                criteria,
+                after_value=after_value,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda _: ["animals:list"],
+            value_type=list[Animal],
+        )
+
+    def export_animals(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all animals from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The animal rows ordered by id.
+        """
+
+        return self._repository.export_animals()
 
     async def add_animal(self, data: AnimalIn) -> Animal | None:
         """The method adding new animal to the repository.
@@ -113,7 +289,29 @@ class AnimalService(IAnimalService):
             Animal | None: The newly created animal.
         """
 
-        return await self._repository.add_animal(data)
+        new_animal = await self._repository.add_animal(data)
+        if new_animal:
+            await self._cache.invalidate(f"animals:{new_animal.id}", "animals:list")
+
+        return new_animal
+
+    async def add_animals(self, data: Sequence[AnimalIn]) -> list[int]:
+        """The method adding many new animals to the repository at once.
+
+        Args:
+            data (Sequence[AnimalIn]): The attributes of the animals.
+
+        Returns:
+            list[int]: The ids of the created animals in input order.
+        """
+
+        new_ids = await self._repository.add_animals(data)
+        await self._cache.invalidate(
+            *(f"animals:{new_id}" for new_id in new_ids),
+            "animals:list",
+        )
+
+        return new_ids
 
     async def update_animal(
         self,
@@ -130,10 +328,13 @@ class AnimalService(IAnimalService):
             Animal | None: The updated animal.
         """
 
-        return await self._repository.update_animal(
+        updated_animal = await self._repository.update_animal(
             animal_id=animal_id,
             data=data,
         )
+        await self._cache.invalidate(f"animals:{animal_id}", "animals:list")
+
+        return updated_animal
 
     async def delete_animal(self, animal_id: int) -> bool:
         """The method removing animal from the repository.
@@ -145,4 +346,7 @@ class AnimalService(IAnimalService):
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_animal(animal_id)
+        deleted = await self._repository.delete_animal(animal_id)
+        await self._cache.invalidate(f"animals:{animal_id}", "animals:list")
+
+        return deleted
@@ -1,7 +1,7 @@
 """Module containing adopter service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.adoption import Adopter, AdopterIn
 
@@ -21,35 +21,76 @@ class IAdopterService(ABC):
         """
 
     @abstractmethod
-    async def get_adopter_by_last_name(self, last_name: str) -> Iterable[Adopter]:
+    async def get_adopters_by_ids(self, adopter_ids: Sequence[int]) -> Iterable[Adopter]:
+        """The abstract getting adopters by many ids from the repository.
+
+        Args:
+            adopter_ids (Sequence[int]): The ids of the adopters.
+
+        Returns:
+            Iterable[Adopter]: The adopters found, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_adopter_by_last_name(
+        self,
+        last_name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The abstract getting an adopter from the repository.
 
         Args:
             last_name (int): The last name of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Adopter | None: The adopter data if exists.
         """
 
     @abstractmethod
-    async def get_adopter_by_phone_number(self, phone_number: str) -> Iterable[Adopter]:
+    async def get_adopter_by_phone_number(
+        self,
+        phone_number: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The abstract getting an adopter from the repository.
 
         Args:
             phone_number (str): The phone number of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adopter]: The adopter data if exists.
         """
 
     @abstractmethod
-    async def get_all_adopters(self) -> Iterable[Adopter]:
+    async def get_all_adopters(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adopter]:
         """The abstract getting all adopters from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Adopter]: The collection of the all adopters.
         """
 
+    @abstractmethod
+    def export_adopters(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all adopters from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The adopter rows ordered by id.
+        """
+
     @abstractmethod
     async def add_adopter(self, data: AdopterIn) -> Adopter | None:
         """The abstract adding new adopter to the repository.
@@ -61,6 +102,17 @@ class IAdopterService(ABC):
             Adopter | None: The newly created adopter.
         """
 
+    @abstractmethod
+    async def add_adopters(self, data: Sequence[AdopterIn]) -> list[int]:
+        """The abstract adding many new adopters to the repository at once.
+
+        Args:
+            data (Sequence[AdopterIn]): The attributes of the adopters.
+
+        Returns:
+            list[int]: The ids of the created adopters in input order.
+        """
+
     @abstractmethod
     async def update_adopter(
         self,
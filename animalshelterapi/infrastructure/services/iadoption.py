@@ -1,7 +1,7 @@
 """Module containing adoption service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.adoption import Adoption, AdoptionIn
 from animalshelterapi.infrastructure.dto.adoptiondto import AdoptionDTO
@@ -11,30 +11,52 @@ class IAdoptionService(ABC):
     """A class representing airport repository."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[AdoptionDTO]:
+    async def get_all(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[AdoptionDTO]:
         """The method getting all adoptions from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[AdoptionDTO]: All adoptions.
         """
 
     @abstractmethod
-    async def get_by_animal_id(self, animal_id: int) -> Iterable[Adoption]:
+    async def get_by_animal_id(
+        self,
+        animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adoption]:
         """The method getting adoption assigned to particular animal.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adoption]: The adoption details.
         """
 
     @abstractmethod
-    async def get_by_adopter_id(self, adopter_id: int) -> Iterable[Adoption]:
+    async def get_by_adopter_id(
+        self,
+        adopter_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Adoption]:
         """The method getting adoptions assigned to particular adopter.
 
         Args:
             adopter_id (int): The id of the adopter.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Adoption]: Adoptions assigned to an adopter.
@@ -51,6 +73,26 @@ class IAdoptionService(ABC):
             AdoptionDTO | None: The adoption details.
         """
 
+    @abstractmethod
+    async def get_by_ids(self, adoption_ids: Sequence[int]) -> Iterable[AdoptionDTO]:
+        """The abstract getting adoptions by many ids from the repository.
+
+        Args:
+            adoption_ids (Sequence[int]): The ids of the adoptions.
+
+        Returns:
+            Iterable[AdoptionDTO]: The adoptions found, in no particular order.
+        """
+
+    @abstractmethod
+    def export_adoptions(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all adoptions from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The adoption rows with the animal and
+                adopter columns, ordered by id.
+        """
+
     @abstractmethod
     async def add_adoption(self, data: AdoptionIn) -> Adoption | None:
         """The method adding new adoption to the data storage.
@@ -1,9 +1,9 @@
 """Module containing continent service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
-from animalshelterapi.core.domain.animal import Animal, AnimalIn
+from animalshelterapi.core.domain.animal import Animal, AnimalIn, AnimalSearch
 
 
 class IAnimalService(ABC):
@@ -21,68 +21,152 @@ class IAnimalService(ABC):
         """
 
     @abstractmethod
-    async def get_animal_by_name(self, name: str) -> Iterable[Animal]:
+    async def get_animals_by_ids(self, animal_ids: Sequence[int]) -> Iterable[Animal]:
+        """The abstract getting animals by many ids from the repository.
+
+        Args:
+            animal_ids (Sequence[int]): The ids of the animals.
+
+        Returns:
+            Iterable[Animal]: The animals found, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_animal_by_name(
+        self,
+        name: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The abstract getting animals from the repository.
 
         Args:
             name (str): The name of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The collection of all animals with given name.
         """
 
     @abstractmethod
-    async def get_animal_by_species(self, species: str) -> Iterable[Animal]:
+    async def get_animal_by_species(
+        self,
+        species: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The abstract getting animals from the repository.
 
         Args:
             species (str): The species of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The collection of all animals with given species.
         """
 
     @abstractmethod
-    async def get_animal_by_breed(self, breed: str) -> Iterable[Animal]:
+    async def get_animal_by_breed(
+        self,
+        breed: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The abstract getting animals from the repository.
 
         Args:
             breed (str): The breed of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The collection of all animals with given breed.
         """
 
     @abstractmethod
-    async def get_animal_by_gender(self, gender: str) -> Iterable[Animal]:
+    async def get_animal_by_gender(
+        self,
+        gender: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The abstract getting animals from the repository.
 
         Args:
             gender (str): The gender of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The collection of all animals with given gender.
         """
 
     @abstractmethod
-    async def get_animal_by_adoption_status(self, adoption_status: str) -> Iterable[Animal]:
+    async def get_animal_by_adoption_status(
+        self,
+        adoption_status: str,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The abstract getting animals from the repository.
 
         Args:
             adoption_status (str): The adoption status of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[Animal]: The collection of all animals with given adoption status.
         """
 
     @abstractmethod
-    async def get_all_animals(self) -> Iterable[Animal]:
+    async def get_all_animals(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
         """The abstract getting all animals from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[Animal]: The collection of the all animals.
         """
 
+    @abstractmethod
+    async def search_animals(
+        self,
+        criteria: AnimalSearch,
+        after_value: Any = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> Iterable[Animal]:
+        """The abstract searching animals in the repository.
+
+        Args:
+            criteria (AnimalSearch): The filters and the sort order.
+            after_value (Any): The sort key of the row after which
+                the collection starts.
+            after_id (int | None): The id of the row after which
+                the collection starts.
+            limit (int | None): The maximum number of items.
+
+        Returns:
+            Iterable[Animal]: The collection of the matching animals.
+        """
+
+    @abstractmethod
+    def export_animals(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all animals from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The animal rows ordered by id.
+        """
+
     @abstractmethod
     async def add_animal(self, data: AnimalIn) -> Animal | None:
         """The abstract adding new animal to the repository.
@@ -94,6 +178,17 @@ class IAnimalService(ABC):
             Animal | None: The newly created animal.
         """
 
+    @abstractmethod
+    async def add_animals(self, data: Sequence[AnimalIn]) -> list[int]:
+        """The abstract adding many new animals to the repository at once.
+
+        Args:
+            data (Sequence[AnimalIn]): The attributes of the animals.
+
+        Returns:
+            list[int]: The ids of the created animals in input order.
+        """
+
     @abstractmethod
     async def update_animal(
         self,
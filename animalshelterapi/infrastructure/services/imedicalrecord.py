@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.medicalrecord import MedicalRecord, MedicalRecordIn
 
@@ -22,9 +22,28 @@ class IMedicalRecordService(ABC):
         """
 
     @abstractmethod
-    async def get_all_medical_records(self) -> Iterable[MedicalRecord]:
+    async def get_medical_records_by_ids(self, medical_record_ids: Sequence[int]) -> Iterable[MedicalRecord]:
+        """The abstract getting medical records by many ids from the repository.
+
+        Args:
+            medical_record_ids (Sequence[int]): The ids of the medical records.
+
+        Returns:
+            Iterable[MedicalRecord]: The medical records found, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_all_medical_records(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[MedicalRecord]:
         """The abstract getting all medical records from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[MedicalRecord]: The collection of the all medical records.
         """
@@ -33,17 +52,29 @@ class IMedicalRecordService(ABC):
     async def get_medical_record_by_animal_id(
         self,
         animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
     ) -> Iterable[MedicalRecord]:
         """The abstract getting all provided animal's medical records
             from the repository.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[MedicalRecord]: The collection of the medical records.
         """
 
+    @abstractmethod
+    def export_medical_records(self) -> AsyncIterator[dict[str, Any]]:
+        """The abstract streaming all medical records from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The medical record rows ordered by id.
+        """
+
     @abstractmethod
     async def add_medical_record(self, data: MedicalRecordIn) -> MedicalRecord | None:
         """The abstract adding new medical record to the repository.
@@ -55,6 +86,18 @@ class IMedicalRecordService(ABC):
             MedicalRecord | None: The newly created medical record.
         """
 
+    @abstractmethod
+    async def add_medical_records(self, data: Sequence[MedicalRecordIn]) -> list[int | None]:
+        """The abstract adding many new medical records to the repository at once.
+
+        Args:
+            data (Sequence[MedicalRecordIn]): The attributes of the medical records.
+
+        Returns:
+            list[int | None]: The ids of the created medical records
+                in input order, None where the animal does not exist.
+        """
+
     @abstractmethod
     async def update_medical_record(
         self,
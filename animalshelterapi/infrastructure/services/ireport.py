@@ -1,8 +1,10 @@
 """Module containing continent service abstractions."""
 
 from abc import ABC, abstractmethod
+from datetime import date, datetime
 from typing import Iterable
 
+from animalshelterapi.core.domain.report import Histogram, HistogramBucket
 from animalshelterapi.infrastructure.dto.reportdto import ReportDTO
 
 
@@ -10,26 +12,100 @@ class IReportService(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_adoptions_report(self) -> Iterable[ReportDTO]:
+    async def get_adoptions_report(
+        self,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
         """The method getting reports from the repository.
 
+        Args:
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
         Returns:
-            Iterable[ReportDTO]: report.
+            ReportDTO | None: report if exists.
         """
 
     @abstractmethod
-    async def get_medical_records_report(self) -> Iterable[ReportDTO]:
+    async def get_medical_records_report(
+        self,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
         """The method getting reports from the repository.
 
+        Args:
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
         Returns:
-            Iterable[ReportDTO]: report.
+            ReportDTO | None: report if exists.
         """
 
     @abstractmethod
-    async def get_animals_report(self) -> Iterable[ReportDTO]:
+    async def get_animals_report(
+        self,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
         """The method getting reports from the repository.
 
+        Args:
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
+        Returns:
+            ReportDTO | None: report if exists.
+        """
+
+    @abstractmethod
+    async def get_dashboard(
+        self,
+        as_of: datetime | None = None,
+    ) -> dict[str, ReportDTO | None]:
+        """The method getting all reports from the repository at once.
+
+        Args:
+            as_of (datetime | None): The time the reports must not be newer
+                than, None for the latest ones.
+
+        Returns:
+            dict[str, ReportDTO | None]: The reports keyed by their subject.
+        """
+
+    @abstractmethod
+    async def generate_reports(self) -> Iterable[ReportDTO]:
+        """The method generating all reports and storing them as snapshots.
+
         Returns:
-            Iterable[ReportDTO]: report.
+            Iterable[ReportDTO]: The stored reports.
         """
 
+    @abstractmethod
+    async def reconcile_counters(self) -> None:
+        """The method loading the in-memory counters from the repository."""
+
+    @abstractmethod
+    async def get_last_generated(self) -> datetime | None:
+        """The method getting the time the reports were last generated.
+
+        Returns:
+            datetime | None: The creation time if any snapshot exists.
+        """
+
+    @abstractmethod
+    async def get_histogram(
+        self,
+        start: date,
+        end: date,
+        bucket: HistogramBucket,
+    ) -> Histogram:
+        """The method getting the numbers of arrivals, adoptions and
+        medical visits per bucket from the repository.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+            bucket (HistogramBucket): The size of the buckets.
+
+        Returns:
+            Histogram: The counts per bucket.
+        """
@@ -1,25 +1,52 @@
 """Module containing medical record service implementation."""
 
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Sequence
 
 from animalshelterapi.core.domain.medicalrecord import MedicalRecord, MedicalRecordIn
 from animalshelterapi.core.repositories.imedicalrecord import IMedicalRecordRepository
+from animalshelterapi.infrastructure.dto.medicalrecorddto import MedicalRecordDTO
 from animalshelterapi.infrastructure.services.imedicalrecord import IMedicalRecordService
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+from animalshelterapi.utils.timing import timed_methods
 
 
+def _embedded_tags(medical_records: Iterable[Any]) -> list[str]:
+    """Function listing the cache tags of animals in medical records.
+
+    Args:
+        medical_records (Iterable[Any]): The medical records or None.
+
+    Returns:
+        list[str]: The tags of the embedded animals.
+    """
+
+    return [
+        f"animals:{medical_record.animal.id}"
+        for medical_record in medical_records
+        if isinstance(medical_record, MedicalRecordDTO)
+    ]
+
+@timed_methods("svc")
 class MedicalRecordService(IMedicalRecordService):
     """A class implementing the country service."""
 
     _repository: IMedicalRecordRepository
+    _cache: ReadCache
 
-    def __init__(self, repository: IMedicalRecordRepository) -> None:
+    def __init__(
+        self,
+        repository: IMedicalRecordRepository,
+        cache: ReadCache,
+    ) -> None:
         """The initializer of the `medical record service`.
 
         Args:
             repository (IMedicalRecordRepository): The reference to the repository.
+            cache (ReadCache): The cache of the repository reads.
         """
 
         self._repository = repository
+        self._cache = cache
 
     async def get_medical_record_by_id(self, medical_record_id: int) -> MedicalRecord | None:
         """The abstract getting a medical record from the repository.
@@ -31,32 +58,107 @@ class MedicalRecordService(IMedicalRecordService):
             MedicalRecord | None: The medical record data if exists.
         """
 
-        return await self._repository.get_medical_record_by_id(medical_record_id)
+        return await self._cache.read(
+            ("medical_record.get_medical_record_by_id", medical_record_id),
+            lambda: self._repository.get_medical_record_by_id(medical_record_id),
+            tags=lambda medical_record: [
+                f"medical_records:{medical_record_id}",
+                *_embedded_tags([medical_record]),
+            ],
+            value_type=MedicalRecordDTO | None,
+        )
+
+    async def get_medical_records_by_ids(self, medical_record_ids: Sequence[int]) -> Iterable[MedicalRecord]:
+        """The method getting medical records by many ids from the repository.
+
+        Args:
+            medical_record_ids (Sequence[int]): The ids of the medical records.
+
+        Returns:
+            Iterable[MedicalRecord]: The medical records found, in no particular order.
+        """
+
+        return await self._cache.read(
+            ("medical_record.get_medical_records_by_ids", tuple(medical_record_ids)),
+            lambda: self._repository.get_medical_records_by_ids(medical_record_ids),
+            tags=lambda medical_records: [
+                *(
+                    f"medical_records:{medical_record_id}"
+                    for medical_record_id in medical_record_ids
+                ),
+                *_embedded_tags(medical_records),
+            ],
+            value_type=list[MedicalRecordDTO],
+        )
 
-    async def get_all_medical_records(self) -> Iterable[MedicalRecord]:
+    async def get_all_medical_records(
+        self,
+        after_id: int = 0,
+        limit: int | None = None,
+    ) -> Iterable[MedicalRecord]:
         """The abstract getting all medical records from the repository.
 
+        Args:
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
+
         Returns:
             Iterable[MedicalRecord]: The collection of the all medical records.
         """
 
-        return await self._repository.get_all_medical_records()
+        return await self._cache.read(
+            ("medical_record.get_all_medical_records", after_id, limit),
+            lambda: self._repository.get_all_medical_records(
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda medical_records: [
+                "medical_records:list",
+                *_embedded_tags(medical_records),
+            ],
+            value_type=list[MedicalRecordDTO],
+        )
 
     async def get_medical_record_by_animal_id(
         self,
         animal_id: int,
+        after_id: int = 0,
+        limit: int | None = None,
     ) -> Iterable[MedicalRecord]:
         """The abstract getting all provided animal's medical records
             from the repository.
 
         Args:
             animal_id (int): The id of the animal.
+            after_id (int): The id after which the collection starts.
+            limit (int | None): The maximum number of items.
 
         Returns:
             Iterable[MedicalRecord]: The collection of the medical records.
         """
 
-        return await self._repository.get_medical_record_by_animal_id(animal_id)
+        return await self._cache.read(
+            ("medical_record.get_medical_record_by_animal_id", animal_id, after_id, limit),
+            lambda: self._repository.get_medical_record_by_animal_id(
+                animal_id,
+                after_id=after_id,
+                limit=limit,
+            ),
+            tags=lambda medical_records: [
+                "medical_records:list",
+                *_embedded_tags(medical_records),
+            ],
+            value_type=list[MedicalRecordDTO],
+        )
+
+    def export_medical_records(self) -> AsyncIterator[dict[str, Any]]:
+        """The method streaming all medical records from the repository.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The medical record rows ordered by id.
+        """
+
+        return self._repository.export_medical_records()
 
     async def add_medical_record(self, data: MedicalRecordIn) -> MedicalRecord | None:
         """The abstract adding new medical record to the repository.
@@ -68,7 +170,33 @@ class MedicalRecordService(IMedicalRecordService):
             MedicalRecord | None: The newly created medical record.
         """
 
-        return await self._repository.add_medical_record(data)
+        new_medical_record = await self._repository.add_medical_record(data)
+        if new_medical_record:
+            await self._cache.invalidate(
+                f"medical_records:{new_medical_record.id}",
+                "medical_records:list",
+            )
+
+        return new_medical_record
+
+    async def add_medical_records(self, data: Sequence[MedicalRecordIn]) -> list[int | None]:
+        """The method adding many new medical records to the repository at once.
+
+        Args:
+            data (Sequence[MedicalRecordIn]): The attributes of the medical records.
+
+        Returns:
+            list[int | None]: The ids of the created medical records
+                in input order, None where the animal does not exist.
+        """
+
+        new_ids = await self._repository.add_medical_records(data)
+        await self._cache.invalidate(
+            *(f"medical_records:{new_id}" for new_id in new_ids if new_id is not None),
+            "medical_records:list",
+        )
+
+        return new_ids
 
     async def update_medical_record(
         self,
@@ -85,10 +213,16 @@ class MedicalRecordService(IMedicalRecordService):
             MedicalRecord | None: The updated medical record.
         """
 
-        return await self._repository.update_medical_record(
+        updated_medical_record = await self._repository.update_medical_record(
             medical_record_id=medical_record_id,
             data=data,
         )
+        await self._cache.invalidate(
+            f"medical_records:{medical_record_id}",
+            "medical_records:list",
+        )
+
+        return updated_medical_record
 
     async def delete_medical_record(self, medical_record_id: int) -> bool:
         """The abstract removing medical record from the repository.
@@ -100,4 +234,10 @@ class MedicalRecordService(IMedicalRecordService):
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_medical_record(medical_record_id)
+        deleted = await self._repository.delete_medical_record(medical_record_id)
+        await self._cache.invalidate(
+            f"medical_records:{medical_record_id}",
+            "medical_records:list",
+        )
+
+        return deleted
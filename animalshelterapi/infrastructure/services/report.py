@@ -1,46 +1,276 @@
 """Module containing report service implementation."""
 
+import asyncio
+from datetime import date, datetime
 from typing import Iterable
 
 
+from animalshelterapi.core.domain.report import (
+    Histogram,
+    HistogramBucket,
+    ReportIn,
+    ReportTopic,
+)
 from animalshelterapi.core.repositories.ireport import IReportRepository
-from animalshelterapi.infrastructure.dto.reportdto import ReportDTO
+from animalshelterapi.db import TableVersions
+from animalshelterapi.infrastructure.dto.reportdto import (
+    REPORT_SUBJECTS,
+    ReportDTO,
+)
 from animalshelterapi.infrastructure.services.ireport import IReportService
+from animalshelterapi.infrastructure.utils.rolling import RollingCounters
+from animalshelterapi.utils.timing import timed_methods
 
 
+@timed_methods("svc")
 class ReportService(IReportService):
     """A class implementing the continent service."""
 
     _repository: IReportRepository
+    _counters: RollingCounters
+    _versions: TableVersions
+    _first_generation: asyncio.Lock
+
+    def __init__(
+        self,
+        repository: IReportRepository,
+        counters: RollingCounters,
+        versions: TableVersions,
+    ) -> None:
+        """The initializer of the `report service`.
+
+        Args:
+            repository (IReportRepository): The reference to the repository.
+            counters (RollingCounters): The in-memory counters of the tables.
+            versions (TableVersions): The versions validating the reports.
+        """
 
-    def __init__(self, repository: IReportRepository):
-        """Initialize the report service with the repository."""
         self._repository = repository
+        self._counters = counters
+        self._versions = versions
+        self._first_generation = asyncio.Lock()
 
-    async def get_animals_report(self) -> Iterable[ReportDTO]:
+    async def get_animals_report(
+        self,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
         """The method getting report from the repository.
 
+        Args:
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
         Returns:
-            Iterable[ReportDTO]: report.
+            ReportDTO | None: report if exists.
         """
 
-        return await self._repository.get_animals_report()
+        return await self._get_report(ReportTopic.ANIMALS, as_of)
 
-    async def get_medical_records_report(self) -> Iterable[ReportDTO]:
+    async def get_medical_records_report(
+        self,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
         """The method getting report from the repository.
 
+        Args:
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
         Returns:
-            Iterable[ReportDTO]: report.
+            ReportDTO | None: report if exists.
         """
 
-        return await self._repository.get_medical_records_report()
+        return await self._get_report(ReportTopic.MEDICAL_RECORDS, as_of)
 
-    async def get_adoptions_report(self) -> Iterable[ReportDTO]:
+    async def get_adoptions_report(
+        self,
+        as_of: datetime | None = None,
+    ) -> ReportDTO | None:
         """The method getting report from the repository.
 
+        Args:
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
+        Returns:
+            ReportDTO | None: report if exists.
+        """
+
+        return await self._get_report(ReportTopic.ADOPTIONS, as_of)
+
+    async def get_dashboard(
+        self,
+        as_of: datetime | None = None,
+    ) -> dict[str, ReportDTO | None]:
+        """The method getting all reports from the repository at once.
+
+        The reports are read concurrently, each on its own pooled
+        connection.
+
+        Args:
+            as_of (datetime | None): The time the reports must not be newer
+                than, None for the latest ones.
+
+        Returns:
+            dict[str, ReportDTO | None]: The reports keyed by their subject.
+        """
+
+        adoptions, medical_records, animals = await asyncio.gather(
+            self.get_adoptions_report(as_of),
+            self.get_medical_records_report(as_of),
+            self.get_animals_report(as_of),
+        )
+
+        return {
+            "adoptions": adoptions,
+            "medical_records": medical_records,
+            "animals": animals,
+        }
+
+    async def generate_reports(self) -> Iterable[ReportDTO]:
+        """The method generating all reports and storing them as snapshots.
+
+        Once the in-memory counters are loaded, the reports are built from
+        them without querying the tables. The counters follow the writes
+        of this process as they commit, but the writes of other processes
+        only from the next reconciliation, so a snapshot may miss up to
+        `REPORT_RECONCILE_INTERVAL` seconds of them.
+
         Returns:
-            Iterable[ReportDTO]: report.
+            Iterable[ReportDTO]: The stored reports.
+        """
+
+        if self._counters.ready:
+            reports = [
+                ReportDTO.from_counts(topic, *self._counters.recent(subject))
+                for topic, subject in REPORT_SUBJECTS.items()
+            ]
+        else:
+            reports = await asyncio.gather(
+                self._repository.get_adoptions_report(),
+                self._repository.get_medical_records_report(),
+                self._repository.get_animals_report(),
+            )
+        created_at = datetime.now()
+
+        return await self._repository.add_reports([
+            ReportIn(
+                topic=report.topic,
+                content=report.content,
+                created_at=created_at,
+            )
+            for report in reports
+        ])
+
+    async def reconcile_counters(self) -> None:
+        """The method loading the in-memory counters from the repository.
+
+        The latest reports are served from the counters, so the versions
+        of the tables whose counts have changed are bumped, otherwise
+        the clients would keep revalidating the outdated reports.
         """
 
-        return await self._repository.get_adoptions_report()
+        subjects = REPORT_SUBJECTS.values()
+        before = {
+            subject: self._counters.recent(subject)
+            for subject in subjects
+        } if self._counters.ready else {}
+
+        counts = await self._repository.get_daily_counts(self._counters.first_day)
+        self._counters.load(counts)
+
+        changed = [
+            subject for subject in subjects
+            if before.get(subject) != self._counters.recent(subject)
+        ]
+        if changed:
+            self._versions.bump(*changed)
+
+    async def get_last_generated(self) -> datetime | None:
+        """The method getting the time the reports were last generated.
+
+        Returns:
+            datetime | None: The creation time if any snapshot exists.
+        """
+
+        return await self._repository.get_last_generated()
+
+    async def _get_report(
+        self,
+        topic: ReportTopic,
+        as_of: datetime | None,
+    ) -> ReportDTO | None:
+        """The method getting the report as of the time.
+
+        Once the counters are loaded, the latest report is built from them,
+        so it includes the writes of this process as soon as they commit.
+        Reports as of a time are the stored snapshots.
+
+        Args:
+            topic (ReportTopic): The topic of the report.
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
+        Returns:
+            ReportDTO | None: report if exists.
+        """
+
+        if as_of is None and self._counters.ready:
+            return ReportDTO.from_counts(
+                topic,
+                *self._counters.recent(REPORT_SUBJECTS[topic]),
+            )
+
+        return await self._get_snapshot(topic, as_of)
+
+    async def _get_snapshot(
+        self,
+        topic: ReportTopic,
+        as_of: datetime | None,
+    ) -> ReportDTO | None:
+        """The method getting the stored snapshot of the report.
+
+        Until the first snapshot is stored, the latest report generates
+        and stores one, so every snapshot served has its own id and time.
+        Concurrent requests wait for the same generation.
+
+        Args:
+            topic (ReportTopic): The topic of the report.
+            as_of (datetime | None): The time the report must not be newer
+                than, None for the latest one.
+
+        Returns:
+            ReportDTO | None: report if exists.
+        """
+
+        report = await self._repository.get_latest_report(topic, as_of)
+        if report is not None or as_of is not None:
+            return report
+
+        async with self._first_generation:
+            if report := await self._repository.get_latest_report(topic):
+                return report
+
+            reports = await self.generate_reports()
+
+        return next((obj for obj in reports if obj.topic == topic.value), None)
+
+    async def get_histogram(
+        self,
+        start: date,
+        end: date,
+        bucket: HistogramBucket,
+    ) -> Histogram:
+        """The method getting the numbers of arrivals, adoptions and
+        medical visits per bucket from the repository.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+            bucket (HistogramBucket): The size of the buckets.
+
+        Returns:
+            Histogram: The counts per bucket.
+        """
 
+        return await self._repository.get_histogram(start, end, bucket)
@@ -0,0 +1,157 @@
+"""A module containing the read cache of the services."""
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+from animalshelterapi.infrastructure.utils.cachebackend import ICacheBackend, MISSING
+from animalshelterapi.infrastructure.utils.singleflight import SingleFlight
+
+TagsT = Callable[[Any], Iterable[str]]
+
+
+@dataclass
+class CacheStats:
+    """A class counting cache lookups of one operation."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of lookups served from the cache."""
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class ReadCache:
+    """A class caching service reads in a pluggable backend.
+
+    Every entry is tagged with the rows it was built from, such as
+    `animals:5` or `animals:list`, and writes invalidate entries by tag. Loads
+    go through `SingleFlight`, so concurrent misses share one query.
+    """
+
+    _backend: ICacheBackend
+    _single_flight: SingleFlight
+    _enabled: bool
+    _stats: dict[str, CacheStats]
+    _generation: int
+
+    def __init__(
+        self,
+        backend: ICacheBackend,
+        single_flight: SingleFlight,
+        enabled: bool = True,
+    ) -> None:
+        """The initializer of the `read cache`.
+
+        Args:
+            backend (ICacheBackend): The storage of the cached values.
+            single_flight (SingleFlight): The coalescer of concurrent loads.
+            enabled (bool): Whether the values are cached at all.
+        """
+
+        self._backend = backend
+        self._single_flight = single_flight
+        self._enabled = enabled
+        self._stats = {}
+        self._generation = 0
+
+    async def read(
+        self,
+        key: tuple[Hashable, ...],
+        load: Callable[[], Awaitable[Any]],
+        tags: TagsT,
+        value_type: Any,
+    ) -> Any:
+        """The method returning the cached value or loading and caching it.
+
+        Args:
+            key (tuple[Hashable, ...]): The operation name and its arguments.
+            load (Callable[[], Awaitable[Any]]): The call loading the value.
+            tags (TagsT): The function listing the tags of a loaded value.
+            value_type (Any): The type of the loaded value, such as
+                `list[Animal]`, used to validate serialized values.
+
+        Returns:
+            Any: The cached or the freshly loaded value.
+        """
+
+        if not self._enabled:
+            return await self._load(key, load, self._generation)
+
+        stats = self._stats.setdefault(key[0], CacheStats())
+        if (value := await self._backend.get(key, value_type)) is not MISSING:
+            stats.hits += 1
+
+            return value
+
+        stats.misses += 1
+        generation = self._generation
+        value = await self._load(key, load, generation)
+
+        # A write that happened during the load may not be in the value.
+        if generation == self._generation:
+            await self._backend.set(key, value, tags(value))
+
+        return value
+
+    async def _load(
+        self,
+        key: tuple[Hashable, ...],
+        load: Callable[[], Awaitable[Any]],
+        generation: int,
+    ) -> Any:
+        """The method loading a value shared with identical concurrent loads.
+
+        The generation is part of the flight key, so a load started before
+        a write is not joined by callers arriving after it.
+
+        Args:
+            key (tuple[Hashable, ...]): The operation name and its arguments.
+            load (Callable[[], Awaitable[Any]]): The call loading the value.
+            generation (int): The cache generation observed by the caller.
+
+        Returns:
+            Any: The loaded value.
+        """
+
+        return await self._single_flight.do((*key, generation), load)
+
+    async def invalidate(self, *tags: str) -> None:
+        """The method removing every entry carrying any of the tags.
+
+        Args:
+            *tags (str): The tags of the changed rows.
+        """
+
+        self._generation += 1
+        await self._backend.invalidate(tags)
+
+    async def clear(self) -> None:
+        """The method removing all entries."""
+
+        self._generation += 1
+        await self._backend.clear()
+
+    async def stats(self) -> dict[str, Any]:
+        """The method summarizing the cache usage.
+
+        Returns:
+            dict[str, Any]: The size and the hits, misses and hit ratio
+                per operation.
+        """
+
+        return {
+            "backend": type(self._backend).__name__,
+            "size": await self._backend.size(),
+            "operations": {
+                operation: {
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "hit_ratio": round(stats.hit_ratio, 4),
+                }
+                for operation, stats in sorted(self._stats.items())
+            },
+        }
@@ -0,0 +1,172 @@
+"""A module containing storage backends of the read cache."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable
+
+MISSING: Any = object()
+
+
+class ICacheBackend(ABC):
+    """An abstract class representing protocol of cache storage."""
+
+    @abstractmethod
+    async def get(self, key: Hashable, value_type: Any) -> Any:
+        """The abstract getting a value from the cache.
+
+        Args:
+            key (Hashable): The key of the value.
+            value_type (Any): The type of the value, validating it when
+                it is read back from a serialized form.
+
+        Returns:
+            Any: The value, or `MISSING` if absent or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any, tags: Iterable[str]) -> None:
+        """The abstract storing a value in the cache.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to store.
+            tags (Iterable[str]): The tags invalidating the value.
+        """
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """The abstract removing values carrying any of the tags.
+
+        Args:
+            tags (Iterable[str]): The tags of the changed entities.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """The abstract removing all values from the cache."""
+
+    @abstractmethod
+    async def size(self) -> int | None:
+        """The abstract counting the cached values.
+
+        Returns:
+            int | None: The number of values if known.
+        """
+
+
+@dataclass
+class CacheEntry:
+    """A class representing a cached value with its expiry and tags."""
+    value: Any
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+class MemoryCacheBackend(ICacheBackend):
+    """A class storing values in process memory with LRU eviction and a TTL."""
+
+    _max_size: int
+    _ttl: float
+    _entries: OrderedDict[Hashable, CacheEntry]
+    _keys_by_tag: dict[str, set[Hashable]]
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """The initializer of the `memory cache backend`.
+
+        Args:
+            max_size (int): The maximum number of entries.
+            ttl (float): The number of seconds an entry stays valid.
+        """
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._keys_by_tag = {}
+
+    async def get(self, key: Hashable, value_type: Any) -> Any:
+        """The method getting a value from the cache.
+
+        An expired entry is removed when found, so it does not take up
+        the capacity until evicted. The values are kept as objects, so
+        their type is not needed.
+
+        Args:
+            key (Hashable): The key of the value.
+            value_type (Any): The type of the value.
+
+        Returns:
+            Any: The value, or `MISSING` if absent or expired.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        if entry.expires_at <= time.monotonic():
+            self._drop(key)
+            return MISSING
+
+        self._entries.move_to_end(key)
+
+        return entry.value
+
+    async def set(self, key: Hashable, value: Any, tags: Iterable[str]) -> None:
+        """The method storing a value and evicting the least recent entries.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to store.
+            tags (Iterable[str]): The tags invalidating the value.
+        """
+
+        self._drop(key)
+        entry = CacheEntry(value, time.monotonic() + self._ttl, tuple(tags))
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self._max_size:
+            self._drop(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """The method removing values carrying any of the tags.
+
+        Args:
+            tags (Iterable[str]): The tags of the changed entities.
+        """
+
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, set()):
+                self._drop(key)
+
+    async def clear(self) -> None:
+        """The method removing all values from the cache."""
+
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    async def size(self) -> int | None:
+        """The method counting the cached values.
+
+        Returns:
+            int | None: The number of values.
+        """
+
+        return len(self._entries)
+
+    def _drop(self, key: Hashable) -> None:
+        """The method removing the entry and its tag references.
+
+        Args:
+            key (Hashable): The key of the entry.
+        """
+
+        if (entry := self._entries.pop(key, None)) is None:
+            return
+
+        for tag in entry.tags:
+            if keys := self._keys_by_tag.get(tag):
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
@@ -0,0 +1,154 @@
+"""A module containing the listener of cross-process invalidations."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+import asyncpg  # type: ignore
+
+from animalshelterapi.db import TableVersions, metadata
+from animalshelterapi.infrastructure.utils.cache import ReadCache
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationListener:
+    """A class applying writes made by other processes to the local state.
+
+    The repositories announce every committed write with `NOTIFY`. The
+    listener keeps one dedicated connection on `LISTEN`, bumps the version
+    of the written table and drops the cached reads of the written rows.
+    Notifications sent while the connection was down are lost, so after
+    reconnecting the whole cache is cleared.
+    """
+
+    _cache: ReadCache
+    _versions: TableVersions
+    _dsn: str
+    _channel: str
+    _retry_delay: float
+    _connection: Any
+    _task: asyncio.Task | None
+    _lost: asyncio.Event
+    _pending: set[asyncio.Task]
+
+    def __init__(
+        self,
+        cache: ReadCache,
+        versions: TableVersions,
+        dsn: str,
+        channel: str | None,
+        retry_delay: float = 5.0,
+    ) -> None:
+        """The initializer of the `invalidation listener`.
+
+        Args:
+            cache (ReadCache): The cache to invalidate.
+            versions (TableVersions): The table versions to bump.
+            dsn (str): The connection string of the database.
+            channel (str | None): The notification channel, None to disable.
+            retry_delay (float): The number of seconds between reconnects.
+        """
+
+        self._cache = cache
+        self._versions = versions
+        self._dsn = dsn
+        self._channel = channel or ""
+        self._retry_delay = retry_delay
+        self._connection = None
+        self._task = None
+        self._lost = asyncio.Event()
+        self._pending = set()
+
+    async def start(self) -> None:
+        """The method starting to listen in the background."""
+
+        if self._channel and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """The method stopping to listen and closing the connection."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """The method keeping the listening connection alive."""
+
+        reconnect = False
+        while True:
+            try:
+                self._lost.clear()
+                self._connection = await asyncpg.connect(self._dsn)
+                self._connection.add_termination_listener(self._on_termination)
+                await self._connection.add_listener(self._channel, self._on_notify)
+
+                if reconnect:
+                    await self._reset()
+                reconnect = True
+
+                await self._lost.wait()
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Invalidation listener disconnected: %s", e)
+                await asyncio.sleep(self._retry_delay)
+            finally:
+                if self._connection is not None:
+                    self._connection.terminate()
+                    self._connection = None
+
+    def _on_termination(self, connection: Any) -> None:
+        """The callback waking up the loop when the connection is closed.
+
+        Args:
+            connection (Any): The closed connection.
+        """
+
+        self._lost.set()
+
+    def _on_notify(
+        self,
+        connection: Any,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        """The callback applying a notification of another process.
+
+        Args:
+            connection (Any): The listening connection.
+            pid (int): The id of the notifying backend.
+            channel (str): The notification channel.
+            payload (str): The JSON describing the write.
+        """
+
+        message = json.loads(payload)
+        if message["origin"] == self._versions.epoch:
+            return
+
+        table = message["table"]
+        self._versions.bump(table)
+        if message["ids"] is None:
+            task = asyncio.create_task(self._cache.clear())
+        else:
+            task = asyncio.create_task(self._cache.invalidate(
+                *(f"{table}:{id}" for id in message["ids"]),
+                f"{table}:list",
+            ))
+
+        # The loop keeps weak references only.
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _reset(self) -> None:
+        """The method dropping all local state after missed notifications."""
+
+        self._versions.bump(*metadata.tables)
+        await self._cache.clear()
@@ -0,0 +1,162 @@
+"""A module containing the Redis backend of the read cache."""
+
+import functools
+from typing import Any, Hashable, Iterable
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
+
+from animalshelterapi.infrastructure.utils.cachebackend import ICacheBackend, MISSING
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter(value_type: Any) -> TypeAdapter:
+    """Function getting the adapter validating values of the type.
+
+    Args:
+        value_type (Any): The type of the values.
+
+    Returns:
+        TypeAdapter: The adapter, built once per type.
+    """
+
+    return TypeAdapter(value_type)
+
+
+class RedisCacheBackend(ICacheBackend):
+    """A class storing values in a server speaking the Redis protocol.
+
+    Values expire through the server TTL and eviction is left to the server
+    `maxmemory-policy`. Each tag is a set of the keys it invalidates, so
+    all workers sharing the server see the same invalidations.
+
+    Values are stored as JSON and validated against their expected type
+    when read, so whoever can write to the server cannot make the workers
+    run code, only miss the cache.
+    """
+
+    _client: Any
+    _ttl: int
+    _prefix: str
+
+    def __init__(
+        self,
+        ttl: float,
+        url: str | None = None,
+        client: Any = None,
+        prefix: str = "animalshelter:",
+    ) -> None:
+        """The initializer of the `redis cache backend`.
+
+        Args:
+            ttl (float): The number of seconds a value stays valid.
+            url (str | None): The URL of the server, used without a client.
+            client (Any): The `redis.asyncio` compatible client to use.
+            prefix (str): The prefix of all keys owned by the cache.
+        """
+
+        if client is None:
+            # The client library is only needed with this backend.
+            from redis import asyncio as aioredis  # type: ignore
+
+            client = aioredis.from_url(url)
+
+        self._client = client
+        self._ttl = max(1, round(ttl))
+        self._prefix = prefix
+
+    async def get(self, key: Hashable, value_type: Any) -> Any:
+        """The method getting a value from the server.
+
+        Args:
+            key (Hashable): The key of the value.
+            value_type (Any): The type the stored JSON is validated against.
+
+        Returns:
+            Any: The value, or `MISSING` if absent, expired or invalid.
+        """
+
+        raw = await self._client.get(self._value_key(key))
+        if raw is None:
+            return MISSING
+
+        try:
+            return _adapter(value_type).validate_json(raw)
+        except ValidationError:
+            return MISSING
+
+    async def set(self, key: Hashable, value: Any, tags: Iterable[str]) -> None:
+        """The method storing a value and registering it under its tags.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to store.
+            tags (Iterable[str]): The tags invalidating the value.
+        """
+
+        value_key = self._value_key(key)
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(value_key, to_json(value), ex=self._ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), value_key)
+                pipe.expire(self._tag_key(tag), self._ttl)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """The method removing values carrying any of the tags.
+
+        Args:
+            tags (Iterable[str]): The tags of the changed entities.
+        """
+
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+
+        keys = set().union(*members)
+        await self._client.delete(*keys, *tag_keys)
+
+    async def clear(self) -> None:
+        """The method removing all keys owned by the cache."""
+
+        keys = [key async for key in self._client.scan_iter(f"{self._prefix}*")]
+        if keys:
+            await self._client.delete(*keys)
+
+    async def size(self) -> int | None:
+        """The method counting the cached values.
+
+        Returns:
+            int | None: None, as the server does not count keys by prefix.
+        """
+
+        return None
+
+    def _value_key(self, key: Hashable) -> str:
+        """The method building the server key of a value.
+
+        Args:
+            key (Hashable): The key of the value.
+
+        Returns:
+            str: The prefixed server key.
+        """
+
+        return f"{self._prefix}v:{key!r}"
+
+    def _tag_key(self, tag: str) -> str:
+        """The method building the server key of a tag.
+
+        Args:
+            tag (str): The tag.
+
+        Returns:
+            str: The prefixed server key.
+        """
+
+        return f"{self._prefix}t:{tag}"
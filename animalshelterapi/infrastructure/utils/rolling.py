@@ -0,0 +1,162 @@
+"""A module containing the in-memory rolling counters of dated rows."""
+
+from datetime import date, timedelta
+from typing import Iterable, Mapping
+
+# The reports count the last day, week and month.
+REPORT_WINDOWS = (1, 7, 30)
+
+
+class RollingCounters:
+    """A class counting dated rows per day over the last days.
+
+    Each table has a ring buffer with one bucket per day of the window,
+    slot `day.toordinal() % window`. The rings are advanced lazily, the
+    buckets of days leaving the window are reused for the new days. Rows
+    dated after today are kept aside until their day comes.
+
+    The repositories apply their writes as they commit them, the counters
+    are loaded from the tables and periodically reconciled with them to
+    correct drift, e.g. after writes made by other processes.
+    """
+
+    _window: int
+    _today: int
+    _buckets: dict[str, list[int]]
+    _future: dict[str, dict[int, int]]
+    _ready: bool
+
+    def __init__(self, window: int = max(REPORT_WINDOWS)) -> None:
+        """The initializer of the `rolling counters`.
+
+        Args:
+            window (int): The number of days kept in the buckets.
+        """
+
+        self._window = window
+        self._today = 0
+        self._buckets = {}
+        self._future = {}
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        """Whether the counters were loaded from the tables."""
+
+        return self._ready
+
+    @property
+    def first_day(self) -> date:
+        """The oldest day of the window as of today."""
+
+        return date.today() - timedelta(days=self._window - 1)
+
+    def add(self, table: str, day: date | None, delta: int = 1) -> None:
+        """The method counting rows written to the table.
+
+        Rows dated before the window are ignored. Nothing is counted until
+        the counters are loaded, the load reads the rows anyway.
+
+        Args:
+            table (str): The name of the table.
+            day (date | None): The date of the rows.
+            delta (int): The number of rows, negative for removed rows.
+        """
+
+        if not self._ready or day is None:
+            return
+
+        self._advance(date.today().toordinal())
+        ordinal = day.toordinal()
+        if ordinal > self._today:
+            future = self._future.setdefault(table, {})
+            future[ordinal] = future.get(ordinal, 0) + delta
+        elif ordinal > self._today - self._window:
+            buckets = self._buckets.setdefault(table, [0] * self._window)
+            buckets[ordinal % self._window] += delta
+
+    def move(self, table: str, old: date | None, new: date | None) -> None:
+        """The method recounting a row whose date has changed.
+
+        Args:
+            table (str): The name of the table.
+            old (date | None): The date before the change.
+            new (date | None): The date after the change.
+        """
+
+        if old != new:
+            self.add(table, old, -1)
+            self.add(table, new)
+
+    def recent(
+        self,
+        table: str,
+        windows: Iterable[int] = REPORT_WINDOWS,
+    ) -> tuple[int, ...]:
+        """The method counting the rows of the table dated in each window.
+
+        A window of `n` days starts `n - 1` days before today and has no
+        end, the same as the report queries.
+
+        Args:
+            table (str): The name of the table.
+            windows (Iterable[int]): The lengths of the windows in days.
+
+        Returns:
+            tuple[int, ...]: The number of rows in each window.
+        """
+
+        self._advance(date.today().toordinal())
+        buckets = self._buckets.get(table, [0] * self._window)
+        upcoming = sum(self._future.get(table, {}).values())
+
+        return tuple(
+            upcoming + sum(
+                buckets[ordinal % self._window]
+                for ordinal in range(self._today - length + 1, self._today + 1)
+            )
+            for length in windows
+        )
+
+    def load(self, counts: Mapping[str, Mapping[date, int]]) -> None:
+        """The method replacing all counters with the counts of the tables.
+
+        Args:
+            counts (Mapping[str, Mapping[date, int]]): The numbers of rows
+                per day of the window or later, keyed by table.
+        """
+
+        self._today = 0
+        self._buckets = {table: [0] * self._window for table in counts}
+        self._future = {}
+        self._advance(date.today().toordinal())
+        self._ready = True
+
+        for table, days in counts.items():
+            for day, count in days.items():
+                self.add(table, day, count)
+
+    def _advance(self, today: int) -> None:
+        """The method moving the window to end at the day.
+
+        Args:
+            today (int): The ordinal of the current day.
+        """
+
+        if today <= self._today:
+            return
+
+        first = max(self._today + 1, today - self._window + 1)
+        for ordinal in range(first, today + 1):
+            for table, buckets in self._buckets.items():
+                future = self._future.get(table, {})
+                buckets[ordinal % self._window] = future.pop(ordinal, 0)
+
+        # Rows of days skipped over are already out of the window.
+        for future in self._future.values():
+            for ordinal in [ordinal for ordinal in future if ordinal <= today]:
+                del future[ordinal]
+        self._today = today
+
+
+rolling_counters = RollingCounters()
@@ -0,0 +1,160 @@
+"""A module containing the background jobs of the reports."""
+
+import asyncio
+import logging
+from datetime import datetime
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from animalshelterapi.infrastructure.services.ireport import IReportService
+
+logger = logging.getLogger(__name__)
+
+
+class ReportScheduler:
+    """A class generating report snapshots at a fixed interval.
+
+    Before generating, the scheduler checks when the latest snapshot was
+    stored, so with several processes sharing the database the reports
+    are still generated about once per interval rather than once per
+    process.
+    """
+
+    _service: IReportService
+    _interval: float
+    _retry_delay: float
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        service: IReportService,
+        interval: float | None,
+        retry_delay: float = 5.0,
+    ) -> None:
+        """The initializer of the `report scheduler`.
+
+        Args:
+            service (IReportService): The service generating the reports.
+            interval (float | None): The number of seconds between
+                snapshots, None to disable.
+            retry_delay (float): The number of seconds before retrying
+                a failed generation.
+        """
+
+        self._service = service
+        self._interval = interval or 0.0
+        self._retry_delay = retry_delay
+        self._task = None
+
+    async def start(self) -> None:
+        """The method starting to generate snapshots in the background."""
+
+        if self._interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """The method stopping to generate snapshots."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """The method generating snapshots until cancelled."""
+
+        while True:
+            try:
+                delay = await self._tick()
+            except (OSError, SQLAlchemyError) as e:
+                logger.warning("Report generation failed: %s", e)
+                delay = self._retry_delay
+
+            await asyncio.sleep(delay)
+
+    async def _tick(self) -> float:
+        """The method generating snapshots if the latest ones are stale.
+
+        Returns:
+            float: The number of seconds until the next check.
+        """
+
+        last_generated = await self._service.get_last_generated()
+        if last_generated is not None:
+            age = (datetime.now() - last_generated).total_seconds()
+            if 0 <= age < self._interval:
+                return self._interval - age
+
+        await self._service.generate_reports()
+
+        return self._interval
+
+
+class CounterReconciler:
+    """A class reloading the in-memory report counters at a fixed interval.
+
+    The counters are loaded once before the app starts serving and then
+    reloaded periodically, correcting the drift left by writes of other
+    processes and by writes racing with the previous load.
+    """
+
+    _service: IReportService
+    _interval: float
+    _task: asyncio.Task | None
+
+    def __init__(
+        self,
+        service: IReportService,
+        interval: float | None,
+    ) -> None:
+        """The initializer of the `counter reconciler`.
+
+        Args:
+            service (IReportService): The service owning the counters.
+            interval (float | None): The number of seconds between
+                reloads, None to disable the counters.
+        """
+
+        self._service = service
+        self._interval = interval or 0.0
+        self._task = None
+
+    async def start(self) -> None:
+        """The method loading the counters and reloading them in the background."""
+
+        if self._interval > 0 and self._task is None:
+            await self._reconcile()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """The method stopping to reload the counters."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """The method reloading the counters until cancelled."""
+
+        while True:
+            await asyncio.sleep(self._interval)
+            await self._reconcile()
+
+    async def _reconcile(self) -> None:
+        """The method reloading the counters, keeping them on failure."""
+
+        try:
+            await self._service.reconcile_counters()
+        except (OSError, SQLAlchemyError) as e:
+            logger.warning("Report counters reconciliation failed: %s", e)
@@ -0,0 +1,83 @@
+"""A module containing request coalescing for concurrent identical reads."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class FlightStats:
+    """A class counting the calls coalesced for one operation."""
+    calls: int = 0
+    executions: int = 0
+
+    @property
+    def saved(self) -> int:
+        """The number of storage calls avoided by sharing a result."""
+
+        return self.calls - self.executions
+
+
+class SingleFlight:
+    """A class sharing one in-flight call among identical concurrent calls.
+
+    Callers passing the same key while a call is running await its result
+    instead of starting their own. The shared call runs as a separate task,
+    so a cancelled caller does not cancel it for the remaining waiters.
+    """
+
+    _calls: dict[Hashable, asyncio.Task]
+    _stats: dict[str, FlightStats]
+
+    def __init__(self) -> None:
+        """The initializer of the `single flight`."""
+
+        self._calls = {}
+        self._stats = {}
+
+    async def do(
+        self,
+        key: tuple[Hashable, ...],
+        call: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """The method running the call unless an identical one is in flight.
+
+        Args:
+            key (tuple[Hashable, ...]): The operation name and its arguments.
+                Statistics are grouped by the operation name.
+            call (Callable[[], Awaitable[ResultT]]): The call to run.
+
+        Returns:
+            ResultT: The result of the call shared by all waiters.
+        """
+
+        stats = self._stats.setdefault(key[0], FlightStats())
+        stats.calls += 1
+
+        if (task := self._calls.get(key)) is None:
+            stats.executions += 1
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """The method summarizing the coalesced calls.
+
+        Returns:
+            dict[str, dict[str, Any]]: The calls, storage executions and
+                saved executions per operation.
+        """
+
+        return {
+            operation: {
+                "calls": stats.calls,
+                "executions": stats.executions,
+                "saved": stats.saved,
+                "in_flight": sum(1 for key in self._calls if key[0] == operation),
+            }
+            for operation, stats in sorted(self._stats.items())
+        }
@@ -1,37 +1,59 @@
 """Main module of the app"""
 
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
 
+from animalshelterapi.api.middleware.compression import CompressionMiddleware
+from animalshelterapi.api.middleware.metrics import MetricsMiddleware
+from animalshelterapi.api.middleware.servertiming import ServerTimingMiddleware
 from animalshelterapi.api.routers.animal import router as animal_router
 from animalshelterapi.api.routers.adopter import router as adopter_router
 from animalshelterapi.api.routers.adoption import router as adoption_router
 from animalshelterapi.api.routers.medicalrecord import router as medical_record_router
+from animalshelterapi.api.routers.metrics import router as metrics_router
 from animalshelterapi.api.routers.report import router as report_router
+from animalshelterapi.api.routers.stats import router as stats_router
+from animalshelterapi.config import config
 from animalshelterapi.container import Container
 from animalshelterapi.db import database
 from animalshelterapi.db import init_db
 
+logging.basicConfig(
+    level=config.LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+
 container = Container()
 container.wire(modules=[
     "animalshelterapi.api.routers.animal",
     "animalshelterapi.api.routers.adopter",
     "animalshelterapi.api.routers.adoption",
     "animalshelterapi.api.routers.medicalrecord",
+    "animalshelterapi.api.routers.metrics",
     "animalshelterapi.api.routers.report",
+    "animalshelterapi.api.routers.stats",
 ])
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
-    await init_db()
-    await database.connect()
+    if config.DB_BACKEND != "memory":
+        await init_db()
+        await database.connect()
+    await container.invalidation_listener().start()
+    await container.counter_reconciler().start()
+    await container.report_scheduler().start()
     yield
-    await database.disconnect()
+    await container.report_scheduler().stop()
+    await container.counter_reconciler().stop()
+    await container.invalidation_listener().stop()
+    if config.DB_BACKEND != "memory":
+        await database.disconnect()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -40,7 +62,24 @@ app.include_router(adopter_router, prefix="/adopter")
 app.include_router(adoption_router, prefix="/adoption")
 app.include_router(medical_record_router, prefix="/medicalrecord")
 app.include_router(report_router, prefix="/report")
+app.include_router(stats_router, prefix="/stats")
+
+if config.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
+if config.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+        level=config.COMPRESSION_LEVEL,
+        offload_size=config.COMPRESSION_OFFLOAD_SIZE,
+    )
+
+if config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
+if config.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
 
 
 @app.exception_handler(HTTPException)
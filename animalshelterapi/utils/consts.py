@@ -2,3 +2,14 @@
 
 METAR_ENDPOINT = \
     "https://tgftp.nws.noaa.gov/data/observations/metar/stations/{icao}.TXT"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_BULK_ROWS = 10000
+EXPORT_CHUNK_SIZE = 1000
+MAX_BATCH_IDS = 500
+# Primary keys are 32-bit SERIAL columns.
+MAX_ID = 2**31 - 1
+MAX_HISTOGRAM_BUCKETS = 1000
+# NOTIFY payloads are limited to 8000 bytes.
+MAX_NOTIFY_IDS = 500
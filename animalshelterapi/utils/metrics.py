@@ -0,0 +1,304 @@
+"""A module collecting metrics in the Prometheus text format.
+
+Histograms are updated as the events happen. Figures already kept
+elsewhere, such as the cache statistics or the pool usage, are read
+when the metrics are scraped and rendered with `render_family`.
+"""
+
+import functools
+import inspect
+import math
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Callable, Iterable, Mapping, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# The upper bounds of the latency buckets, in seconds.
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# The upper bounds of the buckets of the statements per request.
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+Sample = tuple[Mapping[str, str], float]
+
+
+def _escape(value: str) -> str:
+    """Function escaping the label value.
+
+    Args:
+        value (str): The raw value.
+
+    Returns:
+        str: The value safe to put between quotes.
+    """
+
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    """Function formatting the labels of a sample.
+
+    Args:
+        labels (Mapping[str, str]): The label names and values.
+
+    Returns:
+        str: The labels in braces, empty if there are none.
+    """
+
+    if not labels:
+        return ""
+
+    return "{" + ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items()
+    ) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Function formatting the value of a sample.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        str: The value as Prometheus reads it.
+    """
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value))
+
+
+def _format_sample(name: str, labels: Mapping[str, str], value: float) -> str:
+    """Function formatting a line of a sample.
+
+    Args:
+        name (str): The name of the sample.
+        labels (Mapping[str, str]): The label names and values.
+        value (float): The value.
+
+    Returns:
+        str: The sample in the text format.
+    """
+
+    return f"{name}{_format_labels(labels)} {_format_value(value)}"
+
+
+def render_family(
+    name: str,
+    kind: str,
+    help_text: str,
+    samples: Iterable[Sample],
+) -> str:
+    """Function rendering a metric family.
+
+    Args:
+        name (str): The name of the metric.
+        kind (str): The type of the metric, such as `gauge` or `counter`.
+        help_text (str): The description of the metric.
+        samples (Iterable[Sample]): The labels and values of the samples.
+
+    Returns:
+        str: The family in the text format.
+    """
+
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(_format_sample(name, labels, value) for labels, value in samples)
+
+    return "\n".join(lines) + "\n"
+
+
+class Histogram:
+    """A class counting observations in buckets, per label values."""
+
+    name: str
+    help_text: str
+    label_names: tuple[str, ...]
+    _buckets: tuple[float, ...]
+    _series: dict[tuple[str, ...], list[float]]
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """The initializer of the `histogram`.
+
+        Args:
+            name (str): The name of the metric.
+            help_text (str): The description of the metric.
+            label_names (Sequence[str]): The names of the labels.
+            buckets (Sequence[float]): The ascending upper bounds.
+        """
+
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._buckets = tuple(sorted(buckets))
+        self._series = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        """The method counting the observation.
+
+        Args:
+            labels (tuple[str, ...]): The label values in the order
+                of the label names.
+            value (float): The observed value.
+        """
+
+        series = self._series.get(labels)
+        if series is None:
+            # The bucket counts, then the sum of the values.
+            series = self._series[labels] = [0.0] * (len(self._buckets) + 2)
+        series[bisect_left(self._buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> str:
+        """The method rendering the histogram.
+
+        Returns:
+            str: The histogram in the text format.
+        """
+
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for values, series in sorted(self._series.items()):
+            labels = dict(zip(self.label_names, values))
+            count = 0.0
+            for bound, observed in zip((*self._buckets, math.inf), series):
+                count += observed
+                lines.append(_format_sample(
+                    f"{self.name}_bucket",
+                    {**labels, "le": _format_value(bound)},
+                    count,
+                ))
+            lines.append(_format_sample(f"{self.name}_sum", labels, series[-1]))
+            lines.append(_format_sample(f"{self.name}_count", labels, count))
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsRegistry:
+    """A class keeping the histograms of the app."""
+
+    _histograms: list[Histogram]
+
+    def __init__(self) -> None:
+        """The initializer of the `metrics registry`."""
+
+        self._histograms = []
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """The method creating a registered histogram.
+
+        Args:
+            name (str): The name of the metric.
+            help_text (str): The description of the metric.
+            label_names (Sequence[str]): The names of the labels.
+            buckets (Sequence[float]): The ascending upper bounds.
+
+        Returns:
+            Histogram: The new histogram.
+        """
+
+        histogram = Histogram(name, help_text, label_names, buckets)
+        self._histograms.append(histogram)
+
+        return histogram
+
+    def render(self) -> str:
+        """The method rendering all histograms.
+
+        Returns:
+            str: The histograms in the text format.
+        """
+
+        return "".join(histogram.render() for histogram in self._histograms)
+
+
+registry = MetricsRegistry()
+request_latency = registry.histogram(
+    "http_request_duration_seconds",
+    "The time of handling the request until the body is sent.",
+    ("method", "route", "status"),
+)
+request_queries = registry.histogram(
+    "http_request_queries",
+    "The number of database statements sent per request.",
+    ("method", "route"),
+    QUERY_BUCKETS,
+)
+repository_latency = registry.histogram(
+    "repository_call_duration_seconds",
+    "The time of the repository calls, including their queries.",
+    ("repository", "method"),
+)
+
+
+def observed_methods(histogram: Histogram) -> Callable[[type[T]], type[T]]:
+    """Function creating a class decorator timing its public coroutines.
+
+    Every call is observed with the class and the method name as labels,
+    also outside requests. Asynchronous generators are left as they are.
+
+    Args:
+        histogram (Histogram): The histogram of the call durations.
+
+    Returns:
+        Callable[[type[T]], type[T]]: The class decorator.
+    """
+
+    def observe(
+        method: Callable[..., Any],
+        labels: tuple[str, str],
+    ) -> Callable[..., Any]:
+        """The function wrapping the coroutine function.
+
+        Args:
+            method (Callable[..., Any]): The observed coroutine function.
+            labels (tuple[str, str]): The class and the method name.
+
+        Returns:
+            Callable[..., Any]: The wrapped coroutine function.
+        """
+
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                histogram.observe(labels, perf_counter() - start)
+
+        return wrapper
+
+    def decorate(cls: type[T]) -> type[T]:
+        """The function wrapping the methods of the class.
+
+        Args:
+            cls (type[T]): The observed class.
+
+        Returns:
+            type[T]: The same class.
+        """
+
+        for name, member in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(member):
+                setattr(cls, name, observe(member, (cls.__name__, name)))
+
+        return cls
+
+    return decorate
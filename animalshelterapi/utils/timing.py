@@ -0,0 +1,363 @@
+"""A module measuring where the time of a request goes.
+
+The time is split into phases: `db` for the database calls, `map` for
+the repositories outside them (building queries and mapping rows),
+`svc` for the services outside the repositories (caching and business
+logic), `di` for resolving the dependencies of the endpoint and `ser`
+for encoding the result.
+
+Every measured block is a span. A span counts only its exclusive time,
+the time spent in nested spans goes to their phases. The phases are
+measured in wall-clock intervals and the overlapping intervals of a phase
+are merged, so concurrent spans, e.g. queries run with `asyncio.gather`,
+make no phase longer than the total time. Different phases may still run
+in parallel, so their sum is not bounded by it. Outside a request no span
+is current and the measurement is skipped.
+"""
+
+import functools
+import inspect
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Iterator, TypeVar
+
+T = TypeVar("T")
+IntervalT = tuple[float, float]
+
+# The span enclosing the running code, None outside a measured request.
+_current: ContextVar["_Span | None"] = ContextVar("timing_span", default=None)
+_INACTIVE: ContextManager[None] = nullcontext()
+
+
+class RequestTimings:
+    """A class summing the time spent in each phase of one request.
+
+    Entering it makes the request span current for the running task and
+    the tasks it starts. The statements sent to the database are counted
+    as well.
+    """
+
+    __slots__ = ("started", "intervals", "queries", "_root")
+
+    started: float
+    intervals: dict[str, list[IntervalT]]
+    queries: int
+    _root: "_Span"
+
+    def __init__(self) -> None:
+        """The initializer of the `request timings`."""
+
+        self.started = perf_counter()
+        self.intervals = {}
+        self.queries = 0
+        self._root = _Span(self, None, None)
+
+    def __enter__(self) -> "RequestTimings":
+        """The method making the request span current.
+
+        Returns:
+            RequestTimings: The timings themselves.
+        """
+
+        self._root.__enter__()
+
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """The method restoring the previous span."""
+
+        self._root.__exit__()
+
+    def add(self, phase: str | None, intervals: list[IntervalT]) -> None:
+        """The method counting the time towards the phase.
+
+        Sequential spans are settled in order, so an interval overlapping
+        or touching the last one is merged into it on the spot.
+
+        Args:
+            phase (str | None): The phase, None for the unassigned time.
+            intervals (list[IntervalT]): The exclusive time spent in the
+                phase, ordered by start.
+        """
+
+        if phase is None:
+            return
+
+        merged = self.intervals.setdefault(phase, [])
+        for start, end in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+    def elapsed(self) -> float:
+        """The method getting the time since the request started.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+
+        return perf_counter() - self.started
+
+    def milliseconds(self) -> dict[str, float]:
+        """The method getting the phases in milliseconds.
+
+        Returns:
+            dict[str, float]: The durations of the phases seen so far.
+        """
+
+        return {
+            phase: round(sum(end - start for start, end in _union(spans)) * 1000, 3)
+            for phase, spans in self.intervals.items()
+        }
+
+    def header(self) -> str:
+        """The method building the value of the `Server-Timing` header.
+
+        Returns:
+            str: The phases seen so far followed by the total time.
+        """
+
+        metrics = [
+            *self.milliseconds().items(),
+            ("total", round(self.elapsed() * 1000, 3)),
+        ]
+
+        return ", ".join(f"{phase};dur={ms}" for phase, ms in metrics)
+
+
+class _Span:
+    """A class measuring one block of code within a request."""
+
+    __slots__ = ("_timings", "_parent", "_phase", "_start", "_children", "_token")
+
+    _timings: RequestTimings
+    _parent: "_Span | None"
+    _phase: str | None
+    _start: float
+    _children: list[IntervalT]
+    _token: Token | None
+
+    def __init__(
+        self,
+        timings: RequestTimings,
+        parent: "_Span | None",
+        phase: str | None,
+    ) -> None:
+        """The initializer of the `span`.
+
+        Args:
+            timings (RequestTimings): The timings of the request.
+            parent (_Span | None): The enclosing span.
+            phase (str | None): The phase the exclusive time counts
+                towards, None to leave it unassigned.
+        """
+
+        self._timings = timings
+        self._parent = parent
+        self._phase = phase
+        self._start = 0.0
+        self._children = []
+        self._token = None
+
+    def __enter__(self) -> "_Span":
+        """The method starting the span and making it current.
+
+        Returns:
+            _Span: The span itself.
+        """
+
+        self._start = perf_counter()
+        self._token = _current.set(self)
+
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """The method stopping the span and restoring the enclosing one."""
+
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        self._settle(perf_counter())
+
+    def switch(self, phase: str) -> None:
+        """The method counting the rest of the span towards another phase.
+
+        Args:
+            phase (str): The new phase.
+        """
+
+        self._settle(perf_counter())
+        self._phase = phase
+
+    def _settle(self, now: float) -> None:
+        """The method counting the time since the last settlement.
+
+        The exclusive time is the part of the span not covered by any
+        nested span, so concurrent nested spans are subtracted once.
+
+        Args:
+            now (float): The current time.
+        """
+
+        exclusive = []
+        start = self._start
+        for child_start, child_end in _union(self._children):
+            if child_start > start:
+                exclusive.append((start, min(child_start, now)))
+            start = max(start, child_end)
+            if start >= now:
+                break
+        if start < now:
+            exclusive.append((start, now))
+
+        self._timings.add(self._phase, exclusive)
+        if self._parent is not None:
+            self._parent._children.append((self._start, now))
+        self._start = now
+        self._children = []
+
+
+def _union(intervals: list[IntervalT]) -> list[IntervalT]:
+    """Function merging overlapping intervals.
+
+    Args:
+        intervals (list[IntervalT]): The intervals in any order.
+
+    Returns:
+        list[IntervalT]: The disjoint intervals ordered by start.
+    """
+
+    merged: list[IntervalT] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+@contextmanager
+def request_timings() -> Iterator[RequestTimings]:
+    """Function providing the timings of the running request.
+
+    Several middlewares share the timings this way, the outermost one
+    starts them.
+
+    Yields:
+        RequestTimings: The current timings, or new ones if no request
+            is measured yet.
+    """
+
+    span = _current.get()
+    if span is not None:
+        yield span._timings
+        return
+
+    with RequestTimings() as timings:
+        yield timings
+
+
+def count_query() -> None:
+    """Function counting a database statement towards the running request."""
+
+    span = _current.get()
+    if span is not None:
+        span._timings.queries += 1
+
+
+def measure(phase: str) -> ContextManager[Any]:
+    """Function measuring the block as a span of the phase.
+
+    Args:
+        phase (str): The phase of the block.
+
+    Returns:
+        ContextManager[Any]: The span, or a no-op outside a request.
+    """
+
+    parent = _current.get()
+    if parent is None:
+        return _INACTIVE
+
+    return _Span(parent._timings, parent, phase)
+
+
+def switch_phase(phase: str) -> None:
+    """Function counting the rest of the current span towards the phase.
+
+    Args:
+        phase (str): The new phase.
+    """
+
+    span = _current.get()
+    if span is not None:
+        span.switch(phase)
+
+
+def timed(phase: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Function creating a decorator measuring a coroutine function.
+
+    Args:
+        phase (str): The phase of the calls.
+
+    Returns:
+        Callable[[Callable[..., Any]], Callable[..., Any]]: The decorator.
+    """
+
+    def decorate(method: Callable[..., Any]) -> Callable[..., Any]:
+        """The function wrapping the coroutine function.
+
+        Args:
+            method (Callable[..., Any]): The measured coroutine function.
+
+        Returns:
+            Callable[..., Any]: The wrapped coroutine function.
+        """
+
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            parent = _current.get()
+            if parent is None:
+                return await method(*args, **kwargs)
+
+            with _Span(parent._timings, parent, phase):
+                return await method(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def timed_methods(phase: str) -> Callable[[type[T]], type[T]]:
+    """Function creating a class decorator measuring its public coroutines.
+
+    Asynchronous generators are left as they are, they are consumed while
+    the response is sent.
+
+    Args:
+        phase (str): The phase of the calls.
+
+    Returns:
+        Callable[[type[T]], type[T]]: The class decorator.
+    """
+
+    def decorate(cls: type[T]) -> type[T]:
+        """The function wrapping the methods of the class.
+
+        Args:
+            cls (type[T]): The measured class.
+
+        Returns:
+            type[T]: The same class.
+        """
+
+        for name, member in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(member):
+                setattr(cls, name, timed(phase)(member))
+
+        return cls
+
+    return decorate
@@ -0,0 +1,281 @@
+"""Benchmark comparing the per-row and the batch mapping of joined rows
+to DTOs.
+
+The per-row mapping is the former `from_record`: each row is copied into a
+dict and the nested DTOs are built field by field from the auto-generated
+`id_1`/`id_2` labels. The batch mapping is `from_records` reading explicitly
+labelled columns and validating the whole list with a `TypeAdapter`.
+
+The rows are fetched from a scratch schema seeded inside a transaction which
+is rolled back at the end, so it is safe to point it at any database. Only
+the mapping is timed.
+
+Usage:
+    python -m benchmarks.dto_mapping --rows 100000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import time
+from typing import Any, Callable
+
+from sqlalchemy import join, select, text
+from sqlalchemy.engine import RowMapping
+
+from animalshelterapi.db import (
+    adopter_table,
+    adoption_table,
+    animal_table,
+    engine,
+    medical_record_table,
+    metadata,
+)
+from animalshelterapi.infrastructure.dto.adopterdto import AdopterDTO
+from animalshelterapi.infrastructure.dto.adoptiondto import AdoptionDTO
+from animalshelterapi.infrastructure.dto.animaldto import AnimalDTO
+from animalshelterapi.infrastructure.dto.medicalrecorddto import MedicalRecordDTO
+from benchmarks.query_plans import SEED_STATEMENTS
+
+SCHEMA = "bench_dto_mapping"
+
+
+def _legacy_animal(record: dict) -> AnimalDTO:
+    """Function building the nested animal the way `from_record` did.
+
+    Args:
+        record (dict): The row copied into a dict.
+
+    Returns:
+        AnimalDTO: The animal of the row.
+    """
+
+    return AnimalDTO(
+        id=record.get("id_1"),
+        name=record.get("name"),
+        species=record.get("species"),
+        breed=record.get("breed"),
+        age=record.get("age"),
+        gender=record.get("gender"),
+        arrival_date=record.get("arrival_date"),
+        adoption_status=record.get("adoption_status"),
+        description=record.get("description"),
+    )
+
+
+def legacy_adoptions(records: list[RowMapping]) -> list[AdoptionDTO]:
+    """Function mapping adoption rows one by one.
+
+    Args:
+        records (list[RowMapping]): The rows of the unlabelled join.
+
+    Returns:
+        list[AdoptionDTO]: The mapped adoptions.
+    """
+
+    adoptions = []
+    for record in records:
+        record_dict = dict(record)
+        adoptions.append(AdoptionDTO(
+            id=record_dict.get("id"),
+            animal=_legacy_animal(record_dict),
+            adopter=AdopterDTO(
+                id=record_dict.get("id_2"),
+                first_name=record_dict.get("first_name"),
+                last_name=record_dict.get("last_name"),
+                phone_number=record_dict.get("phone_number"),
+                email=record_dict.get("email"),
+                address=record_dict.get("address"),
+            ),
+            adoption_date=record_dict.get("adoption_date"),
+        ))
+
+    return adoptions
+
+
+def legacy_medical_records(records: list[RowMapping]) -> list[MedicalRecordDTO]:
+    """Function mapping medical record rows one by one.
+
+    Args:
+        records (list[RowMapping]): The rows of the unlabelled join.
+
+    Returns:
+        list[MedicalRecordDTO]: The mapped medical records.
+    """
+
+    medical_records = []
+    for record in records:
+        record_dict = dict(record)
+        medical_records.append(MedicalRecordDTO(
+            id=record_dict.get("id"),
+            animal=_legacy_animal(record_dict),
+            visit_date=record_dict.get("visit_date"),
+            diagnosis=record_dict.get("diagnosis"),
+            treatment=record_dict.get("treatment"),
+        ))
+
+    return medical_records
+
+
+def queries(rows: int) -> dict[str, tuple[Any, Any]]:
+    """Function building the unlabelled and the labelled joins.
+
+    Args:
+        rows (int): The number of rows to fetch.
+
+    Returns:
+        dict[str, tuple[Any, Any]]: The pairs of queries keyed by entity.
+    """
+
+    adoption_join = join(
+        adoption_table,
+        adopter_table,
+        adoption_table.c.adopter_id == adopter_table.c.id,
+    ).join(
+        animal_table,
+        adoption_table.c.animal_id == animal_table.c.id,
+    )
+    medical_record_join = join(
+        medical_record_table,
+        animal_table,
+        medical_record_table.c.animal_id == animal_table.c.id,
+    )
+    animal_labels = [
+        column.label(f"animal_{column.name}") for column in animal_table.c
+    ]
+    adopter_labels = [
+        column.label(f"adopter_{column.name}") for column in adopter_table.c
+    ]
+
+    return {
+        "adoptions": (
+            select(adoption_table, animal_table, adopter_table)
+            .select_from(adoption_join)
+            .limit(rows),
+            select(
+                adoption_table.c.id,
+                adoption_table.c.adoption_date,
+                *animal_labels,
+                *adopter_labels,
+            )
+            .select_from(adoption_join)
+            .limit(rows),
+        ),
+        "medical_records": (
+            select(medical_record_table, animal_table)
+            .select_from(medical_record_join)
+            .limit(rows),
+            select(
+                medical_record_table.c.id,
+                medical_record_table.c.visit_date,
+                medical_record_table.c.diagnosis,
+                medical_record_table.c.treatment,
+                *animal_labels,
+            )
+            .select_from(medical_record_join)
+            .limit(rows),
+        ),
+    }
+
+
+def measure(call: Callable[[], Any], repeat: int) -> float:
+    """Function timing the call and keeping the best run.
+
+    Args:
+        call (Callable[[], Any]): The measured call.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The shortest run in seconds.
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+async def run(rows: int, repeat: int) -> dict:
+    """Function timing both mappings of the fetched rows.
+
+    Args:
+        rows (int): The number of rows to map.
+        repeat (int): The number of runs of each mapping.
+
+    Returns:
+        dict: The mapping times keyed by entity.
+    """
+
+    mappers = {
+        "adoptions": (legacy_adoptions, AdoptionDTO.from_records),
+        "medical_records": (legacy_medical_records, MedicalRecordDTO.from_records),
+    }
+    report: dict = {"rows": rows, "mappings": {}}
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.execute(text(f"SET LOCAL search_path TO {SCHEMA}"))
+            await conn.run_sync(metadata.create_all)
+            # The seed creates half as many adoptions as animals.
+            for statement in SEED_STATEMENTS:
+                await conn.execute(text(statement), {"rows": rows * 2})
+
+            for label, (before_query, after_query) in queries(rows).items():
+                before_rows = (await conn.execute(before_query)).mappings().all()
+                after_rows = (await conn.execute(after_query)).mappings().all()
+                before, after = mappers[label]
+                assert before(before_rows) == after(after_rows)
+
+                before_s = measure(lambda: before(before_rows), repeat)
+                after_s = measure(lambda: after(after_rows), repeat)
+                report["mappings"][label] = {
+                    "before_s": round(before_s, 3),
+                    "after_s": round(after_s, 3),
+                    "before_us_per_row": round(before_s / rows * 1e6, 3),
+                    "after_us_per_row": round(after_s / rows * 1e6, 3),
+                }
+        finally:
+            await transaction.rollback()
+
+    await engine.dispose()
+
+    return report
+
+
+def main() -> None:
+    """Function parsing arguments and printing the mapping comparison."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.rows, args.repeat))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Mapped {report['rows']} rows\n")
+    for label, timing in report["mappings"].items():
+        print(label)
+        print(
+            f"  before: {timing['before_s']:>7.3f} s"
+            f"  {timing['before_us_per_row']:>7.3f} us/row"
+        )
+        print(
+            f"  after:  {timing['after_s']:>7.3f} s"
+            f"  {timing['after_us_per_row']:>7.3f} us/row"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,761 @@
+"""Load driver exercising every route of the API at fixed concurrency.
+
+The routes are driven one after another, each by `--concurrency` workers
+sending `--requests` requests between them, so every route gets its own
+latency percentiles and throughput. Writes only touch the rows created by
+the driver, which are removed at the end. The routes are checked against
+the OpenAPI schema of the app, so a route without a scenario is reported
+instead of silently skipped.
+
+Without `--url` the app is served in process through the ASGI transport,
+using the backend selected by `DB_BACKEND`. An empty database gets a small
+fixture first, seed larger ones with `benchmarks.seed`.
+
+The results are saved as JSON named after the commit, `--compare` prints
+the change of every route against an earlier result.
+
+Usage:
+    python -m benchmarks.load --url http://localhost:8000 --concurrency 32
+    DB_BACKEND=memory python -m benchmarks.load --requests 500
+    python -m benchmarks.load --compare benchmarks/results/load-0123abc.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import time
+from collections import Counter
+from contextlib import AsyncExitStack
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from benchmarks.seed import fake_adopter, fake_animal, fake_medical_record
+
+RESULTS_DIR = Path(__file__).parent / "results"
+# The shares of the requests sent to the routes reading whole tables.
+EXPORT_SHARE = 0.02
+PAGE_SIZE = 20
+SAMPLE_SIZE = 200
+
+
+class Context:
+    """A class holding the state shared by the scenarios.
+
+    The sample comes from the stored rows before the run, the owned ids
+    are the rows created by the driver itself, the only ones it updates
+    and deletes.
+    """
+
+    client: httpx.AsyncClient
+    rng: random.Random
+    today: date
+    sample: dict[str, list[Any]]
+    owned: dict[str, list[int]]
+    _numbers: int
+
+    def __init__(self, client: httpx.AsyncClient, seed: int) -> None:
+        """The initializer of the `context`.
+
+        Args:
+            client (httpx.AsyncClient): The client of the app.
+            seed (int): The random seed.
+        """
+
+        self.client = client
+        self.rng = random.Random(seed)
+        self.today = date.today()
+        self.sample = {}
+        self.owned = {
+            "animal": [],
+            "adopter": [],
+            "adoption": [],
+            "medicalrecord": [],
+        }
+        self._numbers = 900_000_000 + self.rng.randrange(10_000_000)
+
+    def pick(self, key: str) -> Any:
+        """The method choosing a sampled value.
+
+        Args:
+            key (str): The name of the sampled values.
+
+        Returns:
+            Any: The chosen value.
+        """
+
+        return self.rng.choice(self.sample[key])
+
+    def animal(self) -> dict:
+        """The method generating the attributes of a new animal.
+
+        Returns:
+            dict: The JSON body of the animal.
+        """
+
+        return _json(fake_animal(self.rng, self.today))
+
+    def adopter(self) -> dict:
+        """The method generating the attributes of a new adopter.
+
+        Returns:
+            dict: The JSON body of the adopter.
+        """
+
+        self._numbers += 1
+
+        return fake_adopter(self.rng, self._numbers)
+
+    def adoption(self) -> dict:
+        """The method generating the attributes of a new adoption.
+
+        Returns:
+            dict: The JSON body of the adoption.
+        """
+
+        return {
+            "animal_id": self.pick("animal_ids"),
+            "adopter_id": self.pick("adopter_ids"),
+            "adoption_date": str(self.today),
+        }
+
+    def medical_record(self) -> dict:
+        """The method generating the attributes of a new medical record.
+
+        Returns:
+            dict: The JSON body of the medical record.
+        """
+
+        return _json(fake_medical_record(
+            self.rng,
+            self.pick("animal_ids"),
+            self.today - timedelta(days=30),
+            self.today,
+        ))
+
+    async def own(self, resource: str, body: Callable[[], dict]) -> int:
+        """The method getting a row owned by the driver, creating it if needed.
+
+        Args:
+            resource (str): The router prefix of the row.
+            body (Callable[[], dict]): The factory of the row attributes.
+
+        Returns:
+            int: The id of the row.
+        """
+
+        if not self.owned[resource]:
+            await self.create(resource, body())
+
+        return self.rng.choice(self.owned[resource])
+
+    async def create(self, resource: str, body: dict) -> int:
+        """The method creating a row owned by the driver.
+
+        Args:
+            resource (str): The router prefix of the row.
+            body (dict): The attributes of the row.
+
+        Returns:
+            int: The id of the row.
+        """
+
+        response = await self.client.post(f"/{resource}/create", json=body)
+        response.raise_for_status()
+        row_id = response.json()["id"]
+        self.owned[resource].append(row_id)
+
+        return row_id
+
+    async def take(self, resource: str, body: Callable[[], dict]) -> int:
+        """The method removing an owned row from the owned ids, creating it
+        if needed.
+
+        Args:
+            resource (str): The router prefix of the row.
+            body (Callable[[], dict]): The factory of the row attributes.
+
+        Returns:
+            int: The id of the row, no longer owned.
+        """
+
+        if not self.owned[resource]:
+            await self.create(resource, body())
+
+        return self.owned[resource].pop()
+
+
+Request = dict[str, Any]
+
+
+class Scenario:
+    """A class building the requests of one route."""
+
+    build: Callable[[Context], Awaitable[Request]]
+    share: float
+    created: str | None
+
+    def __init__(
+        self,
+        build: Callable[[Context], Awaitable[Request]],
+        share: float = 1.0,
+        created: str | None = None,
+    ) -> None:
+        """The initializer of the `scenario`.
+
+        Args:
+            build (Callable[[Context], Awaitable[Request]]): The factory of
+                the request arguments, any preparation it sends is not timed.
+            share (float): The share of the requests sent to the route.
+            created (str | None): The router prefix of the rows created
+                by the route, recorded as owned.
+        """
+
+        self.build = build
+        self.share = share
+        self.created = created
+
+
+def _json(row: dict) -> dict:
+    """Function converting the dates of the row for a JSON body.
+
+    Args:
+        row (dict): The generated row.
+
+    Returns:
+        dict: The row with ISO dates.
+    """
+
+    return {
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in row.items()
+    }
+
+
+def _get(url: str, **params: Any) -> Request:
+    """Function building the arguments of a GET request.
+
+    Args:
+        url (str): The path of the request.
+        **params (Any): The query parameters.
+
+    Returns:
+        Request: The request arguments.
+    """
+
+    return {"method": "GET", "url": url, "params": params}
+
+
+def _page(ctx: Context) -> dict:
+    """Function building the paging parameters, the next page now and then.
+
+    Args:
+        ctx (Context): The shared state.
+
+    Returns:
+        dict: The query parameters of the page.
+    """
+
+    params: dict[str, Any] = {"limit": PAGE_SIZE}
+    if ctx.rng.random() < 0.25 and ctx.sample.get("cursors"):
+        params["cursor"] = ctx.pick("cursors")
+
+    return params
+
+
+def _batch(ctx: Context, key: str) -> str:
+    """Function building the ids of a batch request.
+
+    Args:
+        ctx (Context): The shared state.
+        key (str): The name of the sampled ids.
+
+    Returns:
+        str: The comma separated ids.
+    """
+
+    ids = ctx.sample[key]
+
+    return ",".join(map(str, ctx.rng.sample(ids, min(PAGE_SIZE, len(ids)))))
+
+
+def scenarios() -> dict[str, Scenario]:
+    """Function building the scenarios keyed by method and route path.
+
+    Returns:
+        dict[str, Scenario]: The scenarios of all routes.
+    """
+
+    async def get(url: str, **params: Any) -> Request:
+        return _get(url, **params)
+
+    def routes(
+        resource: str,
+        body: Callable[[Context], dict],
+        id_key: str,
+        id_param: str,
+        bulk: bool,
+    ) -> dict[str, Scenario]:
+        async def create(ctx: Context) -> Request:
+            return {"method": "POST", "url": f"/{resource}/create", "json": body(ctx)}
+
+        async def create_many(ctx: Context) -> Request:
+            return {
+                "method": "POST",
+                "url": f"/{resource}/bulk",
+                "json": [body(ctx) for _ in range(10)],
+            }
+
+        async def get_all(ctx: Context) -> Request:
+            return _get(f"/{resource}/all", **_page(ctx))
+
+        async def get_batch(ctx: Context) -> Request:
+            return _get(f"/{resource}/batch", ids=_batch(ctx, id_key))
+
+        async def export(ctx: Context) -> Request:
+            return _get(f"/{resource}/export")
+
+        async def get_one(ctx: Context) -> Request:
+            return _get(f"/{resource}/{ctx.pick(id_key)}")
+
+        async def update(ctx: Context) -> Request:
+            row_id = await ctx.own(resource, lambda: body(ctx))
+
+            return {"method": "PUT", "url": f"/{resource}/{row_id}", "json": body(ctx)}
+
+        async def delete(ctx: Context) -> Request:
+            row_id = await ctx.take(resource, lambda: body(ctx))
+
+            return {"method": "DELETE", "url": f"/{resource}/{row_id}"}
+
+        path = f"/{resource}/{{{id_param}}}"
+        found = {
+            f"POST /{resource}/create": Scenario(create, created=resource),
+            f"GET /{resource}/all": Scenario(get_all),
+            f"GET /{resource}/batch": Scenario(get_batch),
+            f"GET /{resource}/export": Scenario(export, share=EXPORT_SHARE),
+            f"GET {path}": Scenario(get_one),
+            f"PUT {path}": Scenario(update),
+            f"DELETE {path}": Scenario(delete),
+        }
+        if bulk:
+            found[f"POST /{resource}/bulk"] = Scenario(
+                create_many,
+                share=0.2,
+                created=resource,
+            )
+
+        return found
+
+    found = {
+        **routes("animal", Context.animal, "animal_ids", "animal_id", True),
+        **routes("adopter", Context.adopter, "adopter_ids", "adopter_id", True),
+        **routes("adoption", Context.adoption, "adoption_ids", "adoption_id", False),
+        **routes(
+            "medicalrecord",
+            Context.medical_record,
+            "medical_record_ids",
+            "medical_record_id",
+            True,
+        ),
+    }
+
+    async def search(ctx: Context) -> Request:
+        return _get(
+            "/animal/search",
+            species=ctx.pick("species"),
+            adoption_status="available",
+            sort_by="arrival_date",
+            order="desc",
+            limit=PAGE_SIZE,
+        )
+
+    found["GET /animal/search"] = Scenario(search)
+    for column, key in (
+        ("name", "names"),
+        ("species", "species"),
+        ("breed", "breeds"),
+        ("gender", "genders"),
+        ("adoption_status", "adoption_statuses"),
+    ):
+        async def by_column(ctx: Context, column: str = column, key: str = key) -> Request:
+            return _get(f"/animal/{column}/{ctx.pick(key)}", limit=PAGE_SIZE)
+
+        found[f"GET /animal/{column}/{{{column}}}"] = Scenario(by_column)
+
+    for column, key in (("last_name", "last_names"), ("phone_number", "phone_numbers")):
+        async def by_adopter(ctx: Context, column: str = column, key: str = key) -> Request:
+            return _get(f"/adopter/{column}/{ctx.pick(key)}", limit=PAGE_SIZE)
+
+        found[f"GET /adopter/{column}/{{{column}}}"] = Scenario(by_adopter)
+
+    for url, key in (
+        ("/adoption/animal/{animal_id}", "animal_ids"),
+        ("/adoption/adopter/{adopter_id}", "adopter_ids"),
+        ("/medicalrecord/animal/{animal_id}", "animal_ids"),
+    ):
+        async def by_parent(ctx: Context, url: str = url, key: str = key) -> Request:
+            prefix = url.rsplit("/", 1)[0]
+
+            return _get(f"{prefix}/{ctx.pick(key)}", limit=PAGE_SIZE)
+
+        found[f"GET {url}"] = Scenario(by_parent)
+
+    for name, param in (
+        ("adoption_report", "adoptions_report"),
+        ("medical_records_report", "medical_records_report"),
+        ("animals_report", "animals_report"),
+    ):
+        async def report(ctx: Context, name: str = name) -> Request:
+            return _get(f"/report/{name}/latest")
+
+        found[f"GET /report/{name}/{{{param}}}"] = Scenario(report)
+
+    async def histogram(ctx: Context) -> Request:
+        return _get(
+            "/report/histogram",
+            **{
+                "from": str(ctx.today - timedelta(days=365)),
+                "to": str(ctx.today),
+                "bucket": "week",
+            },
+        )
+
+    found["GET /report/dashboard"] = Scenario(lambda ctx: get("/report/dashboard"))
+    found["GET /report/histogram"] = Scenario(histogram)
+    found["GET /stats/single_flight"] = Scenario(
+        lambda ctx: get("/stats/single_flight"),
+    )
+    found["GET /stats/cache"] = Scenario(lambda ctx: get("/stats/cache"))
+
+    return found
+
+
+async def _fetch_page(client: httpx.AsyncClient, resource: str) -> dict:
+    """Function fetching the first rows of the resource.
+
+    Args:
+        client (httpx.AsyncClient): The client of the app.
+        resource (str): The router prefix of the rows.
+
+    Returns:
+        dict: The page of rows.
+    """
+
+    response = await client.get(f"/{resource}/all", params={"limit": SAMPLE_SIZE})
+    response.raise_for_status()
+
+    return response.json()
+
+
+async def prepare(ctx: Context, fixture: int) -> None:
+    """Function sampling the stored rows, creating a fixture if there are none.
+
+    Args:
+        ctx (Context): The shared state.
+        fixture (int): The number of animals of the fixture.
+    """
+
+    if not (await _fetch_page(ctx.client, "animal"))["items"]:
+        animals = [ctx.animal() for _ in range(fixture)]
+        adopters = [ctx.adopter() for _ in range(max(fixture // 2, 1))]
+        for resource, rows in (("animal", animals), ("adopter", adopters)):
+            response = await ctx.client.post(f"/{resource}/bulk", json=rows)
+            response.raise_for_status()
+
+    pages = {
+        resource: await _fetch_page(ctx.client, resource)
+        for resource in ("animal", "adopter")
+    }
+    animals = pages["animal"]["items"]
+    adopters = pages["adopter"]["items"]
+    ctx.sample = {
+        "animal_ids": [row["id"] for row in animals],
+        "adopter_ids": [row["id"] for row in adopters],
+        "names": sorted({row["name"] for row in animals}),
+        "species": sorted({row["species"] for row in animals}),
+        "breeds": sorted({row["breed"] for row in animals}),
+        "genders": sorted({row["gender"] for row in animals}),
+        "adoption_statuses": sorted({row["adoption_status"] for row in animals}),
+        "last_names": sorted({row["last_name"] for row in adopters}),
+        "phone_numbers": [row["phone_number"] for row in adopters],
+        "cursors": [
+            page["next"] for page in pages.values() if page.get("next")
+        ],
+    }
+
+    for resource, key, body in (
+        ("adoption", "adoption_ids", ctx.adoption),
+        ("medicalrecord", "medical_record_ids", ctx.medical_record),
+    ):
+        items = (await _fetch_page(ctx.client, resource))["items"]
+        if not items:
+            for _ in range(max(fixture // 4, 1)):
+                await ctx.create(resource, body())
+            items = (await _fetch_page(ctx.client, resource))["items"]
+            ctx.owned[resource].clear()
+        ctx.sample[key] = [row["id"] for row in items]
+
+
+async def cleanup(ctx: Context) -> None:
+    """Function deleting the rows created by the driver.
+
+    Args:
+        ctx (Context): The shared state.
+    """
+
+    for resource in ("adoption", "medicalrecord", "animal", "adopter"):
+        for row_id in ctx.owned[resource]:
+            await ctx.client.delete(f"/{resource}/{row_id}")
+        ctx.owned[resource].clear()
+
+
+def percentile(latencies: list[float], share: float) -> float:
+    """Function getting the nearest-rank percentile of the sorted latencies.
+
+    Args:
+        latencies (list[float]): The sorted latencies.
+        share (float): The percentile as a fraction.
+
+    Returns:
+        float: The latency, 0 if there are none.
+    """
+
+    if not latencies:
+        return 0.0
+
+    return latencies[min(len(latencies) - 1, math.ceil(share * len(latencies)) - 1)]
+
+
+async def drive(
+    ctx: Context,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    """Function sending the requests of one route at fixed concurrency.
+
+    Args:
+        ctx (Context): The shared state.
+        scenario (Scenario): The scenario of the route.
+        requests (int): The number of requests.
+        concurrency (int): The number of concurrent workers.
+
+    Returns:
+        dict: The latency percentiles in milliseconds, the throughput
+            and the response statuses.
+    """
+
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            request = await scenario.build(ctx)
+            started = time.perf_counter()
+            try:
+                response = await ctx.client.request(**request)
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            statuses[str(response.status_code)] += 1
+            if scenario.created and response.status_code == 201:
+                body = response.json()
+                ctx.owned[scenario.created].extend(
+                    [body["id"]] if "id" in body else
+                    [row_id for row_id in body["ids"] if row_id is not None]
+                )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    return {
+        "requests": requests,
+        "errors": sum(
+            count for status, count in statuses.items()
+            if not status.isdigit() or int(status) >= 400
+        ),
+        "statuses": dict(statuses),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": (
+            round(1000 * sum(latencies) / len(latencies), 3) if latencies else 0.0
+        ),
+        "p50_ms": round(1000 * percentile(latencies, 0.50), 3),
+        "p95_ms": round(1000 * percentile(latencies, 0.95), 3),
+        "p99_ms": round(1000 * percentile(latencies, 0.99), 3),
+        "max_ms": round(1000 * latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+def _commit() -> str:
+    """Function getting the short hash of the checked out commit.
+
+    Returns:
+        str: The hash, `unknown` outside of a git checkout.
+    """
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Function driving all routes and collecting the results.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        dict: The results of the run.
+    """
+
+    async with AsyncExitStack() as stack:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        if args.url:
+            target = args.url
+            client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60)
+        else:
+            from animalshelterapi.config import config
+            from animalshelterapi.main import app
+
+            target = f"in-process ({config.DB_BACKEND})"
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://benchmark",
+                limits=limits,
+                timeout=60,
+            )
+        await stack.enter_async_context(client)
+
+        ctx = Context(client, args.seed)
+        await prepare(ctx, args.fixture)
+
+        schema = (await client.get("/openapi.json")).json()
+        served = {
+            f"{method.upper()} {path}"
+            for path, operations in schema["paths"].items()
+            for method in operations
+        }
+        found = scenarios()
+        selected = {
+            key: scenario for key, scenario in found.items()
+            if key in served and (not args.routes or args.routes in key)
+        }
+
+        results: dict[str, Any] = {
+            "commit": _commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "target": target,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "uncovered": sorted(served - set(found)),
+            "routes": {},
+        }
+        for key, scenario in selected.items():
+            requests = max(int(args.requests * scenario.share), 1)
+            for _ in range(min(args.warmup, requests)):
+                await ctx.client.request(**await scenario.build(ctx))
+            results["routes"][key] = await drive(
+                ctx,
+                scenario,
+                requests,
+                args.concurrency,
+            )
+            if not args.json:
+                _print_route(key, results["routes"][key])
+
+        await cleanup(ctx)
+
+    return results
+
+
+def _print_route(key: str, result: dict) -> None:
+    """Function printing the result of one route.
+
+    Args:
+        key (str): The method and path of the route.
+        result (dict): The result of the route.
+    """
+
+    print(
+        f"  {key:<52} {result['throughput_rps']:>9.1f} rps"
+        f"  p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}"
+        f"  p99 {result['p99_ms']:>8.2f} ms"
+        + (f"  errors {result['errors']}" if result["errors"] else "")
+    )
+
+
+def compare(baseline: dict, current: dict) -> None:
+    """Function printing the change of every route against the baseline.
+
+    Args:
+        baseline (dict): The earlier results.
+        current (dict): The new results.
+    """
+
+    print(f"{baseline['commit']} -> {current['commit']}")
+    for key, result in current["routes"].items():
+        before = baseline["routes"].get(key)
+        if before is None:
+            continue
+        changes = [
+            f"{metric} {100 * (result[metric] / before[metric] - 1):+7.1f}%"
+            if before[metric] else f"{metric}      n/a"
+            for metric in ("throughput_rps", "p50_ms", "p99_ms")
+        ]
+        print(f"  {key:<52} {'  '.join(changes)}")
+
+
+def main() -> None:
+    """Function parsing arguments, driving the routes and saving the results."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="The running app, in process if omitted.")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="Per route.")
+    parser.add_argument("--warmup", type=int, default=10, help="Per route.")
+    parser.add_argument("--routes", help="Drive only routes containing the text.")
+    parser.add_argument("--fixture", type=int, default=200, help="Animals if empty.")
+    parser.add_argument("--seed", type=int, default=415)
+    parser.add_argument("--output", type=Path, help="The results file.")
+    parser.add_argument("--compare", type=Path, help="Earlier results to compare.")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON.")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / f"load-{results['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        if results["uncovered"]:
+            print(f"\nRoutes without a scenario: {', '.join(results['uncovered'])}")
+        print(f"\nResults saved to {output}")
+
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
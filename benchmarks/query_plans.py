@@ -0,0 +1,284 @@
+"""Benchmark comparing query plans of repository lookups with and without
+secondary indexes.
+
+The benchmark runs inside a single transaction in a scratch schema which is
+rolled back at the end, so it is safe to point it at any database.
+
+Usage:
+    python -m benchmarks.query_plans --rows 200000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy import join, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from animalshelterapi.db import (
+    adopter_table,
+    adoption_table,
+    animal_table,
+    engine,
+    medical_record_table,
+    metadata,
+)
+
+SCHEMA = "bench_query_plans"
+
+SEED_STATEMENTS = (
+    """
+    INSERT INTO animals (
+        name, species, breed, age, gender,
+        arrival_date, adoption_status, description
+    )
+    SELECT
+        'name' || (i % 5000),
+        CASE
+            WHEN abs(hashtext('s' || i)) % 100 < 45 THEN 'dog'
+            WHEN abs(hashtext('s' || i)) % 100 < 85 THEN 'cat'
+            WHEN abs(hashtext('s' || i)) % 100 < 95 THEN 'rabbit'
+            ELSE 'parrot'
+        END,
+        'breed' || (i % 400),
+        i % 20,
+        (ARRAY['male', 'female'])[1 + i % 2],
+        DATE '2020-01-01' + (i % 1800),
+        CASE
+            WHEN abs(hashtext('a' || i)) % 100 < 85 THEN 'adopted'
+            WHEN abs(hashtext('a' || i)) % 100 < 97 THEN 'available'
+            ELSE 'reserved'
+        END,
+        NULL
+    FROM generate_series(1, :rows) AS i
+    """,
+    """
+    INSERT INTO adopters (
+        first_name, last_name, phone_number, email, address
+    )
+    SELECT
+        'first' || (i % 3000),
+        'last' || (i % 20000),
+        lpad(i::text, 9, '0'),
+        'adopter' || i || '@example.com',
+        'street ' || i
+    FROM generate_series(1, :rows / 2) AS i
+    """,
+    """
+    INSERT INTO adoptions (animal_id, adopter_id, adoption_date)
+    SELECT i, 1 + i % (:rows / 2), DATE '2020-01-01' + (i % 1800)
+    FROM generate_series(1, :rows / 2) AS i
+    """,
+    """
+    INSERT INTO medical_records (animal_id, visit_date, diagnosis, treatment)
+    SELECT 1 + i % :rows, DATE '2020-01-01' + (i % 1800), 'diagnosis' || (i % 50), NULL
+    FROM generate_series(1, :rows * 2) AS i
+    """,
+)
+
+
+def repository_queries() -> dict[str, Any]:
+    """Function building the filtered queries issued by the repositories.
+
+    Returns:
+        dict[str, Any]: The queries keyed by a readable label.
+    """
+
+    adoption_join = join(
+        adoption_table,
+        adopter_table,
+        adoption_table.c.adopter_id == adopter_table.c.id,
+    ).join(
+        animal_table,
+        adoption_table.c.animal_id == animal_table.c.id,
+    )
+    medical_record_join = join(
+        medical_record_table,
+        animal_table,
+        medical_record_table.c.animal_id == animal_table.c.id,
+    )
+    animal_columns = {
+        "name": "name42",
+        "species": "parrot",
+        "breed": "breed7",
+        "gender": "female",
+        "adoption_status": "reserved",
+    }
+
+    queries: dict[str, Any] = {
+        f"animals by {column}": animal_table.select()
+        .where(animal_table.c[column] == value)
+        .order_by(animal_table.c.id.asc())
+        for column, value in animal_columns.items()
+    }
+    queries["animals by species and adoption_status"] = (
+        animal_table.select()
+        .where(animal_table.c.species == "parrot")
+        .where(animal_table.c.adoption_status == "reserved")
+        .order_by(animal_table.c.id.asc())
+    )
+    queries["animals arrived last month"] = select(sqlalchemy.func.count()).where(
+        animal_table.c.arrival_date >= date(2024, 11, 1),
+    )
+    queries["adopters by last_name"] = (
+        adopter_table.select()
+        .where(adopter_table.c.last_name == "last123")
+        .order_by(adopter_table.c.id.asc())
+    )
+    queries["adopters by phone_number"] = (
+        adopter_table.select()
+        .where(adopter_table.c.phone_number == "000001234")
+        .order_by(adopter_table.c.id.asc())
+    )
+    queries["adoptions by animal_id"] = (
+        adoption_table.select()
+        .where(adoption_table.c.animal_id == 1234)
+        .order_by(adoption_table.c.id.asc())
+    )
+    queries["adoptions by adopter_id"] = (
+        adoption_table.select()
+        .where(adoption_table.c.adopter_id == 1234)
+        .order_by(adoption_table.c.id.asc())
+    )
+    queries["adoptions joined by id"] = (
+        select(adoption_table, animal_table, adopter_table)
+        .select_from(adoption_join)
+        .where(adoption_table.c.id == 1234)
+    )
+    queries["medical records by animal_id"] = (
+        select(medical_record_table, animal_table)
+        .select_from(medical_record_join)
+        .where(medical_record_table.c.animal_id == 1234)
+        .order_by(medical_record_table.c.id.asc())
+    )
+
+    return queries
+
+
+async def explain(conn: AsyncConnection, query: Any) -> dict:
+    """Function running `EXPLAIN ANALYZE` for the query.
+
+    Args:
+        conn (AsyncConnection): The connection with the scratch search path.
+        query (Any): The SQLAlchemy query.
+
+    Returns:
+        dict: The top plan node type, total cost and execution time.
+    """
+
+    sql = str(query.compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    ))
+    result = await conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"))
+    plan = result.scalar_one()[0]
+
+    return {
+        "nodes": _node_types(plan["Plan"]),
+        "cost": plan["Plan"]["Total Cost"],
+        "time_ms": plan["Execution Time"],
+    }
+
+
+def _node_types(node: dict) -> list[str]:
+    """Function flattening the scan nodes of a plan tree.
+
+    Args:
+        node (dict): The plan node.
+
+    Returns:
+        list[str]: The node types with their relation or index names.
+    """
+
+    label = node["Node Type"]
+    if "Index Name" in node:
+        label += f" using {node['Index Name']}"
+    elif "Relation Name" in node:
+        label += f" on {node['Relation Name']}"
+
+    return [label] + [
+        child_label
+        for child in node.get("Plans", [])
+        for child_label in _node_types(child)
+    ]
+
+
+async def run(rows: int) -> dict:
+    """Function comparing the plans before and after creating the indexes.
+
+    Args:
+        rows (int): The number of animals to seed.
+
+    Returns:
+        dict: The plans keyed by query label.
+    """
+
+    indexes = [
+        index
+        for table in metadata.sorted_tables
+        for index in table.indexes
+    ]
+    queries = repository_queries()
+    report: dict = {"rows": rows, "queries": {}}
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.execute(text(f"SET LOCAL search_path TO {SCHEMA}"))
+            await conn.run_sync(metadata.create_all)
+            for index in indexes:
+                await conn.run_sync(index.drop)
+
+            started = time.perf_counter()
+            for statement in SEED_STATEMENTS:
+                await conn.execute(text(statement), {"rows": rows})
+            await conn.execute(text("ANALYZE"))
+            report["seed_s"] = round(time.perf_counter() - started, 3)
+
+            for label, query in queries.items():
+                report["queries"][label] = {"before": await explain(conn, query)}
+
+            for index in indexes:
+                await conn.run_sync(index.create)
+            await conn.execute(text("ANALYZE"))
+
+            for label, query in queries.items():
+                report["queries"][label]["after"] = await explain(conn, query)
+        finally:
+            await transaction.rollback()
+
+    await engine.dispose()
+
+    return report
+
+
+def main() -> None:
+    """Function parsing arguments and printing the plan comparison."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.rows))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Seeded {args.rows} animals in {report['seed_s']}s\n")
+    for label, plans in report["queries"].items():
+        before, after = plans["before"], plans["after"]
+        print(label)
+        print(f"  before: {before['time_ms']:>9.3f} ms  {' > '.join(before['nodes'])}")
+        print(f"  after:  {after['time_ms']:>9.3f} ms  {' > '.join(after['nodes'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+"""Seeding CLI filling a local PostgreSQL database with realistic rows.
+
+The scale sets the number of animals. About half of them are adopted, so
+there are half as many adopters and adoptions, and every animal has up to
+four medical visits, about one and a half on average. The rows are
+generated from a fixed random seed and sent with `COPY`. The secondary
+indexes are dropped for the load and rebuilt afterwards.
+
+Usage:
+    python -m benchmarks.seed --scale 10k
+    python -m benchmarks.seed --scale 1m --truncate
+    python -m benchmarks.seed --scale 10m --truncate --json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from array import array
+from datetime import date, timedelta
+from typing import Any, Iterator
+
+import sqlalchemy
+from sqlalchemy import func, select, text
+
+from animalshelterapi.db import (
+    adopter_table,
+    adoption_table,
+    animal_table,
+    engine,
+    init_db,
+    medical_record_table,
+    report_table,
+)
+
+SCALES = {
+    "10k": 10_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+# The species with their share of the animals and their breeds.
+SPECIES = {
+    "dog": (45, ("mixed", "labrador", "german shepherd", "beagle", "terrier", "husky")),
+    "cat": (40, ("mixed", "european shorthair", "siamese", "maine coon", "persian")),
+    "rabbit": (10, ("mixed", "lop", "dutch", "lionhead")),
+    "parrot": (5, ("budgerigar", "cockatiel", "lovebird")),
+}
+ANIMAL_NAMES = (
+    "Max", "Bella", "Luna", "Charlie", "Lucy", "Cooper", "Daisy", "Milo",
+    "Rocky", "Molly", "Buddy", "Lola", "Oscar", "Coco", "Toby", "Nala",
+    "Leo", "Ruby", "Simba", "Zoe", "Jack", "Chloe", "Bailey", "Maggie",
+    "Teddy", "Rosie", "Felix", "Kiki", "Pepper", "Ginger",
+)
+FIRST_NAMES = (
+    "Anna", "Piotr", "Maria", "Jan", "Katarzyna", "Tomasz", "Agnieszka",
+    "Pawel", "Ewa", "Michal", "Zofia", "Marek", "Julia", "Adam", "Ola",
+)
+LAST_NAMES = (
+    "Nowak", "Kowalski", "Wisniewski", "Wojcik", "Kowalczyk", "Kaminski",
+    "Lewandowski", "Zielinski", "Szymanski", "Wozniak", "Dabrowski",
+    "Kozlowski", "Jankowski", "Mazur", "Kwiatkowski", "Krawczyk",
+)
+STREETS = ("Lipowa", "Polna", "Lesna", "Sloneczna", "Krotka", "Szkolna")
+CITIES = ("Warszawa", "Krakow", "Lodz", "Wroclaw", "Poznan", "Gdansk")
+DIAGNOSES = {
+    "vaccination": "vaccine administered",
+    "checkup": None,
+    "parasites": "deworming",
+    "dental tartar": "scaling",
+    "skin allergy": "antihistamines",
+    "ear infection": "ear drops",
+    "fracture": "splint and rest",
+    "sterilization": "surgery",
+}
+
+# The arrivals are spread over the last five years.
+HISTORY_DAYS = 5 * 365
+COPY_COLUMNS = {
+    animal_table: [
+        "id", "name", "species", "breed", "age", "gender",
+        "arrival_date", "adoption_status", "description",
+    ],
+    adopter_table: [
+        "id", "first_name", "last_name", "phone_number", "email", "address",
+    ],
+    adoption_table: ["id", "animal_id", "adopter_id", "adoption_date"],
+    medical_record_table: [
+        "id", "animal_id", "visit_date", "diagnosis", "treatment",
+    ],
+}
+
+
+def fake_animal(rng: random.Random, today: date, adopted: bool = False) -> dict:
+    """Function generating the attributes of an animal.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        today (date): The last possible arrival date.
+        adopted (bool): Whether the animal is adopted.
+
+    Returns:
+        dict: The attributes of the animal, without the id.
+    """
+
+    species = rng.choices(
+        list(SPECIES),
+        weights=[weight for weight, _ in SPECIES.values()],
+    )[0]
+    if adopted:
+        status = "adopted"
+    else:
+        status = "reserved" if rng.random() < 0.1 else "available"
+
+    return {
+        "name": rng.choice(ANIMAL_NAMES),
+        "species": species,
+        "breed": rng.choice(SPECIES[species][1]),
+        "age": min(int(rng.expovariate(0.25)), 20),
+        "gender": rng.choice(("male", "female")),
+        "arrival_date": today - timedelta(days=rng.randrange(HISTORY_DAYS)),
+        "adoption_status": status,
+        "description": "friendly" if rng.random() < 0.3 else None,
+    }
+
+
+def fake_adopter(rng: random.Random, number: int) -> dict:
+    """Function generating the attributes of an adopter.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        number (int): The number making the phone and email unique.
+
+    Returns:
+        dict: The attributes of the adopter, without the id.
+    """
+
+    first_name = rng.choice(FIRST_NAMES)
+    last_name = rng.choice(LAST_NAMES)
+
+    return {
+        "first_name": first_name,
+        "last_name": last_name,
+        "phone_number": f"+48{500_000_000 + number}",
+        "email": f"{first_name}.{last_name}{number}@example.com".lower(),
+        "address": (
+            f"{rng.choice(STREETS)} {rng.randint(1, 200)}, {rng.choice(CITIES)}"
+        ),
+    }
+
+
+def fake_medical_record(
+    rng: random.Random,
+    animal_id: int,
+    since: date,
+    today: date,
+) -> dict:
+    """Function generating the attributes of a medical record.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        animal_id (int): The id of the examined animal.
+        since (date): The arrival date of the animal.
+        today (date): The last possible visit date.
+
+    Returns:
+        dict: The attributes of the medical record, without the id.
+    """
+
+    diagnosis = rng.choice(list(DIAGNOSES))
+
+    return {
+        "animal_id": animal_id,
+        "visit_date": since + timedelta(days=rng.randint(0, (today - since).days)),
+        "diagnosis": diagnosis,
+        "treatment": DIAGNOSES[diagnosis],
+    }
+
+
+class Dataset:
+    """A class generating consistent rows of all tables.
+
+    The animals are generated first, keeping only their arrival dates and
+    adoption flags, so the adoptions and the medical visits never precede
+    the arrival of their animal, even at the largest scale.
+    """
+
+    _animals: int
+    _rng: random.Random
+    _today: date
+    _arrivals: array
+    _adopted: bytearray
+
+    def __init__(self, animals: int, seed: int) -> None:
+        """The initializer of the `dataset`.
+
+        Args:
+            animals (int): The number of animals.
+            seed (int): The random seed.
+        """
+
+        self._animals = animals
+        self._rng = random.Random(seed)
+        self._today = date.today()
+        self._arrivals = array("i")
+        self._adopted = bytearray()
+
+    @property
+    def adopters(self) -> int:
+        """The number of adopters."""
+
+        return max(self._animals // 2, 1)
+
+    def animal_rows(self) -> Iterator[tuple]:
+        """The method generating the rows of the animals.
+
+        Yields:
+            tuple: The values of the `COPY_COLUMNS` of the animals.
+        """
+
+        for animal_id in range(1, self._animals + 1):
+            adopted = self._rng.random() < 0.5
+            animal = fake_animal(self._rng, self._today, adopted)
+            self._arrivals.append(animal["arrival_date"].toordinal())
+            self._adopted.append(adopted)
+
+            yield _values(animal_table, {"id": animal_id, **animal})
+
+    def adopter_rows(self) -> Iterator[tuple]:
+        """The method generating the rows of the adopters.
+
+        Yields:
+            tuple: The values of the `COPY_COLUMNS` of the adopters.
+        """
+
+        for adopter_id in range(1, self.adopters + 1):
+            adopter = fake_adopter(self._rng, adopter_id)
+
+            yield _values(adopter_table, {"id": adopter_id, **adopter})
+
+    def adoption_rows(self) -> Iterator[tuple]:
+        """The method generating the rows of the adoptions.
+
+        Yields:
+            tuple: The values of the `COPY_COLUMNS` of the adoptions.
+        """
+
+        today = self._today.toordinal()
+        adoption_id = 0
+        for index, adopted in enumerate(self._adopted):
+            if not adopted:
+                continue
+
+            adoption_id += 1
+            arrival = self._arrivals[index]
+            adoption_date = min(arrival + int(self._rng.expovariate(1 / 30)), today)
+
+            yield (
+                adoption_id,
+                index + 1,
+                self._rng.randint(1, self.adopters),
+                date.fromordinal(adoption_date),
+            )
+
+    def medical_record_rows(self) -> Iterator[tuple]:
+        """The method generating the rows of the medical records.
+
+        Yields:
+            tuple: The values of the `COPY_COLUMNS` of the medical records.
+        """
+
+        record_id = 0
+        for index, arrival in enumerate(self._arrivals):
+            since = date.fromordinal(arrival)
+            visits = self._rng.choices((0, 1, 2, 3, 4), weights=(20, 30, 30, 15, 5))[0]
+            for _ in range(visits):
+                record_id += 1
+                record = fake_medical_record(self._rng, index + 1, since, self._today)
+
+                yield _values(medical_record_table, {"id": record_id, **record})
+
+
+def _values(table: sqlalchemy.Table, row: dict) -> tuple:
+    """Function ordering the values of the row as the copied columns.
+
+    Args:
+        table (sqlalchemy.Table): The table of the row.
+        row (dict): The values keyed by column.
+
+    Returns:
+        tuple: The values of the `COPY_COLUMNS` of the table.
+    """
+
+    return tuple(row[column] for column in COPY_COLUMNS[table])
+
+
+def _indexes() -> list[sqlalchemy.Index]:
+    """Function listing the secondary indexes of the seeded tables.
+
+    Returns:
+        list[sqlalchemy.Index]: The declared indexes.
+    """
+
+    return [index for table in COPY_COLUMNS for index in table.indexes]
+
+
+async def seed(animals: int, seed_value: int, truncate: bool) -> dict:
+    """Function seeding the tables.
+
+    Args:
+        animals (int): The number of animals.
+        seed_value (int): The random seed.
+        truncate (bool): Whether to empty non-empty tables first.
+
+    Raises:
+        SystemExit: If the database is not PostgreSQL or the tables hold
+            rows and `truncate` is not set.
+
+    Returns:
+        dict: The number of rows and the load time per table.
+    """
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("Seeding uses COPY, set DB_BACKEND=postgres.")
+
+    await init_db()
+    tables = list(COPY_COLUMNS)
+    async with engine.begin() as conn:
+        existing = sum([
+            await conn.scalar(select(func.count()).select_from(table))
+            for table in tables
+        ])
+        if existing and not truncate:
+            raise SystemExit(
+                f"The tables hold {existing} rows, pass --truncate to replace them.",
+            )
+        names = ", ".join(table.name for table in [*tables, report_table])
+        await conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+        for index in _indexes():
+            await conn.run_sync(index.drop, checkfirst=True)
+
+    dataset = Dataset(animals, seed_value)
+    generators = {
+        animal_table: dataset.animal_rows,
+        adopter_table: dataset.adopter_rows,
+        adoption_table: dataset.adoption_rows,
+        medical_record_table: dataset.medical_record_rows,
+    }
+    report: dict[str, Any] = {"animals": animals, "seed": seed_value, "tables": {}}
+
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        for table, rows in generators.items():
+            started = time.perf_counter()
+            status = await raw.copy_records_to_table(
+                table.name,
+                records=rows(),
+                columns=COPY_COLUMNS[table],
+            )
+            elapsed = time.perf_counter() - started
+            copied = int(status.split()[-1])
+            report["tables"][table.name] = {
+                "rows": copied,
+                "seconds": round(elapsed, 3),
+                "rows_per_s": round(copied / elapsed) if elapsed else None,
+            }
+
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        for table in tables:
+            await conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"coalesce(max(id), 0) + 1, false) FROM {table.name}"
+            ))
+        for index in _indexes():
+            await conn.run_sync(index.create, checkfirst=True)
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE"))
+    report["index_s"] = round(time.perf_counter() - started, 3)
+
+    await engine.dispose()
+
+    return report
+
+
+def main() -> None:
+    """Function parsing arguments and printing the seeded row counts."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=SCALES, default="10k")
+    parser.add_argument(
+        "--animals",
+        type=int,
+        help="The number of animals, overrides the scale.",
+    )
+    parser.add_argument("--seed", type=int, default=415)
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Replace the rows already stored.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print raw JSON.")
+    args = parser.parse_args()
+
+    animals = args.animals or SCALES[args.scale]
+    report = asyncio.run(seed(animals, args.seed, args.truncate))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    for table, load in report["tables"].items():
+        print(
+            f"  {table:<16} {load['rows']:>10} rows"
+            f"  {load['seconds']:>8.3f} s  {load['rows_per_s'] or 0:>9} rows/s"
+        )
+    print(f"  indexes and analyze {report['index_s']:>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark comparing the per-row cost of the validated and the fast
+response paths.
+
+The validated path is what FastAPI does with `response_model`: the page of
+models is validated again and then dumped to JSON. Without a response model,
+as in the report endpoints, the content goes through `jsonable_encoder`. The
+fast path encodes the models, or the fetched rows themselves, directly with
+`dumps`. No database is needed, the rows are generated in memory.
+
+Usage:
+    python -m benchmarks.serialization --rows 10000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from animalshelterapi.api.utils.pagination import Page, build_page
+from animalshelterapi.api.utils.responses import dumps
+from animalshelterapi.core.domain.animal import Animal
+
+
+def generate_rows(rows: int) -> list[dict]:
+    """Function generating rows shaped like the animal table.
+
+    Args:
+        rows (int): The number of rows.
+
+    Returns:
+        list[dict]: The generated rows.
+    """
+
+    return [
+        {
+            "id": i,
+            "name": f"name{i % 5000}",
+            "species": ("dog", "cat", "rabbit")[i % 3],
+            "breed": f"breed{i % 400}",
+            "age": i % 20,
+            "gender": ("male", "female")[i % 2],
+            "arrival_date": date(2020, 1, 1) + timedelta(days=i % 1800),
+            "adoption_status": ("available", "adopted")[i % 2],
+            "description": None,
+        }
+        for i in range(1, rows + 1)
+    ]
+
+
+async def measure(call: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """Function timing the call and keeping the best run.
+
+    Args:
+        call (Callable[[], Awaitable[Any]]): The measured call.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The shortest run in seconds.
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+async def run(rows: int, repeat: int) -> dict:
+    """Function timing every step of both response paths.
+
+    Args:
+        rows (int): The number of rows per page.
+        repeat (int): The number of runs of each step.
+
+    Returns:
+        dict: The per-row cost of each step in microseconds.
+    """
+
+    records = generate_rows(rows)
+    models = [Animal(**record) for record in records]
+    field = APIRoute(
+        "/", lambda: None, response_model=Page[Animal],
+    ).response_field
+
+    async def build_models() -> Any:
+        return [Animal(**record) for record in records]
+
+    async def validated() -> Any:
+        return await serialize_response(
+            field=field,
+            response_content=build_page(models, rows),
+            dump_json=True,
+        )
+
+    async def untyped() -> Any:
+        content = await serialize_response(
+            response_content=build_page(models, rows),
+        )
+
+        return JSONResponse(content).body
+
+    async def fast_models() -> Any:
+        return dumps(build_page(models, rows))
+
+    async def fast_rows() -> Any:
+        return dumps({"items": records, "next": None})
+
+    steps = {
+        "build models from rows": build_models,
+        "validated response from models": validated,
+        "untyped response from models": untyped,
+        "fast response from models": fast_models,
+        "fast response from rows": fast_rows,
+    }
+    assert json.loads(await validated()) == json.loads(await fast_models())
+
+    return {
+        "rows": rows,
+        "us_per_row": {
+            label: round(await measure(call, repeat) / rows * 1e6, 3)
+            for label, call in steps.items()
+        },
+    }
+
+
+def main() -> None:
+    """Function parsing arguments and printing the per-row costs."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.rows, args.repeat))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['rows']} rows per page\n")
+    for label, cost in report["us_per_row"].items():
+        print(f"  {label:<32} {cost:>8.3f} us/row")
+
+
+if __name__ == "__main__":
+    main()